@@ -5,15 +5,89 @@ Analyzes real-world PDFs to understand their characteristics and challenges
 """
 
 import fitz  # PyMuPDF
+import numpy as np
+import io
 import os
+import re
+import sys
 import json
+import shelve
+import argparse
+from contextlib import nullcontext
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from collections import defaultdict
+from collections import Counter
 from datetime import datetime
 
-
-def analyze_pdf(pdf_path):
-    """Analyze a single PDF file for various characteristics."""
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to NumPy
+    njit = None
+
+from pdf_indicators import COMPLEX_INDICATORS, PROBLEMATIC_INDICATORS
+
+# A blank line: only non-newline whitespace between two line boundaries
+_BLANK_LINE_RE = re.compile(r'(?:^|\n)[^\S\n]*(?=\n|$)')
+
+# One interned "<font>_<size>" identifier per (font, size) pair, shared by
+# every span in the process instead of a fresh string per span
+_FONT_ID_CACHE = {}
+
+
+def count_garbled_chars(text):
+    """Count characters outside the Basic Multilingual Plane."""
+    if len(text) < 1024:
+        # Encoding to UTF-32 costs more than it saves on short strings
+        return sum(1 for c in text if ord(c) > 65535)
+    code_points = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+    return int((code_points > 65535).sum())
+
+
+def find_pdfs(base_dir):
+    """
+    Recursively find PDF files under base_dir.
+
+    Yields (path, stat result) pairs; the stat is the one already made while
+    scanning the directory, so sizes and mtimes are not looked up again later.
+    """
+    pending = [str(base_dir)]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    pending.append(entry.path)
+                elif entry.name.endswith('.pdf') and entry.is_file():
+                    yield os.path.abspath(entry.path), entry.stat()
+
+
+if njit is not None:
+    @njit(cache=True)
+    def count_line_orientations(coords):
+        """Count horizontal and vertical segments in an (N, 4) x1, y1, x2, y2 array."""
+        horizontal = 0
+        vertical = 0
+        for i in range(coords.shape[0]):
+            if abs(coords[i, 1] - coords[i, 3]) < 1:
+                horizontal += 1
+            elif abs(coords[i, 0] - coords[i, 2]) < 1:
+                vertical += 1
+        return horizontal, vertical
+else:
+    def count_line_orientations(coords):
+        """Count horizontal and vertical segments in an (N, 4) x1, y1, x2, y2 array."""
+        is_horizontal = np.abs(coords[:, 1] - coords[:, 3]) < 1
+        is_vertical = ~is_horizontal & (np.abs(coords[:, 0] - coords[:, 2]) < 1)
+        return int(is_horizontal.sum()), int(is_vertical.sum())
+
+
+def analyze_pdf(pdf_path, file_size=None):
+    """
+    Analyze a single PDF file for various characteristics.
+
+    Args:
+        pdf_path: Path to the PDF file
+        file_size: Size of the file in bytes, if already known
+    """
     results = {
         'filename': os.path.basename(pdf_path),
         'path': pdf_path,
@@ -28,11 +102,13 @@ def analyze_pdf(pdf_path):
 
     try:
         doc = fitz.open(pdf_path)
+        if file_size is None:
+            file_size = os.path.getsize(pdf_path)
 
         # Basic metadata
         results['metadata'] = {
             'pages': len(doc),
-            'file_size_kb': os.path.getsize(pdf_path) / 1024,
+            'file_size_kb': file_size / 1024,
             'creation_date': doc.metadata.get('creationDate', 'Unknown'),
             'mod_date': doc.metadata.get('modDate', 'Unknown'),
             'producer': doc.metadata.get('producer', 'Unknown'),
@@ -69,47 +145,56 @@ def analyze_pdf(pdf_path):
                 'rotation': page.rotation
             }
 
-            # Text extraction
-            text = page.get_text()
+            # Parse the page once and walk its blocks in a single pass:
+            # rebuild the plain text (identical to page.get_text() output)
+            # while collecting text-block x-coordinates and fonts. A page
+            # without font resources (e.g. a scanned image) cannot carry
+            # text, so its content stream is not parsed at all.
+            blocks = page.get_text("dict")["blocks"] if page.get_fonts() else []
+            text_parts = []
+            x_coords = set()
+            fonts_on_page = set()
+            # (the "dict" schema is fixed, so keys are indexed directly)
+            for block in blocks:
+                if block['type'] != 0:  # type 0 = text
+                    continue
+                x_coords.add(block['bbox'][0])
+                for line in block['lines']:
+                    for span in line['spans']:
+                        text_parts.append(span['text'])
+                        font_key = (span['font'], span['size'])
+                        font_info = _FONT_ID_CACHE.get(font_key)
+                        if font_info is None:
+                            font_info = sys.intern(f"{font_key[0]}_{font_key[1]}")
+                            _FONT_ID_CACHE[font_key] = font_info
+                        fonts_on_page.add(font_info)
+                    text_parts.append("\n")
+            text = "".join(text_parts)
+            total_fonts |= fonts_on_page
+
             page_info['text_length'] = len(text)
             total_text_length += len(text)
 
             # Check for text extraction quality
             if text.strip():
                 # Check for garbled characters
-                garbled_count = sum(1 for c in text if ord(c) > 65535)
+                garbled_count = count_garbled_chars(text)
                 if garbled_count > 0:
                     encoding_issues.append(f"Page {page_num + 1}: {garbled_count} garbled chars")
 
                 # Check for excessive whitespace (layout issues)
-                lines = text.split('\n')
-                empty_lines = sum(1 for line in lines if not line.strip())
-                if len(lines) > 0 and empty_lines / len(lines) > 0.5:
+                line_count = text.count('\n') + 1
+                empty_lines = len(_BLANK_LINE_RE.findall(text))
+                if empty_lines / line_count > 0.5:
                     text_extraction_issues.append(f"Page {page_num + 1}: Excessive whitespace")
 
             # Text blocks analysis (for layout)
-            blocks = page.get_text("dict")["blocks"]
             total_blocks += len(blocks)
             page_info['blocks'] = len(blocks)
 
-            # Analyze text blocks for multi-column detection
-            text_blocks = [b for b in blocks if b.get('type') == 0]  # type 0 = text
-            if len(text_blocks) > 1:
-                # Check x-coordinates for multiple columns
-                x_coords = [b['bbox'][0] for b in text_blocks]
-                x_coords_sorted = sorted(set(x_coords))
-                if len(x_coords_sorted) > 2:
-                    has_multi_column = True
-
-            # Font analysis
-            fonts_on_page = set()
-            for block in blocks:
-                if block.get('type') == 0:  # text block
-                    for line in block.get('lines', []):
-                        for span in line.get('spans', []):
-                            font_info = f"{span.get('font', 'Unknown')}_{span.get('size', 0)}"
-                            fonts_on_page.add(font_info)
-                            total_fonts.add(font_info)
+            # Multiple distinct text-block x-coordinates suggest columns
+            if len(x_coords) > 2:
+                has_multi_column = True
 
             page_info['fonts'] = len(fonts_on_page)
 
@@ -125,28 +210,26 @@ def analyze_pdf(pdf_path):
                 has_drawings = True
                 page_info['drawings'] = len(drawings)
 
-                # Analyze drawing types
-                path_types = defaultdict(int)
+                # Analyze drawing types and look for table patterns
+                # (horizontal/vertical lines) in a single pass
+                path_types = Counter()
+                line_coords = []
                 for drawing in drawings:
-                    for item in drawing.get('items', []):
-                        path_types[item[0]] = path_types.get(item[0], 0) + 1
+                    items = drawing.get('items', ())
+                    path_types.update(item[0] for item in items)
+                    # line items are ('l', start_point, end_point)
+                    line_coords.extend(
+                        (item[1].x, item[1].y, item[2].x, item[2].y)
+                        for item in items if item[0] == 'l'
+                    )
+
+                horizontal_lines, vertical_lines = count_line_orientations(
+                    np.array(line_coords, dtype=np.float64).reshape(-1, 4)
+                )
 
                 page_info['drawing_types'] = dict(path_types)
 
-            # Table detection (heuristic based on drawings)
-            if drawings:
-                # Look for rectangular patterns (lines)
-                horizontal_lines = 0
-                vertical_lines = 0
-                for drawing in drawings:
-                    for item in drawing.get('items', []):
-                        if item[0] == 'l':  # line
-                            x1, y1, x2, y2 = item[1], item[2], item[3], item[4]
-                            if abs(y1 - y2) < 1:  # horizontal
-                                horizontal_lines += 1
-                            elif abs(x1 - x2) < 1:  # vertical
-                                vertical_lines += 1
-
+                # Table detection (heuristic based on drawings)
                 if horizontal_lines > 2 and vertical_lines > 2:
                     has_tables = True
                     page_info['table_indicators'] = {
@@ -214,26 +297,10 @@ def analyze_pdf(pdf_path):
 
 def categorize_pdf(analysis):
     """Categorize PDF based on complexity."""
-    issues = analysis.get('issues', [])
-
-    # Problematic: Multiple severe issues or specific problematic patterns
-    problematic_indicators = [
-        'MS_OFFICE_GENERATED',
-        'NO_TEXT_EXTRACTED',
-        'PROCESSING_ERROR',
-        'ENCODING_PROBLEMS'
-    ]
-
-    # Complex: Multiple layout challenges
-    complex_indicators = [
-        'MULTI_COLUMN_LAYOUT',
-        'TABLE_STRUCTURES',
-        'COMPLEX_GRAPHICS',
-        'EXCESSIVE_FONTS'
-    ]
-
-    problematic_count = sum(1 for issue in issues if issue in problematic_indicators)
-    complex_count = sum(1 for issue in issues if issue in complex_indicators)
+    issues = set(analysis.get('issues', ()))
+
+    problematic_count = len(issues & PROBLEMATIC_INDICATORS)
+    complex_count = len(issues & COMPLEX_INDICATORS)
 
     if problematic_count > 0:
         return 'problematic'
@@ -245,114 +312,116 @@ def categorize_pdf(analysis):
         return 'simple'
 
 
-def generate_summary_report(all_results):
-    """Generate a comprehensive summary report."""
-    report = []
-    report.append("=" * 80)
-    report.append("REAL-WORLD PDF ANALYSIS REPORT")
-    report.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    report.append("=" * 80)
-    report.append("")
+def generate_summary_report(all_results, out):
+    """
+    Write a comprehensive summary report.
+
+    Args:
+        all_results: Analysis results as returned by analyze_pdf
+        out: Writable text stream (open file, io.StringIO, ...)
+    """
+    write = out.write
+    write("=" * 80 + "\n")
+    write("REAL-WORLD PDF ANALYSIS REPORT\n")
+    write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+    write("=" * 80 + "\n")
+    write("\n")
 
     # Overall statistics
-    report.append("OVERALL STATISTICS")
-    report.append("-" * 80)
-    report.append(f"Total PDFs analyzed: {len(all_results)}")
+    write("OVERALL STATISTICS\n")
+    write("-" * 80 + "\n")
+    write(f"Total PDFs analyzed: {len(all_results)}\n")
 
-    categories = defaultdict(list)
-    for result in all_results:
-        cat = categorize_pdf(result)
-        categories[cat].append(result['filename'])
+    # Categorize each PDF once; the category is reused per file below
+    categorized = [(result, categorize_pdf(result)) for result in all_results]
+    categories = Counter(category for _, category in categorized)
 
     for cat in ['simple', 'complex', 'problematic']:
-        count = len(categories[cat])
-        report.append(f"{cat.capitalize()}: {count} PDFs")
+        write(f"{cat.capitalize()}: {categories[cat]} PDFs\n")
 
-    report.append("")
+    write("\n")
 
     # Issue frequency
-    all_issues = defaultdict(int)
+    all_issues = Counter()
     for result in all_results:
-        for issue in result.get('issues', []):
-            all_issues[issue] += 1
+        all_issues.update(result.get('issues', ()))
 
-    report.append("COMMON ISSUES (Frequency)")
-    report.append("-" * 80)
-    for issue, count in sorted(all_issues.items(), key=lambda x: x[1], reverse=True):
-        report.append(f"{issue}: {count} PDFs")
+    write("COMMON ISSUES (Frequency)\n")
+    write("-" * 80 + "\n")
+    for issue, count in all_issues.most_common():
+        write(f"{issue}: {count} PDFs\n")
 
-    report.append("")
+    write("\n")
 
     # Individual PDF details
-    report.append("INDIVIDUAL PDF ANALYSIS")
-    report.append("=" * 80)
+    write("INDIVIDUAL PDF ANALYSIS\n")
+    write("=" * 80 + "\n")
 
-    for result in sorted(all_results, key=lambda x: x['filename']):
-        report.append("")
-        report.append(f"FILE: {result['filename']}")
-        report.append("-" * 80)
+    for result, category in sorted(categorized, key=lambda x: x[0]['filename']):
+        write("\n")
+        write(f"FILE: {result['filename']}\n")
+        write("-" * 80 + "\n")
 
         # Categorization
-        category = categorize_pdf(result)
-        report.append(f"Current Category: {os.path.dirname(result['path']).split('/')[-1]}")
-        report.append(f"Suggested Category: {category}")
-        report.append("")
+        write(f"Current Category: {os.path.dirname(result['path']).split('/')[-1]}\n")
+        write(f"Suggested Category: {category}\n")
+        write("\n")
 
         # Metadata
         meta = result.get('metadata', {})
-        report.append(f"Pages: {meta.get('pages', 'Unknown')}")
-        report.append(f"File Size: {meta.get('file_size_kb', 0):.2f} KB")
-        report.append(f"Producer: {meta.get('producer', 'Unknown')}")
-        report.append(f"Creator: {meta.get('creator', 'Unknown')}")
-        report.append("")
+        write(f"Pages: {meta.get('pages', 'Unknown')}\n")
+        write(f"File Size: {meta.get('file_size_kb', 0):.2f} KB\n")
+        write(f"Producer: {meta.get('producer', 'Unknown')}\n")
+        write(f"Creator: {meta.get('creator', 'Unknown')}\n")
+        write("\n")
 
         # Check for processing error
         if 'error' in result:
-            report.append(f"ERROR: {result['error']}")
-            report.append("This PDF could not be fully analyzed due to processing errors.")
-            report.append("")
+            write(f"ERROR: {result['error']}\n")
+            write("This PDF could not be fully analyzed due to processing errors.\n")
+            write("\n")
 
         # Structure
         struct = result.get('structure', {})
         if struct:
-            report.append("Layout Characteristics:")
-            report.append(f"  - Blocks: {struct.get('total_blocks', 0)} total, {struct.get('avg_blocks_per_page', 0):.1f} per page")
-            report.append(f"  - Multi-column: {'YES' if struct.get('has_multi_column') else 'NO'}")
-            report.append(f"  - Tables: {'YES' if struct.get('has_tables') else 'NO'}")
-            report.append(f"  - Images: {'YES' if struct.get('has_images') else 'NO'}")
-            report.append(f"  - Drawings/Shapes: {'YES' if struct.get('has_drawings') else 'NO'}")
-            report.append("")
+            write("Layout Characteristics:\n")
+            write(f"  - Blocks: {struct.get('total_blocks', 0)} total, {struct.get('avg_blocks_per_page', 0):.1f} per page\n")
+            write(f"  - Multi-column: {'YES' if struct.get('has_multi_column') else 'NO'}\n")
+            write(f"  - Tables: {'YES' if struct.get('has_tables') else 'NO'}\n")
+            write(f"  - Images: {'YES' if struct.get('has_images') else 'NO'}\n")
+            write(f"  - Drawings/Shapes: {'YES' if struct.get('has_drawings') else 'NO'}\n")
+            write("\n")
 
         # Text quality
         text_q = result.get('text_quality', {})
         if text_q:
-            report.append("Text Extraction:")
-            report.append(f"  - Total characters: {text_q.get('total_text_length', 0)}")
-            report.append(f"  - Avg per page: {text_q.get('avg_text_per_page', 0):.0f}")
+            write("Text Extraction:\n")
+            write(f"  - Total characters: {text_q.get('total_text_length', 0)}\n")
+            write(f"  - Avg per page: {text_q.get('avg_text_per_page', 0):.0f}\n")
             if text_q.get('encoding_issues'):
-                report.append(f"  - Encoding issues: {len(text_q['encoding_issues'])}")
+                write(f"  - Encoding issues: {len(text_q['encoding_issues'])}\n")
             if text_q.get('extraction_issues'):
-                report.append(f"  - Extraction issues: {len(text_q['extraction_issues'])}")
-            report.append("")
+                write(f"  - Extraction issues: {len(text_q['extraction_issues'])}\n")
+            write("\n")
 
         # Fonts
         fonts = result.get('fonts', {})
         if fonts:
-            report.append(f"Fonts: {fonts.get('unique_fonts', 0)} unique font/size combinations")
+            write(f"Fonts: {fonts.get('unique_fonts', 0)} unique font/size combinations\n")
             if fonts.get('unique_fonts', 0) <= 5 and fonts.get('font_list'):
                 for font in fonts['font_list']:
-                    report.append(f"  - {font}")
-            report.append("")
+                    write(f"  - {font}\n")
+            write("\n")
 
         # Issues
         if result.get('issues'):
-            report.append("Issues Detected:")
+            write("Issues Detected:\n")
             for issue in result['issues']:
-                report.append(f"  - {issue}")
-            report.append("")
+                write(f"  - {issue}\n")
+            write("\n")
 
         # Key challenges
-        report.append("KEY CHALLENGES FOR TRADITIONAL PARSERS:")
+        write("KEY CHALLENGES FOR TRADITIONAL PARSERS:\n")
         challenges = []
 
         if 'error' in result:
@@ -391,86 +460,138 @@ def generate_summary_report(all_results):
             challenges.append("  - (Relatively straightforward PDF)")
 
         for challenge in challenges:
-            report.append(challenge)
+            write(challenge + "\n")
 
-        report.append("")
+        write("\n")
 
     # Summary of spatial layout challenges
-    report.append("=" * 80)
-    report.append("SPATIAL LAYOUT CHALLENGES SUMMARY")
-    report.append("=" * 80)
-    report.append("")
-    report.append("Traditional parsers fail on these PDFs because they:")
-    report.append("")
-    report.append("1. IGNORE SPATIAL POSITIONING:")
-    report.append("   - Cannot handle multi-column layouts (text extracted in wrong order)")
-    report.append("   - Fail to recognize table structures without explicit markup")
-    report.append("   - Mix up headers, footers, and body text")
-    report.append("")
-    report.append("2. LACK STRUCTURE AWARENESS:")
-    report.append("   - Cannot distinguish between background graphics and content")
-    report.append("   - Fail to group related text blocks")
-    report.append("   - Cannot infer semantic meaning from layout")
-    report.append("")
-    report.append("3. POOR HANDLING OF MS OFFICE ARTIFACTS:")
-    report.append("   - MS Office PDFs have quirky spacing and positioning")
-    report.append("   - Text may be split into many small fragments")
-    report.append("   - Font embedding issues common")
-    report.append("")
-    report.append("4. TEXT EXTRACTION ISSUES:")
-    report.append("   - Encoding problems with special characters")
-    report.append("   - Excessive whitespace from poor layout understanding")
-    report.append("   - Missing text from image-based content")
-    report.append("")
-    report.append("OUR SPATIAL-AWARE APPROACH ADDRESSES THESE BY:")
-    report.append("")
-    report.append("1. Analyzing X/Y coordinates of all text elements")
-    report.append("2. Detecting columns, tables, and structured regions")
-    report.append("3. Maintaining reading order based on spatial layout")
-    report.append("4. Separating background elements from content")
-    report.append("5. Using font and position to infer document structure")
-    report.append("")
-
-    return "\n".join(report)
+    write("=" * 80 + "\n")
+    write("SPATIAL LAYOUT CHALLENGES SUMMARY\n")
+    write("=" * 80 + "\n")
+    write("\n")
+    write("Traditional parsers fail on these PDFs because they:\n")
+    write("\n")
+    write("1. IGNORE SPATIAL POSITIONING:\n")
+    write("   - Cannot handle multi-column layouts (text extracted in wrong order)\n")
+    write("   - Fail to recognize table structures without explicit markup\n")
+    write("   - Mix up headers, footers, and body text\n")
+    write("\n")
+    write("2. LACK STRUCTURE AWARENESS:\n")
+    write("   - Cannot distinguish between background graphics and content\n")
+    write("   - Fail to group related text blocks\n")
+    write("   - Cannot infer semantic meaning from layout\n")
+    write("\n")
+    write("3. POOR HANDLING OF MS OFFICE ARTIFACTS:\n")
+    write("   - MS Office PDFs have quirky spacing and positioning\n")
+    write("   - Text may be split into many small fragments\n")
+    write("   - Font embedding issues common\n")
+    write("\n")
+    write("4. TEXT EXTRACTION ISSUES:\n")
+    write("   - Encoding problems with special characters\n")
+    write("   - Excessive whitespace from poor layout understanding\n")
+    write("   - Missing text from image-based content\n")
+    write("\n")
+    write("OUR SPATIAL-AWARE APPROACH ADDRESSES THESE BY:\n")
+    write("\n")
+    write("1. Analyzing X/Y coordinates of all text elements\n")
+    write("2. Detecting columns, tables, and structured regions\n")
+    write("3. Maintaining reading order based on spatial layout\n")
+    write("4. Separating background elements from content\n")
+    write("5. Using font and position to infer document structure\n")
+    write("\n")
+
+
+def parse_args():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Analyze real-world PDFs")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of worker processes (default: CPU count)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-analyze every PDF instead of reusing cached results"
+    )
+    return parser.parse_args()
 
 
 def main():
+    args = parse_args()
+
     # Find all PDFs
     base_dir = Path("/Volumes/WD Green/dev/git/pdf2md/pdf2md/real-world-pdfs")
-    pdf_files = list(base_dir.glob("**/*.pdf"))
+    pdf_files = sorted(find_pdfs(base_dir))
 
     print(f"Found {len(pdf_files)} PDF files to analyze\n")
 
-    all_results = []
-
-    for pdf_path in sorted(pdf_files):
-        print(f"Analyzing: {pdf_path.name}...")
-        result = analyze_pdf(str(pdf_path))
-        all_results.append(result)
-
-    # Generate detailed JSON report
-    json_output = {
-        'analysis_date': datetime.now().isoformat(),
-        'total_pdfs': len(all_results),
-        'results': all_results
-    }
+    # Results are cached per file and reused while its size and mtime are
+    # unchanged; --no-cache swaps in a throwaway in-memory mapping
+    if args.no_cache:
+        cache_context = nullcontext({})
+    else:
+        cache_context = shelve.open(str(base_dir / ".analysis_cache"))
 
     json_path = base_dir / "analysis_detailed.json"
-    with open(json_path, 'w') as f:
-        json.dump(json_output, f, indent=2)
+    all_results = []
+    with cache_context as cache:
+        cached_results = {}
+        pending = []
+        for pdf_path, stat in pdf_files:
+            entry = cache.get(pdf_path)
+            if entry is not None and entry[0] == (stat.st_size, stat.st_mtime_ns):
+                cached_results[pdf_path] = entry[1]
+            else:
+                pending.append((pdf_path, stat))
+
+        print(f"Reusing cached analysis for {len(cached_results)} unchanged PDFs\n")
+
+        # Each PDF is independent and analyze_pdf opens its own document,
+        # so files can be analyzed in parallel worker processes.
+        workers = max(1, args.workers)
+        paths = [pdf_path for pdf_path, _ in pending]
+        sizes = [stat.st_size for _, stat in pending]
+        chunksize = max(1, len(paths) // (workers * 4))
+
+        # Stream each result into the detailed JSON report as soon as it
+        # arrives instead of serializing one large document at the end
+        with open(json_path, 'w') as f, \
+                ProcessPoolExecutor(max_workers=workers) as executor:
+            f.write('{\n')
+            f.write(f'  "analysis_date": {json.dumps(datetime.now().isoformat())},\n')
+            f.write(f'  "total_pdfs": {len(pdf_files)},\n')
+            f.write('  "results": [')
+            fresh_results = executor.map(analyze_pdf, paths, sizes, chunksize=chunksize)
+            for index, (pdf_path, stat) in enumerate(pdf_files):
+                result = cached_results.get(pdf_path)
+                if result is None:
+                    result = next(fresh_results)
+                    cache[pdf_path] = ((stat.st_size, stat.st_mtime_ns), result)
+                    print(f"Analyzed: {result['filename']}")
+                f.write(',\n    ' if index else '\n    ')
+                f.write(json.dumps(result))
+                all_results.append(result)
+            f.write('\n  ]\n}\n')
+
+        # Forget files that are gone so the cache never outgrows the corpus
+        for stale_path in set(cache) - {pdf_path for pdf_path, _ in pdf_files}:
+            del cache[stale_path]
 
     print(f"\nDetailed JSON report saved to: {json_path}")
 
     # Generate summary report
-    summary = generate_summary_report(all_results)
+    summary = io.StringIO()
+    generate_summary_report(all_results, summary)
 
     summary_path = base_dir / "analysis_summary.txt"
     with open(summary_path, 'w') as f:
-        f.write(summary)
+        f.write(summary.getvalue())
 
     print(f"Summary report saved to: {summary_path}")
     print("\n" + "=" * 80)
-    print(summary)
+    print(summary.getvalue(), end="")
 
 
 if __name__ == "__main__":
@@ -5,59 +5,118 @@ to visually demonstrate why spatial awareness is critical
 """
 
 import fitz  # PyMuPDF
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from collections import defaultdict
 
+# Number of traditional-extraction lines shown in each comparison report
+PREVIEW_LINES = 50
 
-def traditional_extraction(pdf_path):
-    """Simulate traditional parser - just extract text in stream order."""
-    doc = fitz.open(pdf_path)
+
+def prefetch_pdfs(pdf_paths):
+    """
+    Yield (path, file bytes) for each existing PDF in order.
+
+    The next file is read from disk in a background thread while the caller
+    is still parsing the current one, hiding I/O latency on slow drives.
+    """
+    pdf_paths = [path for path in pdf_paths if path.exists()]
+    if not pdf_paths:
+        return
+
+    with ThreadPoolExecutor(max_workers=1) as reader:
+        pending = reader.submit(pdf_paths[0].read_bytes)
+        for index, pdf_path in enumerate(pdf_paths):
+            pdf_data = pending.result()
+            if index + 1 < len(pdf_paths):
+                pending = reader.submit(pdf_paths[index + 1].read_bytes)
+            yield pdf_path, pdf_data
+
+
+def traditional_extraction(doc, max_lines=None):
+    """
+    Simulate traditional parser - just extract text in stream order.
+
+    Args:
+        doc: Open PyMuPDF document
+        max_lines: Stop extracting further pages once the text holds more
+            than this many lines; the result is then a prefix of the full
+            extraction. None extracts every page.
+    """
     text_parts = []
+    line_count = 0
 
     for page in doc:
         text = page.get_text()
         text_parts.append(text)
 
-    doc.close()
+        # Pages are joined with "\n", so each adds its newlines plus one line
+        line_count += text.count('\n') + 1
+        if max_lines is not None and line_count > max_lines:
+            break
+
     return "\n".join(text_parts)
 
 
-def spatial_aware_extraction(pdf_path):
-    """Extract text using spatial awareness - sort by position."""
-    doc = fitz.open(pdf_path)
+def spatial_aware_extraction(doc):
+    """
+    Extract text using spatial awareness - sort by position.
+
+    Also gathers the structure statistics from the same page walk, so each
+    page's text dictionary is only parsed once.
+
+    Returns:
+        Tuple of (structure stats, spatial-aware text)
+    """
+    stats = {
+        'pages': len(doc),
+        'total_blocks': 0,
+        'total_drawings': 0,
+        'column_positions': set(),
+        'producer': doc.metadata.get('producer', 'Unknown')
+    }
     result_parts = []
 
     for page_num, page in enumerate(doc):
+        # Count drawings
+        drawings = page.get_drawings()
+        stats['total_drawings'] += len(drawings)
+
         result_parts.append(f"\n=== PAGE {page_num + 1} ===\n")
 
         # Get text blocks with position
         text_dict = page.get_text("dict")
         blocks = [b for b in text_dict["blocks"] if b.get('type') == 0]
+        stats['total_blocks'] += len(blocks)
 
         if not blocks:
             result_parts.append("(No text blocks found)\n")
             continue
 
-        # Detect columns by clustering X positions
-        x_positions = defaultdict(list)
-        for block in blocks:
-            bbox = block['bbox']
-            x_bucket = int(bbox[0] / 50) * 50  # Group by 50-point buckets
-            x_positions[x_bucket].append((bbox[1], block))  # (y_pos, block)
+        # Detect columns by bucketing X positions into 50-point bins;
+        # a stable argsort groups blocks per bucket, left to right
+        x_coords = np.fromiter(
+            (b['bbox'][0] for b in blocks), dtype=np.float64, count=len(blocks)
+        )
+        x_buckets = (x_coords / 50).astype(np.int64) * 50
+        order = np.argsort(x_buckets, kind='stable')
+        columns = np.split(order, np.flatnonzero(np.diff(x_buckets[order])) + 1)
 
-        # Sort columns left to right
-        columns = sorted(x_positions.items())
+        stats['column_positions'].update(x_buckets.tolist())
 
         result_parts.append(f"Detected {len(columns)} columns\n\n")
 
         # Process each column
-        for col_num, (x_pos, blocks_in_col) in enumerate(columns):
+        for col_num, column in enumerate(columns):
+            x_pos = int(x_buckets[column[0]])
             result_parts.append(f"--- Column {col_num + 1} (X ≈ {x_pos}) ---\n")
 
             # Sort blocks in column by Y position (top to bottom)
-            sorted_blocks = sorted(blocks_in_col, key=lambda b: b[0])
+            sorted_blocks = sorted(
+                (blocks[i] for i in column), key=lambda b: b['bbox'][1]
+            )
 
-            for y_pos, block in sorted_blocks[:5]:  # First 5 blocks per column
+            for block in sorted_blocks[:5]:  # First 5 blocks per column
                 # Extract text from block
                 text = ""
                 for line in block.get('lines', []):
@@ -73,39 +132,9 @@ def spatial_aware_extraction(pdf_path):
 
             result_parts.append("\n")
 
-    doc.close()
-    return "".join(result_parts)
-
-
-def analyze_structure(pdf_path):
-    """Analyze PDF structure to show why it's challenging."""
-    doc = fitz.open(pdf_path)
-    stats = {
-        'pages': len(doc),
-        'total_blocks': 0,
-        'total_drawings': 0,
-        'column_positions': set(),
-        'producer': doc.metadata.get('producer', 'Unknown')
-    }
-
-    for page in doc:
-        text_dict = page.get_text("dict")
-        blocks = [b for b in text_dict["blocks"] if b.get('type') == 0]
-        stats['total_blocks'] += len(blocks)
-
-        # Detect column positions
-        for block in blocks:
-            x_pos = int(block['bbox'][0] / 50) * 50
-            stats['column_positions'].add(x_pos)
-
-        # Count drawings
-        drawings = page.get_drawings()
-        stats['total_drawings'] += len(drawings)
-
     stats['column_count'] = len(stats['column_positions'])
-    doc.close()
 
-    return stats
+    return stats, "".join(result_parts)
 
 
 def main():
@@ -120,23 +149,17 @@ def main():
         base_dir / "complex" / "document (1).pdf"
     ]
 
-    for pdf_path in demo_pdfs:
-        if not pdf_path.exists():
-            continue
-
+    for pdf_path, pdf_data in prefetch_pdfs(demo_pdfs):
         print(f"\nProcessing: {pdf_path.name}")
 
-        # Analyze structure
-        print("  Analyzing structure...")
-        stats = analyze_structure(str(pdf_path))
-
-        # Traditional extraction
-        print("  Performing traditional extraction...")
-        traditional = traditional_extraction(str(pdf_path))
+        with fitz.open(stream=pdf_data, filetype="pdf") as doc:
+            # Traditional extraction
+            print("  Performing traditional extraction...")
+            traditional = traditional_extraction(doc, max_lines=PREVIEW_LINES)
 
-        # Spatial-aware extraction
-        print("  Performing spatial-aware extraction...")
-        spatial = spatial_aware_extraction(str(pdf_path))
+            # Spatial-aware extraction and structure analysis
+            print("  Performing spatial-aware extraction...")
+            stats, spatial = spatial_aware_extraction(doc)
 
         # Generate comparison report
         report = []
@@ -162,11 +185,11 @@ def main():
         report.append("")
         report.append("RESULT:")
         report.append("-" * 80)
-        traditional_lines = traditional.split('\n')[:50]
-        for i, line in enumerate(traditional_lines, 1):
+        traditional_lines = traditional.split('\n')
+        for i, line in enumerate(traditional_lines[:PREVIEW_LINES], 1):
             report.append(f"{i:3d}: {line}")
-        if len(traditional.split('\n')) > 50:
-            report.append(f"... ({len(traditional.split('\n')) - 50} more lines)")
+        if len(traditional_lines) > PREVIEW_LINES:
+            report.append(f"... (truncated after {PREVIEW_LINES} lines)")
         report.append("")
         report.append("PROBLEMS WITH THIS APPROACH:")
         report.append("  - Column relationships are destroyed")
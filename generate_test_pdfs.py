@@ -8,14 +8,9 @@ test edge cases and specific scenarios that complement the real-world PDFs.
 """
 
 import os
+import argparse
+import multiprocessing
 from pathlib import Path
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.lib.colors import black, red, blue, green, gray
-from reportlab.lib import colors
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
 
 
 def create_output_dirs():
@@ -29,11 +24,12 @@ def create_output_dirs():
     return base_dir
 
 
-def generate_simple_single_column():
+def generate_simple_single_column(filename):
     """Generate a clean single-column document with typography hierarchy."""
-    filename = "real-world-pdfs/generated/simple/single_column_typography.pdf"
+    from reportlab.pdfgen import canvas
+    from reportlab.lib.pagesizes import letter
 
-    c = canvas.Canvas(filename, pagesize=letter)
+    c = canvas.Canvas(filename, pagesize=letter, pageCompression=1)
     width, height = letter
 
     # Title
@@ -49,8 +45,6 @@ def generate_simple_single_column():
     c.drawString(100, height - 200, "Section 1: Introduction")
 
     # Body text
-    c.setFont("Helvetica", 12)
-    y_pos = height - 240
     paragraphs = [
         "This is the first paragraph of body text. It demonstrates normal",
         "typography in a single-column layout. The text should flow naturally",
@@ -61,9 +55,15 @@ def generate_simple_single_column():
         "preserved in the markdown output."
     ]
 
+    # One text object for the whole body: a single BT/ET block in which
+    # each line advances by the leading
+    body = c.beginText(100, height - 240)
+    body.setFont("Helvetica", 12)
+    body.setLeading(20)
     for para in paragraphs:
-        c.drawString(100, y_pos, para)
-        y_pos -= 20
+        body.textLine(para)
+    c.drawText(body)
+    y_pos = body.getY()
 
     # Caption example
     c.setFont("Helvetica-Oblique", 10)
@@ -73,11 +73,15 @@ def generate_simple_single_column():
     return filename
 
 
-def generate_simple_basic_table():
+def generate_simple_basic_table(filename):
     """Generate a document with a semantic table (proper table markup)."""
-    filename = "real-world-pdfs/generated/simple/semantic_table.pdf"
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib import colors
+    from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.lib.units import inch
 
-    doc = SimpleDocTemplate(filename, pagesize=letter)
+    doc = SimpleDocTemplate(filename, pagesize=letter, pageCompression=1)
     styles = getSampleStyleSheet()
     story = []
 
@@ -119,11 +123,13 @@ def generate_simple_basic_table():
     return filename
 
 
-def generate_complex_multi_column():
+def generate_complex_multi_column(filename):
     """Generate a document with proper multi-column layout."""
-    filename = "real-world-pdfs/generated/complex/proper_multi_column.pdf"
+    from reportlab.pdfgen import canvas
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.colors import gray
 
-    c = canvas.Canvas(filename, pagesize=letter)
+    c = canvas.Canvas(filename, pagesize=letter, pageCompression=1)
     width, height = letter
 
     # Define column boundaries
@@ -140,8 +146,6 @@ def generate_complex_multi_column():
     c.setFont("Helvetica-Bold", 14)
     c.drawString(col1_left, height - 120, "Left Column")
 
-    c.setFont("Helvetica", 10)
-    y_pos = height - 150
     col1_text = [
         "This is the left column of a two-column",
         "layout. The text should flow naturally",
@@ -155,16 +159,17 @@ def generate_complex_multi_column():
         "then left-to-right across columns."
     ]
 
+    col1_body = c.beginText(col1_left, height - 150)
+    col1_body.setFont("Helvetica", 10)
+    col1_body.setLeading(15)
     for line in col1_text:
-        c.drawString(col1_left, y_pos, line)
-        y_pos -= 15
+        col1_body.textLine(line)
+    c.drawText(col1_body)
 
     # Column 2 content
     c.setFont("Helvetica-Bold", 14)
     c.drawString(col2_left, height - 120, "Right Column")
 
-    c.setFont("Helvetica", 10)
-    y_pos = height - 150
     col2_text = [
         "This is the right column content.",
         "It should be parsed after the left",
@@ -178,9 +183,12 @@ def generate_complex_multi_column():
         "reading order."
     ]
 
+    col2_body = c.beginText(col2_left, height - 150)
+    col2_body.setFont("Helvetica", 10)
+    col2_body.setLeading(15)
     for line in col2_text:
-        c.drawString(col2_left, y_pos, line)
-        y_pos -= 15
+        col2_body.textLine(line)
+    c.drawText(col2_body)
 
     # Add column divider line
     c.setStrokeColor(gray)
@@ -190,11 +198,14 @@ def generate_complex_multi_column():
     return filename
 
 
-def generate_complex_mixed_content():
+def generate_complex_mixed_content(filename):
     """Generate a document with mixed text, tables, and multiple font sizes."""
-    filename = "real-world-pdfs/generated/complex/mixed_content_layout.pdf"
+    from reportlab.pdfgen import canvas
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.colors import black
+    from reportlab.lib import colors
 
-    c = canvas.Canvas(filename, pagesize=letter)
+    c = canvas.Canvas(filename, pagesize=letter, pageCompression=1)
     width, height = letter
 
     # Main title
@@ -259,23 +270,25 @@ def generate_complex_mixed_content():
         c.setFillColor(colors.white)
         y_offset += 25
 
-    # Add borders
+    # Add borders: 4 rows including header x 3 columns, drawn as one
+    # lattice path over the cell edges
     c.setFillColor(black)
-    for i in range(4):  # 4 rows including header
-        for j in range(3):  # 3 columns
-            x = 100 + j * 100
-            y = table_y - i * 25
-            c.rect(x, y, 100, 25, fill=0)
+    c.grid(
+        [100 + j * 100 for j in range(4)],
+        [table_y - i * 25 for i in range(3, -2, -1)]
+    )
 
     c.save()
     return filename
 
 
-def generate_edge_case_overlapping_text():
+def generate_edge_case_overlapping_text(filename):
     """Generate a PDF with overlapping text elements (edge case)."""
-    filename = "real-world-pdfs/generated/edge_cases/overlapping_text.pdf"
+    from reportlab.pdfgen import canvas
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.colors import black, red
 
-    c = canvas.Canvas(filename, pagesize=letter)
+    c = canvas.Canvas(filename, pagesize=letter, pageCompression=1)
     width, height = letter
 
     # Title
@@ -286,8 +299,7 @@ def generate_edge_case_overlapping_text():
     c.setFont("Helvetica", 12)
     c.drawString(100, height - 120, "This is normal text that should be parsed correctly.")
 
-    # Overlapping text scenario
-    c.setFont("Helvetica", 12)
+    # Overlapping text scenario (still Helvetica 12)
     c.drawString(100, height - 160, "Background text that might be covered")
 
     # Overlapping text in different color
@@ -313,11 +325,13 @@ def generate_edge_case_overlapping_text():
     return filename
 
 
-def generate_edge_case_extreme_columns():
+def generate_edge_case_extreme_columns(filename):
     """Generate a PDF with many columns (like CBH shipping stem)."""
-    filename = "real-world-pdfs/generated/edge_cases/extreme_multi_column.pdf"
+    from reportlab.pdfgen import canvas
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.colors import gray
 
-    c = canvas.Canvas(filename, pagesize=letter)
+    c = canvas.Canvas(filename, pagesize=letter, pageCompression=1)
     width, height = letter
 
     # Title
@@ -329,48 +343,54 @@ def generate_edge_case_extreme_columns():
     headers = ["ID", "Vessel", "ETA", "ETD", "Cargo", "Qty", "Port", "Agent",
               "Status", "Berth", "Draft", "LOA", "Beam", "Flag", "Notes"]
 
-    # Draw headers
-    c.setFont("Helvetica-Bold", 8)
-    for i, header in enumerate(headers):
-        x = 50 + i * col_width
-        c.drawString(x, height - 90, header[:6])  # Truncate to fit
-
-    # Draw data rows
-    c.setFont("Helvetica", 7)
     data_rows = [
         ["001", "ATLANTIC", "12:00", "18:00", "WHEAT", "50000", "MELB", "XYZ", "LOAD", "1", "12.5", "180", "32", "AU", "OK"],
         ["002", "PACIFIC", "14:30", "20:00", "CORN", "45000", "SYDN", "ABC", "WAIT", "2", "11.8", "175", "30", "SG", "DEL"],
         ["003", "NORTHERN", "16:00", "22:30", "RICE", "38000", "BRIS", "DEF", "DONE", "3", "10.2", "165", "28", "JP", "CPL"]
     ]
 
-    y_pos = height - 110
-    for row in data_rows:
-        for i, cell in enumerate(row):
-            x = 50 + i * col_width
-            c.drawString(x, y_pos, str(cell)[:8])  # Truncate to fit
-        y_pos -= 15
-
-    # Add grid lines
+    # Truncate to fit once, up front, rather than inside the draw loops
+    rows = [[h[:6] for h in headers]]
+    rows += [[cell[:8] for cell in row] for row in data_rows]
+
+    # Draw headers then data rows, one text object per row
+    y_pos = height - 90
+    for row_index, row in enumerate(rows):
+        text = c.beginText(50, y_pos)
+        if row_index == 0:
+            text.setFont("Helvetica-Bold", 8)
+        else:
+            text.setFont("Helvetica", 7)
+        for cell in row:
+            text.textOut(cell)
+            text.moveCursor(col_width, 0)
+        c.drawText(text)
+        y_pos -= 20 if row_index == 0 else 15
+
+    # Add grid lines, emitted together as a single stroked path
     c.setStrokeColor(gray)
-    # Vertical lines
-    for i in range(16):  # 15 columns = 16 lines
-        x = 50 + i * col_width
-        c.line(x, height - 80, x, height - 160)
-
-    # Horizontal lines
-    for i in range(5):  # Header + 3 data rows + bottom
-        y = height - 80 - i * 20
-        c.line(50, y, width - 50, y)
+    # Vertical lines: 15 columns = 16 lines
+    grid_lines = [
+        (50 + i * col_width, height - 80, 50 + i * col_width, height - 160)
+        for i in range(16)
+    ]
+    # Horizontal lines: header + 3 data rows + bottom
+    grid_lines += [
+        (50, height - 80 - i * 20, width - 50, height - 80 - i * 20)
+        for i in range(5)
+    ]
+    c.lines(grid_lines)
 
     c.save()
     return filename
 
 
-def generate_edge_case_tiny_fonts():
+def generate_edge_case_tiny_fonts(filename):
     """Generate a PDF with very small fonts and spacing."""
-    filename = "real-world-pdfs/generated/edge_cases/tiny_fonts_spacing.pdf"
+    from reportlab.pdfgen import canvas
+    from reportlab.lib.pagesizes import letter
 
-    c = canvas.Canvas(filename, pagesize=letter)
+    c = canvas.Canvas(filename, pagesize=letter, pageCompression=1)
     width, height = letter
 
     # Title
@@ -385,23 +405,14 @@ def generate_edge_case_tiny_fonts():
     c.setFont("Helvetica", 4)
     c.drawString(100, height - 135, "This text is 4pt font size - extremely small")
 
-    # Tight spacing
-    c.setFont("Helvetica", 8)
-    y_pos = height - 160
+    # Tight and wide spacing share one text object; only the font and
+    # leading change between the two groups of lines
     tight_lines = [
         "These lines have very tight spacing between them",
         "Only 9 points between baselines instead of normal 12+",
         "This can confuse text clustering algorithms",
         "Because the Y-coordinate gaps are very small"
     ]
-
-    for line in tight_lines:
-        c.drawString(100, y_pos, line)
-        y_pos -= 9  # Very tight spacing
-
-    # Wide spacing
-    c.setFont("Helvetica", 10)
-    y_pos -= 30
     wide_lines = [
         "These lines have very wide spacing",
         "",
@@ -410,17 +421,28 @@ def generate_edge_case_tiny_fonts():
         "Can break paragraph detection"
     ]
 
+    body = c.beginText(100, height - 160)
+
+    # Tight spacing
+    body.setFont("Helvetica", 8)
+    body.setLeading(9)  # Very tight spacing
+    for line in tight_lines:
+        body.textLine(line)
+
+    # Wide spacing
+    body.moveCursor(0, 30)  # Extra 30pt gap (moveCursor dy points down)
+    body.setFont("Helvetica", 10)
+    body.setLeading(25)  # Wide spacing
     for line in wide_lines:
-        c.drawString(100, y_pos, line)
-        y_pos -= 25  # Wide spacing
+        body.textLine(line)
+
+    c.drawText(body)
 
     c.save()
     return filename
 
 
-def create_test_suite_readme():
-    """Create documentation for the generated test PDFs."""
-    content = """# Generated Test PDF Suite
+TEST_SUITE_README = """# Generated Test PDF Suite
 
 This directory contains synthetically generated PDF files designed to test specific edge cases and scenarios that complement the real-world PDFs.
 
@@ -529,35 +551,75 @@ python3 generate_test_pdfs.py
 The script is designed to be easily extensible for new test scenarios.
 """
 
-    with open("real-world-pdfs/generated/README.md", "w") as f:
-        f.write(content)
+
+def create_test_suite_readme():
+    """Create documentation for the generated test PDFs."""
+    Path("real-world-pdfs/generated/README.md").write_text(
+        TEST_SUITE_README, encoding="utf-8"
+    )
+
+
+GENERATORS = [
+    (generate_simple_single_column, "real-world-pdfs/generated/simple/single_column_typography.pdf"),
+    (generate_simple_basic_table, "real-world-pdfs/generated/simple/semantic_table.pdf"),
+    (generate_complex_multi_column, "real-world-pdfs/generated/complex/proper_multi_column.pdf"),
+    (generate_complex_mixed_content, "real-world-pdfs/generated/complex/mixed_content_layout.pdf"),
+    (generate_edge_case_overlapping_text, "real-world-pdfs/generated/edge_cases/overlapping_text.pdf"),
+    (generate_edge_case_extreme_columns, "real-world-pdfs/generated/edge_cases/extreme_multi_column.pdf"),
+    (generate_edge_case_tiny_fonts, "real-world-pdfs/generated/edge_cases/tiny_fonts_spacing.pdf"),
+]
+
+
+def _run_generator(job):
+    """Run one PDF generator (module-level so worker processes can unpickle it)."""
+    generator, filename = job
+    return generator(filename)
+
+
+def _needs_rebuild(filename):
+    """Return True if the PDF is missing or older than this script."""
+    try:
+        return os.path.getmtime(filename) < os.path.getmtime(__file__)
+    except OSError:
+        return True
+
+
+def parse_args():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Generate synthetic test PDFs")
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate every PDF even if it is newer than this script"
+    )
+    return parser.parse_args()
 
 
 def main():
     """Generate all test PDFs and documentation."""
+    args = parse_args()
+
     print("🏗️  Generating synthetic test PDF suite...")
 
     # Create directories
     base_dir = create_output_dirs()
 
-    generated_files = []
-
     try:
-        # Generate simple PDFs
-        print("📄 Creating simple PDFs...")
-        generated_files.append(generate_simple_single_column())
-        generated_files.append(generate_simple_basic_table())
-
-        # Generate complex PDFs
-        print("📊 Creating complex PDFs...")
-        generated_files.append(generate_complex_multi_column())
-        generated_files.append(generate_complex_mixed_content())
-
-        # Generate edge case PDFs
-        print("🎯 Creating edge case PDFs...")
-        generated_files.append(generate_edge_case_overlapping_text())
-        generated_files.append(generate_edge_case_extreme_columns())
-        generated_files.append(generate_edge_case_tiny_fonts())
+        # Only re-render PDFs that predate the generator source
+        jobs = [
+            job for job in GENERATORS
+            if args.force or _needs_rebuild(job[1])
+        ]
+
+        # Each generator writes its own file, so they can render in parallel
+        generated_files = []
+        if jobs:
+            print(f"📄 Rendering {len(jobs)} PDFs in parallel...")
+            processes = min(len(jobs), os.cpu_count() or 1)
+            with multiprocessing.Pool(processes=processes) as pool:
+                generated_files = pool.map(_run_generator, jobs)
+        else:
+            print("📄 All PDFs are up to date (use --force to regenerate)")
 
         # Create documentation
         print("📚 Creating documentation...")
@@ -0,0 +1,21 @@
+"""
+Issue indicators used to categorize analyzed PDFs
+Shared by analyze_pdfs and reorganize_pdfs; kept free of dependencies so
+reorganize_pdfs can run without PyMuPDF installed
+"""
+
+# Problematic: Multiple severe issues or specific problematic patterns
+PROBLEMATIC_INDICATORS = frozenset({
+    'MS_OFFICE_GENERATED',
+    'NO_TEXT_EXTRACTED',
+    'PROCESSING_ERROR',
+    'ENCODING_PROBLEMS'
+})
+
+# Complex: Multiple layout challenges
+COMPLEX_INDICATORS = frozenset({
+    'MULTI_COLUMN_LAYOUT',
+    'TABLE_STRUCTURES',
+    'COMPLEX_GRAPHICS',
+    'EXCESSIVE_FONTS'
+})
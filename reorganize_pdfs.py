@@ -3,10 +3,16 @@
 Reorganize PDFs based on analysis recommendations
 """
 
-import json
 import shutil
 import os
-from pathlib import Path
+from pathlib import Path, PurePath
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional; json.loads accepts bytes too
+    from json import loads as json_loads
+
+from pdf_indicators import COMPLEX_INDICATORS, PROBLEMATIC_INDICATORS
 
 
 def reorganize_pdfs():
@@ -14,40 +20,22 @@ def reorganize_pdfs():
     base_dir = Path("/Volumes/WD Green/dev/git/pdf2md/pdf2md/real-world-pdfs")
     json_path = base_dir / "analysis_detailed.json"
 
-    with open(json_path, 'r') as f:
-        data = json.load(f)
+    data = json_loads(json_path.read_bytes())
 
     moves = []
 
     for result in data['results']:
         current_path = result['path']
         filename = result['filename']
-        current_dir = os.path.dirname(current_path)
-        current_category = os.path.basename(current_dir)
+        current_category = PurePath(current_path).parent.name
 
         # Determine suggested category
-        issues = result.get('issues', [])
-        problematic_indicators = [
-            'MS_OFFICE_GENERATED',
-            'NO_TEXT_EXTRACTED',
-            'PROCESSING_ERROR',
-            'ENCODING_PROBLEMS'
-        ]
-        complex_indicators = [
-            'MULTI_COLUMN_LAYOUT',
-            'TABLE_STRUCTURES',
-            'COMPLEX_GRAPHICS',
-            'EXCESSIVE_FONTS'
-        ]
-
-        problematic_count = sum(1 for issue in issues if issue in problematic_indicators)
-        complex_count = sum(1 for issue in issues if issue in complex_indicators)
-
-        if problematic_count > 0:
+        # isdisjoint stops at the first matching issue
+        issues = result.get('issues', ())
+
+        if not PROBLEMATIC_INDICATORS.isdisjoint(issues):
             suggested_category = 'problematic'
-        elif complex_count >= 2:
-            suggested_category = 'complex'
-        elif complex_count == 1:
+        elif not COMPLEX_INDICATORS.isdisjoint(issues):
             suggested_category = 'complex'
         else:
             suggested_category = 'simple'
@@ -76,6 +64,9 @@ def reorganize_pdfs():
 
     response = input("Proceed with moving files? (yes/no): ")
     if response.lower() == 'yes':
+        # Sequential on purpose: moves that share a destination must fail
+        # deterministically, and a failure must stop before the rest run.
+        # shutil.move already renames in place on the same filesystem.
         for move in moves:
             shutil.move(move['current_path'], move['new_path'])
             print(f"Moved: {move['filename']}")
@@ -1,11 +1,14 @@
 """Core spatial data structures and operations."""
 
-from .bbox import BBox
+from .bbox import BBox, BBoxArray, BBoxIndex, SpatialGrid
 from .document import Document, Page, Block, Word
 from .exceptions import PDF2MDError, QualityError, SpatialAnalysisError
 
 __all__ = [
     "BBox",
+    "BBoxArray",
+    "BBoxIndex",
+    "SpatialGrid",
     "Document",
     "Page",
     "Block",
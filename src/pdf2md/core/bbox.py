@@ -6,12 +6,32 @@ Every text element, shape, and layout component has a bounding box that defines
 its position and size in the 2D document space.
 """
 
-from typing import Tuple, List, Optional, Union
-from dataclasses import dataclass
+from typing import Tuple, List, Optional, Union, Sequence, Dict, Set, Callable
+from collections import defaultdict
+from operator import attrgetter
+from weakref import WeakValueDictionary
+from functools import lru_cache
+from math import hypot
 import math
 
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to NumPy
+    njit = None
+
+# Below this many bboxes the plain Python loops in merge_bboxes and
+# cluster_bboxes_by_position are cheaper than packing a BBoxArray
+_ARRAY_THRESHOLD = 64
+
+# Pairwise matrices with at least this many cells use the fused JIT kernel
+_KERNEL_MIN_CELLS = 4096
+
+# BBoxArray columns start on a cache-line (and AVX-512 vector) boundary
+_COLUMN_ALIGNMENT = 64
+
 
-@dataclass(frozen=True)
 class BBox:
     """
     Immutable bounding box representing a rectangle in 2D space.
@@ -24,17 +44,102 @@ class BBox:
         x1: Right edge (maximum X coordinate)
         y1: Top edge (maximum Y coordinate)
     """
+
+    # Slots instead of a per-instance __dict__: documents hold many bboxes.
+    # __weakref__ lets BBox.intern keep a weak cache of shared instances.
+    __slots__ = (
+        "x0", "y0", "x1", "y1",
+        "_width", "_height", "_area", "_center_x", "_center_y", "_center",
+        "__weakref__",
+    )
+
     x0: float
     y0: float
     x1: float
     y1: float
 
-    def __post_init__(self) -> None:
-        """Validate bbox coordinates."""
-        if self.x0 > self.x1:
-            raise ValueError(f"x0 ({self.x0}) must be <= x1 ({self.x1})")
-        if self.y0 > self.y1:
-            raise ValueError(f"y0 ({self.y0}) must be <= y1 ({self.y1})")
+    def __init__(self, x0: float, y0: float, x1: float, y1: float) -> None:
+        """Validate and store bbox coordinates."""
+        if x0 > x1:
+            raise ValueError(f"x0 ({x0}) must be <= x1 ({x1})")
+        if y0 > y1:
+            raise ValueError(f"y0 ({y0}) must be <= y1 ({y1})")
+
+        self._set_coords(x0, y0, x1, y1)
+
+    @classmethod
+    def intern(cls, x0: float, y0: float, x1: float, y1: float) -> "BBox":
+        """
+        Return a shared BBox for these coordinates.
+
+        Equal coordinates yield the same instance for as long as any reference
+        to it is alive, so repeated boxes (e.g. page bounds of same-sized
+        pages) are stored once.
+        """
+        key = (x0, y0, x1, y1)
+        bbox = _INTERNED.get(key)
+        if bbox is None:
+            bbox = cls(x0, y0, x1, y1)
+            _INTERNED[key] = bbox
+        return bbox
+
+    @classmethod
+    def _unchecked(cls, x0: float, y0: float, x1: float, y1: float) -> "BBox":
+        """
+        Create a BBox without validating the coordinates.
+
+        Only for library code deriving a bbox that is valid by construction
+        (e.g. the union of two valid bboxes).
+        """
+        bbox = object.__new__(cls)
+        bbox._set_coords(x0, y0, x1, y1)
+        return bbox
+
+    def _set_coords(self, x0: float, y0: float, x1: float, y1: float) -> None:
+        """Store coordinates and the values derived from them."""
+        set_attr = object.__setattr__
+        set_attr(self, "x0", x0)
+        set_attr(self, "y0", y0)
+        set_attr(self, "x1", x1)
+        set_attr(self, "y1", y1)
+
+        # The bbox never changes, so derived values are computed once here
+        width = x1 - x0
+        height = y1 - y0
+        set_attr(self, "_width", width)
+        set_attr(self, "_height", height)
+        set_attr(self, "_area", width * height)
+        set_attr(self, "_center_x", (x0 + x1) / 2)
+        set_attr(self, "_center_y", (y0 + y1) / 2)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"cannot assign to field '{name}' of immutable BBox")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"cannot delete field '{name}' of immutable BBox")
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            self.x0 == other.x0 and
+            self.y0 == other.y0 and
+            self.x1 == other.x1 and
+            self.y1 == other.y1
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.x0, self.y0, self.x1, self.y1))
+
+    def __reduce__(self) -> tuple:
+        """Pickle by coordinates (slots plus __setattr__ block the default path)."""
+        return (self.__class__, (self.x0, self.y0, self.x1, self.y1))
+
+    def replace(self, **changes: float) -> "BBox":
+        """Return a copy with the given coordinates replaced."""
+        coords = self.to_dict()
+        coords.update(changes)
+        return self.__class__(**coords)
 
     @classmethod
     def from_tuple(cls, coords: Tuple[float, float, float, float]) -> "BBox":
@@ -66,32 +171,39 @@ class BBox:
     @property
     def width(self) -> float:
         """Width of the bounding box."""
-        return self.x1 - self.x0
+        return self._width
 
     @property
     def height(self) -> float:
         """Height of the bounding box."""
-        return self.y1 - self.y0
+        return self._height
 
     @property
     def area(self) -> float:
         """Area of the bounding box."""
-        return self.width * self.height
+        return self._area
 
     @property
     def center_x(self) -> float:
         """X coordinate of the center point."""
-        return (self.x0 + self.x1) / 2
+        return self._center_x
 
     @property
     def center_y(self) -> float:
         """Y coordinate of the center point."""
-        return (self.y0 + self.y1) / 2
+        return self._center_y
 
     @property
     def center(self) -> Tuple[float, float]:
         """Center point as (x, y) tuple."""
-        return (self.center_x, self.center_y)
+        # Built on first access and then reused, rather than stored eagerly
+        # for every bbox
+        try:
+            return self._center
+        except AttributeError:
+            center = (self._center_x, self._center_y)
+            object.__setattr__(self, "_center", center)
+            return center
 
     @property
     def top_left(self) -> Tuple[float, float]:
@@ -157,6 +269,18 @@ class BBox:
             self.y1 + tolerance >= other.y1
         )
 
+    def _x_overlap(self, other: "BBox") -> float:
+        """Signed overlap of the two X ranges (negative: size of the gap)."""
+        right = self.x1 if self.x1 < other.x1 else other.x1
+        left = self.x0 if self.x0 > other.x0 else other.x0
+        return right - left
+
+    def _y_overlap(self, other: "BBox") -> float:
+        """Signed overlap of the two Y ranges (negative: size of the gap)."""
+        top = self.y1 if self.y1 < other.y1 else other.y1
+        bottom = self.y0 if self.y0 > other.y0 else other.y0
+        return top - bottom
+
     def intersection(self, other: "BBox") -> Optional["BBox"]:
         """
         Calculate intersection bbox with another bbox.
@@ -164,18 +288,20 @@ class BBox:
         Returns:
             BBox of intersection area, or None if no intersection
         """
-        x0 = max(self.x0, other.x0)
-        y0 = max(self.y0, other.y0)
-        x1 = min(self.x1, other.x1)
-        y1 = min(self.y1, other.y1)
-
-        if x0 <= x1 and y0 <= y1:
-            return BBox(x0, y0, x1, y1)
-        return None
+        # Bail out on the first axis without overlap
+        if self._x_overlap(other) < 0 or self._y_overlap(other) < 0:
+            return None
+
+        return BBox._unchecked(
+            max(self.x0, other.x0),
+            max(self.y0, other.y0),
+            min(self.x1, other.x1),
+            min(self.y1, other.y1)
+        )
 
     def union(self, other: "BBox") -> "BBox":
         """Calculate union bbox that encompasses both bboxes."""
-        return BBox(
+        return BBox._unchecked(
             min(self.x0, other.x0),
             min(self.y0, other.y0),
             max(self.x1, other.x1),
@@ -184,8 +310,13 @@ class BBox:
 
     def intersection_area(self, other: "BBox") -> float:
         """Calculate area of intersection with another bbox."""
-        intersection = self.intersection(other)
-        return intersection.area if intersection else 0.0
+        # Computed directly rather than via intersection() to avoid
+        # allocating (and validating) a throwaway BBox per call
+        width = self._x_overlap(other)
+        if width <= 0:
+            return 0.0
+        height = self._y_overlap(other)
+        return width * height if height > 0 else 0.0
 
     def intersection_ratio(self, other: "BBox") -> float:
         """
@@ -198,40 +329,88 @@ class BBox:
         if intersection_area == 0:
             return 0.0
 
-        smaller_area = min(self.area, other.area)
+        smaller_area = min(self._area, other._area)
         return intersection_area / smaller_area if smaller_area > 0 else 0.0
 
+    def iou(self, other: "BBox") -> float:
+        """
+        Calculate intersection over union with another bbox.
+
+        Returns:
+            Ratio from 0.0 (disjoint) to 1.0 (identical); 0.0 if the union
+            has no area
+        """
+        intersection_area = self.intersection_area(other)
+        if intersection_area == 0:
+            return 0.0
+
+        union_area = self._area + other._area - intersection_area
+        return intersection_area / union_area if union_area > 0 else 0.0
+
     # Distance and proximity methods
 
+    def squared_distance_to_point(self, x: float, y: float) -> float:
+        """
+        Squared minimum distance from bbox to a point.
+
+        Cheaper than distance_to_point when only comparing distances; compare
+        against threshold * threshold instead of threshold.
+        """
+        # Zero on an axis where the point lies within the bbox's extent;
+        # conditional expressions avoid three max() builtin calls per axis
+        dx = self.x0 - x if x < self.x0 else (x - self.x1 if x > self.x1 else 0.0)
+        dy = self.y0 - y if y < self.y0 else (y - self.y1 if y > self.y1 else 0.0)
+        return dx * dx + dy * dy
+
+    def squared_distance_to_bbox(self, other: "BBox") -> float:
+        """
+        Squared minimum distance between two bboxes.
+
+        Cheaper than distance_to_bbox when only comparing distances; compare
+        against threshold * threshold instead of threshold.
+        """
+        # Zero on an axis where the bboxes' extents overlap
+        dx = self._x_gap(other)
+        dy = self._y_gap(other)
+        return dx * dx + dy * dy
+
     def distance_to_point(self, x: float, y: float) -> float:
         """Calculate minimum distance from bbox to a point."""
-        # If point is inside bbox, distance is 0
-        if self.contains_point(x, y):
-            return 0.0
-
-        # Calculate distance to nearest edge/corner
-        dx = max(0, max(self.x0 - x, x - self.x1))
-        dy = max(0, max(self.y0 - y, y - self.y1))
-        return math.sqrt(dx * dx + dy * dy)
+        dx = self.x0 - x if x < self.x0 else (x - self.x1 if x > self.x1 else 0.0)
+        dy = self.y0 - y if y < self.y0 else (y - self.y1 if y > self.y1 else 0.0)
+        return hypot(dx, dy)
 
     def distance_to_bbox(self, other: "BBox") -> float:
         """Calculate minimum distance between two bboxes."""
-        # If bboxes overlap, distance is 0
-        if self.overlaps(other):
-            return 0.0
-
-        # Calculate distance between closest points
-        dx = max(0, max(self.x0 - other.x1, other.x0 - self.x1))
-        dy = max(0, max(self.y0 - other.y1, other.y0 - self.y1))
-        return math.sqrt(dx * dx + dy * dy)
+        dx = self._x_gap(other)
+        dy = self._y_gap(other)
+        return hypot(dx, dy)
 
     def horizontal_distance(self, other: "BBox") -> float:
         """Calculate horizontal distance between bboxes."""
-        return max(0, max(self.x0 - other.x1, other.x0 - self.x1))
+        return self._x_gap(other)
 
     def vertical_distance(self, other: "BBox") -> float:
         """Calculate vertical distance between bboxes."""
-        return max(0, max(self.y0 - other.y1, other.y0 - self.y1))
+        return self._y_gap(other)
+
+    def _x_gap(self, other: "BBox") -> float:
+        """Gap between the two X ranges (0.0 if they touch or overlap)."""
+        # At most one side can have a positive gap, so test them in turn
+        # instead of calling max() on both differences and zero
+        if self.x0 > other.x1:
+            return self.x0 - other.x1
+        if other.x0 > self.x1:
+            return other.x0 - self.x1
+        return 0.0
+
+    def _y_gap(self, other: "BBox") -> float:
+        """Gap between the two Y ranges (0.0 if they touch or overlap)."""
+        if self.y0 > other.y1:
+            return self.y0 - other.y1
+        if other.y0 > self.y1:
+            return other.y0 - self.y1
+        return 0.0
 
     # Alignment detection methods
 
@@ -258,7 +437,7 @@ class BBox:
         Uses more lenient vertical alignment check suitable for text lines.
         """
         # Check if Y-ranges overlap significantly
-        y_overlap = max(0, min(self.y1, other.y1) - max(self.y0, other.y0))
+        y_overlap = max(0, self._y_overlap(other))
         min_height = min(self.height, other.height)
 
         return y_overlap >= min_height * 0.5 or self.horizontally_aligned(other, tolerance)
@@ -270,9 +449,8 @@ class BBox:
         Uses more lenient horizontal alignment check suitable for column detection.
         """
         # Check if X-ranges overlap significantly or are closely aligned
-        x_overlap = max(0, min(self.x1, other.x1) - max(self.x0, other.x0))
         return (
-            x_overlap > 0 or
+            self._x_overlap(other) > 0 or
             abs(self.x0 - other.x0) <= tolerance or
             abs(self.center_x - other.center_x) <= tolerance
         )
@@ -281,14 +459,16 @@ class BBox:
 
     def translate(self, dx: float, dy: float) -> "BBox":
         """Return new bbox translated by (dx, dy)."""
-        return BBox(self.x0 + dx, self.y0 + dy, self.x1 + dx, self.y1 + dy)
+        # Shifting both edges by the same amount cannot reorder them
+        return BBox._unchecked(self.x0 + dx, self.y0 + dy, self.x1 + dx, self.y1 + dy)
 
     def scale(self, scale_x: float, scale_y: float = None) -> "BBox":
         """Return new bbox scaled from center point."""
         if scale_y is None:
             scale_y = scale_x
 
-        center_x, center_y = self.center
+        center_x = self._center_x
+        center_y = self._center_y
         new_width = self.width * scale_x
         new_height = self.height * scale_y
 
@@ -296,7 +476,10 @@ class BBox:
 
     def expand(self, margin: float) -> "BBox":
         """Return new bbox expanded by margin in all directions."""
-        return BBox(
+        # A negative margin can shrink the bbox past zero size, so only a
+        # non-negative one may skip validation
+        constructor = BBox._unchecked if margin >= 0 else BBox
+        return constructor(
             self.x0 - margin,
             self.y0 - margin,
             self.x1 + margin,
@@ -310,6 +493,9 @@ class BBox:
         x1 = math.ceil(self.x1 / grid_size) * grid_size
         y1 = math.ceil(self.y1 / grid_size) * grid_size
 
+        # floor/ceil keep the edges ordered unless the grid size flips signs
+        if grid_size > 0:
+            return BBox._unchecked(x0, y0, x1, y1)
         return BBox(x0, y0, x1, y1)
 
     # Utility methods for spatial analysis
@@ -341,6 +527,396 @@ class BBox:
                 f"w={self.width:.1f}, h={self.height:.1f})")
 
 
+# Weak cache behind BBox.intern; entries vanish once no bbox uses them
+_INTERNED: "WeakValueDictionary[Tuple[float, float, float, float], BBox]" = WeakValueDictionary()
+
+
+def _aligned_empty(shape: Tuple[int, ...], dtype: np.dtype) -> np.ndarray:
+    """Uninitialized C-contiguous array starting on a _COLUMN_ALIGNMENT boundary."""
+    dtype = np.dtype(dtype)
+    nbytes = int(np.prod(shape)) * dtype.itemsize
+    buffer = np.empty(nbytes + _COLUMN_ALIGNMENT, dtype=np.uint8)
+    offset = -buffer.ctypes.data % _COLUMN_ALIGNMENT
+    return buffer[offset:offset + nbytes].view(dtype).reshape(shape)
+
+
+def _aligned_column(values: np.ndarray, dtype: np.dtype) -> np.ndarray:
+    """Return values as an aligned contiguous column, copying only if needed."""
+    values = np.asarray(values)
+    if (
+        values.dtype == dtype and
+        values.flags.c_contiguous and
+        values.ctypes.data % _COLUMN_ALIGNMENT == 0
+    ):
+        return values
+
+    column = _aligned_empty(values.shape, dtype)
+    column[...] = values
+    return column
+
+
+class BBoxArray:
+    """
+    Structure-of-arrays container for many bounding boxes.
+
+    Stores each coordinate as its own contiguous NumPy column so pairwise
+    spatial queries over a whole page can be evaluated with broadcasting
+    instead of one Python-level BBox method call per pair.
+
+    Columns default to float64, matching BBox exactly. Pass
+    dtype=np.float32 to halve memory and double SIMD width for large batch
+    queries; PDF coordinates fit comfortably, but comparisons right at a
+    boundary may then differ from the float64 BBox methods.
+
+    Attributes:
+        x0: Left edges
+        y0: Bottom edges
+        x1: Right edges
+        y1: Top edges
+    """
+
+    __slots__ = ("x0", "y0", "x1", "y1")
+
+    def __init__(
+        self,
+        x0: np.ndarray,
+        y0: np.ndarray,
+        x1: np.ndarray,
+        y1: np.ndarray,
+        dtype: np.dtype = np.float64
+    ) -> None:
+        self.x0 = _aligned_column(x0, dtype)
+        self.y0 = _aligned_column(y0, dtype)
+        self.x1 = _aligned_column(x1, dtype)
+        self.y1 = _aligned_column(y1, dtype)
+
+        if not (self.x0.shape == self.y0.shape == self.x1.shape == self.y1.shape):
+            raise ValueError("BBoxArray columns must all have the same shape")
+
+    @classmethod
+    def from_bboxes(cls, bboxes: Sequence[BBox], dtype: np.dtype = np.float64) -> "BBoxArray":
+        """Pack a sequence of BBox objects into coordinate columns."""
+        coords = np.array([bbox.to_tuple() for bbox in bboxes], dtype=dtype)
+        return cls(*coords.reshape(-1, 4).T, dtype=dtype)
+
+    def __len__(self) -> int:
+        return len(self.x0)
+
+    @property
+    def dtype(self) -> np.dtype:
+        """Floating-point type of the coordinate columns."""
+        return self.x0.dtype
+
+    def __getitem__(self, index: int) -> BBox:
+        """Return the bbox at index as a BBox object."""
+        return BBox(
+            float(self.x0[index]),
+            float(self.y0[index]),
+            float(self.x1[index]),
+            float(self.y1[index])
+        )
+
+    def to_bboxes(self) -> List[BBox]:
+        """Unpack back into a list of BBox objects."""
+        return [
+            BBox(x0, y0, x1, y1)
+            for x0, y0, x1, y1 in zip(
+                self.x0.tolist(), self.y0.tolist(), self.x1.tolist(), self.y1.tolist()
+            )
+        ]
+
+    @property
+    def areas(self) -> np.ndarray:
+        """Area of every bbox."""
+        return (self.x1 - self.x0) * (self.y1 - self.y0)
+
+    def centers(self) -> np.ndarray:
+        """Center points as an (N, 2) array of (x, y) rows."""
+        return np.column_stack(((self.x0 + self.x1) / 2, (self.y0 + self.y1) / 2))
+
+    def expand_to_grid(self, grid_size: float) -> "BBoxArray":
+        """Expand every bbox to align with grid boundaries (see BBox.expand_to_grid)."""
+        return BBoxArray(
+            np.floor(self.x0 / grid_size) * grid_size,
+            np.floor(self.y0 / grid_size) * grid_size,
+            np.ceil(self.x1 / grid_size) * grid_size,
+            np.ceil(self.y1 / grid_size) * grid_size,
+            dtype=self.dtype
+        )
+
+
+def batch_overlaps(a: BBoxArray, b: BBoxArray, tolerance: float = 0.0) -> np.ndarray:
+    """
+    Pairwise equivalent of BBox.overlaps.
+
+    Returns:
+        (len(a), len(b)) boolean matrix, True where a[i] overlaps b[j]
+    """
+    return (
+        (a.x0[:, None] <= b.x1[None, :] + tolerance) &
+        (a.x1[:, None] >= b.x0[None, :] - tolerance) &
+        (a.y0[:, None] <= b.y1[None, :] + tolerance) &
+        (a.y1[:, None] >= b.y0[None, :] - tolerance)
+    )
+
+
+def batch_intersection_area(a: BBoxArray, b: BBoxArray) -> np.ndarray:
+    """
+    Pairwise equivalent of BBox.intersection_area.
+
+    Returns:
+        (len(a), len(b)) matrix of intersection areas (0.0 where disjoint)
+    """
+    if njit is not None and len(a) * len(b) >= _KERNEL_MIN_CELLS:
+        out = np.empty((len(a), len(b)), dtype=np.result_type(a.dtype, b.dtype))
+        _intersection_area_kernel(a.x0, a.y0, a.x1, a.y1, b.x0, b.y0, b.x1, b.y1, out)
+        return out
+
+    widths = np.minimum(a.x1[:, None], b.x1[None, :]) - np.maximum(a.x0[:, None], b.x0[None, :])
+    heights = np.minimum(a.y1[:, None], b.y1[None, :]) - np.maximum(a.y0[:, None], b.y0[None, :])
+    return np.maximum(widths, 0.0) * np.maximum(heights, 0.0)
+
+
+if njit is not None:
+    @njit
+    def _intersection_area_kernel(ax0, ay0, ax1, ay1, bx0, by0, bx1, by1, out):
+        """
+        Fill out[i, j] with the intersection area of a[i] and b[j].
+
+        Fuses the min/max/area steps into one pass per row, so no (N, K)
+        temporaries are materialized.
+        """
+        for i in range(len(ax0)):
+            for j in range(len(bx0)):
+                width = min(ax1[i], bx1[j]) - max(ax0[i], bx0[j])
+                height = min(ay1[i], by1[j]) - max(ay0[i], by0[j])
+                out[i, j] = width * height if width > 0.0 and height > 0.0 else 0.0
+
+
+def batch_iou(a: BBoxArray, b: BBoxArray) -> np.ndarray:
+    """
+    Pairwise equivalent of BBox.iou.
+
+    Returns:
+        (len(a), len(b)) matrix of IoU values from 0.0 to 1.0 (0.0 where
+        the union has no area)
+    """
+    intersection = batch_intersection_area(a, b)
+    union = a.areas[:, None] + b.areas[None, :] - intersection
+    return np.divide(
+        intersection, union, out=np.zeros_like(intersection), where=union > 0
+    )
+
+
+def batch_contains_point(
+    a: BBoxArray,
+    xs: np.ndarray,
+    ys: np.ndarray,
+    tolerance: float = 0.0
+) -> np.ndarray:
+    """
+    Pairwise equivalent of BBox.contains_point.
+
+    Returns:
+        (len(a), len(xs)) boolean matrix, True where a[i] contains point j
+    """
+    xs = np.asarray(xs, dtype=a.dtype)[None, :]
+    ys = np.asarray(ys, dtype=a.dtype)[None, :]
+    return (
+        (a.x0[:, None] - tolerance <= xs) & (xs <= a.x1[:, None] + tolerance) &
+        (a.y0[:, None] - tolerance <= ys) & (ys <= a.y1[:, None] + tolerance)
+    )
+
+
+@lru_cache(maxsize=64)
+def make_overlaps(tolerance: float = 0.0) -> Callable[[BBox, BBox], bool]:
+    """
+    Build an overlap test specialized for a fixed tolerance.
+
+    The returned function(a, b) gives the same result as a.overlaps(b,
+    tolerance) but skips the method dispatch and, for the common zero
+    tolerance, the four additions. Functions are cached per tolerance.
+    """
+    if tolerance == 0:
+        def overlaps(a: BBox, b: BBox) -> bool:
+            return a.x0 <= b.x1 and a.x1 >= b.x0 and a.y0 <= b.y1 and a.y1 >= b.y0
+    else:
+        def overlaps(a: BBox, b: BBox) -> bool:
+            return (
+                a.x0 <= b.x1 + tolerance and
+                a.x1 >= b.x0 - tolerance and
+                a.y0 <= b.y1 + tolerance and
+                a.y1 >= b.y0 - tolerance
+            )
+    return overlaps
+
+
+class SpatialGrid:
+    """
+    Uniform grid index over a fixed list of bboxes.
+
+    Every bbox is registered in each grid cell its extent touches, so a
+    query only tests the bboxes sharing a cell with it instead of scanning
+    the whole list. Results are indices into the original list.
+    """
+
+    def __init__(self, bboxes: Sequence[BBox], cell_size: float = 50.0) -> None:
+        if cell_size <= 0:
+            raise ValueError(f"cell_size ({cell_size}) must be positive")
+
+        self.bboxes = list(bboxes)
+        self.cell_size = cell_size
+        self._cells: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+        self._rows: Dict[int, List[int]] = defaultdict(list)
+
+        for index, bbox in enumerate(self.bboxes):
+            columns = self._span(bbox.x0, bbox.x1)
+            rows = self._span(bbox.y0, bbox.y1)
+            for row in rows:
+                self._rows[row].append(index)
+                for column in columns:
+                    self._cells[(column, row)].append(index)
+
+    def __len__(self) -> int:
+        return len(self.bboxes)
+
+    def _span(self, low: float, high: float) -> range:
+        """Grid indices covered by the closed interval [low, high]."""
+        return range(
+            math.floor(low / self.cell_size),
+            math.floor(high / self.cell_size) + 1
+        )
+
+    def candidates(self, bbox: BBox, margin: float = 0.0) -> Set[int]:
+        """Indices of bboxes sharing a cell with bbox expanded by margin."""
+        cells = self._cells
+        found = set()
+        for column in self._span(bbox.x0 - margin, bbox.x1 + margin):
+            for row in self._span(bbox.y0 - margin, bbox.y1 + margin):
+                found.update(cells.get((column, row), ()))
+        return found
+
+    def query_overlaps(self, bbox: BBox, tolerance: float = 0.0) -> List[int]:
+        """
+        Find bboxes overlapping the given bbox.
+
+        Args:
+            bbox: Query bounding box
+            tolerance: Passed through to BBox.overlaps
+
+        Returns:
+            Sorted indices of indexed bboxes for which overlaps() is True
+        """
+        bboxes = self.bboxes
+        overlaps = make_overlaps(tolerance)
+        return sorted(
+            index for index in self.candidates(bbox, max(tolerance, 0.0))
+            if overlaps(bboxes[index], bbox)
+        )
+
+    def all_pairs_same_line(self, tolerance: float = 2.0) -> List[Tuple[int, int]]:
+        """
+        Find every pair of indexed bboxes on the same text line.
+
+        Only bboxes in grid rows within tolerance of each other are compared
+        with BBox.same_line, instead of all N*(N-1)/2 pairs.
+
+        Returns:
+            Sorted (i, j) index pairs with i < j
+        """
+        bboxes = self.bboxes
+        rows = self._rows
+        margin = max(tolerance, 0.0)
+        pairs = set()
+
+        # same_line() holds for any pair involving a zero-height bbox
+        flat = [index for index, bbox in enumerate(bboxes) if bbox.height == 0]
+        for index in flat:
+            pairs.update(
+                (min(index, other), max(index, other))
+                for other in range(len(bboxes)) if other != index
+            )
+
+        for index, bbox in enumerate(bboxes):
+            # One extra row either side absorbs rounding in the center check
+            span = self._span(bbox.y0 - margin, bbox.y1 + margin)
+            candidates = set()
+            for row in range(span.start - 1, span.stop + 1):
+                candidates.update(rows.get(row, ()))
+
+            pairs.update(
+                (index, other) for other in candidates
+                if other > index and bbox.same_line(bboxes[other], tolerance)
+            )
+
+        return sorted(pairs)
+
+
+class BBoxIndex:
+    """
+    KD-tree over bbox centers for nearest-bbox queries.
+
+    Candidates come from the tree by center distance and are then ranked
+    by the exact BBox.distance_to_bbox. Since a bbox's distance can be
+    shorter than its center distance by at most the two half-diagonals,
+    the candidate set is widened until no unseen bbox could rank higher,
+    so results match a full scan.
+    """
+
+    def __init__(self, bboxes: Sequence[BBox]) -> None:
+        try:
+            from scipy.spatial import cKDTree  # scipy ships with scikit-learn
+        except ImportError as exc:
+            raise ImportError("BBoxIndex requires scipy; install pdf2md[spatial]") from exc
+
+        self.bboxes = list(bboxes)
+        array = BBoxArray.from_bboxes(self.bboxes)
+        self._tree = cKDTree(array.centers()) if self.bboxes else None
+        half_diagonals = np.hypot(array.x1 - array.x0, array.y1 - array.y0) / 2
+        self._max_radius = float(half_diagonals.max()) if self.bboxes else 0.0
+
+    def __len__(self) -> int:
+        return len(self.bboxes)
+
+    def nearest(self, bbox: BBox, k: int = 1) -> List[int]:
+        """
+        Find the indexed bboxes closest to the given bbox.
+
+        Args:
+            bbox: Query bounding box
+            k: Number of neighbours to return
+
+        Returns:
+            Indices of the k closest bboxes by distance_to_bbox, nearest
+            first (ties broken by index)
+        """
+        total = len(self.bboxes)
+        k = min(k, total)
+        if k <= 0:
+            return []
+
+        radius = hypot(bbox.width, bbox.height) / 2 + self._max_radius
+        count = min(total, max(2 * k, 16))
+
+        while True:
+            center_distances, indices = self._tree.query(bbox.center, k=count)
+            ranked = sorted(
+                (self.bboxes[index].distance_to_bbox(bbox), index)
+                for index in np.atleast_1d(indices).tolist()
+            )
+            if count == total:
+                break
+
+            # Every unseen bbox is at least this far away; the small slack
+            # covers rounding in the center distances
+            bound = float(np.atleast_1d(center_distances)[-1]) - radius - 1e-9
+            if ranked[k - 1][0] < bound:
+                break
+            count = min(total, count * 2)
+
+        return [index for _, index in ranked[:k]]
+
+
 def merge_bboxes(bboxes: List[BBox]) -> Optional[BBox]:
     """
     Merge multiple bboxes into a single bbox that encompasses all.
@@ -354,11 +930,33 @@ def merge_bboxes(bboxes: List[BBox]) -> Optional[BBox]:
     if not bboxes:
         return None
 
-    result = bboxes[0]
-    for bbox in bboxes[1:]:
-        result = result.union(bbox)
+    if len(bboxes) >= _ARRAY_THRESHOLD:
+        return merge_bbox_array(BBoxArray.from_bboxes(bboxes))
+
+    return BBox._unchecked(
+        min(bbox.x0 for bbox in bboxes),
+        min(bbox.y0 for bbox in bboxes),
+        max(bbox.x1 for bbox in bboxes),
+        max(bbox.y1 for bbox in bboxes)
+    )
+
 
-    return result
+def merge_bbox_array(array: BBoxArray) -> Optional[BBox]:
+    """
+    Merge every bbox in a BBoxArray into a single encompassing bbox.
+
+    Returns:
+        Single bbox containing all bboxes in the array, or None if it is empty
+    """
+    if len(array) == 0:
+        return None
+
+    return BBox(
+        float(array.x0.min()),
+        float(array.y0.min()),
+        float(array.x1.max()),
+        float(array.y1.max())
+    )
 
 
 def cluster_bboxes_by_position(
@@ -380,21 +978,26 @@ def cluster_bboxes_by_position(
     if not bboxes:
         return []
 
+    # Horizontal clusters run top to bottom (descending Y), vertical ones
+    # left to right (ascending X)
+    descending = direction == "horizontal"
+    position = attrgetter("center_y" if descending else "center_x")
+
+    if len(bboxes) >= _ARRAY_THRESHOLD:
+        return _cluster_bboxes_array(bboxes, position, descending, tolerance)
+
     # Sort by primary coordinate
-    if direction == "horizontal":
-        sorted_bboxes = sorted(bboxes, key=lambda b: b.center_y, reverse=True)
-    else:  # vertical
-        sorted_bboxes = sorted(bboxes, key=lambda b: b.center_x)
+    sorted_bboxes = sorted(bboxes, key=position, reverse=descending)
 
     clusters = []
     current_cluster = [sorted_bboxes[0]]
+    previous = position(sorted_bboxes[0])
 
     for bbox in sorted_bboxes[1:]:
         # Check if bbox belongs to current cluster
-        if direction == "horizontal":
-            distance = abs(bbox.center_y - current_cluster[-1].center_y)
-        else:
-            distance = abs(bbox.center_x - current_cluster[-1].center_x)
+        current = position(bbox)
+        distance = abs(current - previous)
+        previous = current
 
         if distance <= tolerance:
             current_cluster.append(bbox)
@@ -403,4 +1006,29 @@ def cluster_bboxes_by_position(
             current_cluster = [bbox]
 
     clusters.append(current_cluster)
-    return clusters
\ No newline at end of file
+    return clusters
+
+
+def _cluster_breaks(coords: np.ndarray, tolerance: float) -> np.ndarray:
+    """Indices in sorted coords where a new cluster starts."""
+    return np.flatnonzero(np.abs(np.diff(coords)) > tolerance) + 1
+
+
+def _cluster_bboxes_array(
+    bboxes: List[BBox],
+    position: Callable[[BBox], float],
+    descending: bool,
+    tolerance: float
+) -> List[List[BBox]]:
+    """Array-based cluster_bboxes_by_position for large inputs."""
+    # Only the one (cached) center coordinate is needed, not a full BBoxArray
+    coords = np.fromiter(map(position, bboxes), dtype=np.float64, count=len(bboxes))
+
+    # Stable argsort keeps ties in input order, like sorted() does
+    order = np.argsort(-coords if descending else coords, kind="stable")
+
+    breaks = _cluster_breaks(coords[order], float(tolerance))
+    return [
+        [bboxes[i] for i in group]
+        for group in np.split(order, breaks)
+    ]
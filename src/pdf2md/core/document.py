@@ -7,12 +7,58 @@ Document -> Page -> Block -> Word
 Each level maintains spatial information and relationships between elements.
 """
 
-from typing import List, Optional, Dict, Any, Iterator, Union
+from typing import (
+    List, Optional, Dict, Any, Iterator, Union, Callable, TextIO, NamedTuple, Tuple, Sequence
+)
 from dataclasses import dataclass, field
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
 from enum import Enum
+from functools import partial, wraps
+from itertools import chain, count
+from weakref import WeakValueDictionary
+import io
 import json
+import re
+import sys
 
-from .bbox import BBox
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the json module
+    orjson = None
+
+from .bbox import (
+    BBox, BBoxArray, batch_intersection_area, merge_bboxes, _ARRAY_THRESHOLD, _cluster_breaks
+)
+
+# Word and FontInfo exist once per token, so drop their per-instance
+# __dict__ where the interpreter supports slotted dataclasses (3.10+).
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# FontInfo is interned through a WeakValueDictionary, so it also needs a
+# __weakref__ slot, which dataclasses only add on 3.11+
+_WEAKREF_SLOTS = {"slots": True, "weakref_slot": True} if sys.version_info >= (3, 11) else {}
+
+# orjson only supports two-space indentation, so other indents use json
+_ORJSON_OPTIONS = (
+    orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    if orjson is not None else 0
+)
+
+# Thousands separators, currency and percent signs ignored by is_number
+_NUMBER_DECORATIONS = str.maketrans("", "", ",$%")
+
+# The grammar float() accepts: optional sign, digits with single
+# underscores between them, optional fraction and exponent, or inf/nan
+_DIGITS = r"\d(?:_?\d)*"
+_NUMBER_RE = re.compile(
+    rf"\s*[+-]?(?:(?:{_DIGITS}(?:\.(?:{_DIGITS})?)?|\.{_DIGITS})(?:e[+-]?{_DIGITS})?"
+    r"|inf(?:inity)?|nan)\s*",
+    re.IGNORECASE
+)
 
 
 class ElementType(Enum):
@@ -29,6 +75,10 @@ class ElementType(Enum):
     CAPTION = "caption"
     CODE = "code"
 
+    # Members are singletons compared by identity, so the C-level identity
+    # hash is valid and avoids Enum.__hash__, a Python call per dict lookup
+    __hash__ = object.__hash__
+
 
 class FontStyle(Enum):
     """Font style variations."""
@@ -37,8 +87,18 @@ class FontStyle(Enum):
     ITALIC = "italic"
     BOLD_ITALIC = "bold_italic"
 
+    __hash__ = object.__hash__
 
-@dataclass
+
+# Plain-dict lookups for the serialization and style hot paths, which run
+# per word and would otherwise go through Enum attribute descriptors
+_ELEMENT_TYPE_VALUES = {member: member.value for member in ElementType}
+_FONT_STYLE_VALUES = {member: member.value for member in FontStyle}
+_BOLD_STYLES = frozenset((FontStyle.BOLD, FontStyle.BOLD_ITALIC))
+_ITALIC_STYLES = frozenset((FontStyle.ITALIC, FontStyle.BOLD_ITALIC))
+
+
+@dataclass(**_WEAKREF_SLOTS)
 class FontInfo:
     """Font information for text elements."""
     name: str
@@ -46,25 +106,105 @@ class FontInfo:
     style: FontStyle = FontStyle.NORMAL
     color: Optional[str] = None
 
+    @classmethod
+    def intern(
+        cls,
+        name: str,
+        size: float,
+        style: FontStyle = FontStyle.NORMAL,
+        color: Optional[str] = None
+    ) -> "FontInfo":
+        """
+        Return a shared FontInfo for these attributes.
+
+        Documents use a handful of distinct fonts across thousands of words,
+        so parsers should intern them and store each combination once.
+        Interned instances are shared and must not be mutated.
+        """
+        key = (name, size, style, color)
+        font = _INTERNED_FONTS.get(key)
+        if font is None:
+            font = cls(name, size, style, color)
+            _INTERNED_FONTS[key] = font
+        return font
+
     def is_bold(self) -> bool:
         """Check if font is bold."""
-        return self.style in (FontStyle.BOLD, FontStyle.BOLD_ITALIC)
+        return self.style in _BOLD_STYLES
 
     def is_italic(self) -> bool:
         """Check if font is italic."""
-        return self.style in (FontStyle.ITALIC, FontStyle.BOLD_ITALIC)
+        return self.style in _ITALIC_STYLES
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
             "name": self.name,
             "size": self.size,
-            "style": self.style.value,
+            "style": _FONT_STYLE_VALUES[self.style],
             "color": self.color
         }
 
 
-@dataclass
+# Leading words that mark a block as a caption
+_CAPTION_PREFIXES = ("figure", "table", "image", "chart", "graph", "diagram")
+
+# Weak cache behind FontInfo.intern; entries vanish once no word uses them
+_INTERNED_FONTS: "WeakValueDictionary[Tuple[str, float, FontStyle, Optional[str]], FontInfo]" = WeakValueDictionary()
+
+# Set while Word.bulk_mode() is active in the current thread or task
+_SKIP_WORD_VALIDATION: ContextVar[bool] = ContextVar("_skip_word_validation", default=False)
+
+# Changes whenever any Block's words, Page's blocks or Document's pages
+# change; Document recomputes its cached aggregates when it moves on.
+# next() on a count is atomic, so concurrent changes never share a value.
+_REVISIONS = count()
+_revision = next(_REVISIONS)
+
+
+def _bump_revision() -> None:
+    """Mark every cached Document aggregate as out of date."""
+    global _revision
+    _revision = next(_REVISIONS)
+
+
+class _TrackedList(list):
+    """
+    List that calls on_change after every in-place modification.
+
+    Backs Block.words, Page.blocks and Document.pages so that memoized
+    analysis is dropped however the list is edited.
+    """
+    __slots__ = ("_on_change",)
+
+    def __init__(self, iterable: Any = (), on_change: Callable[[], None] = _bump_revision):
+        super().__init__(iterable)
+        self._on_change = on_change
+
+    def __reduce__(self):
+        return type(self), (list(self), self._on_change)
+
+
+def _notify_after(method: Callable) -> Callable:
+    """Wrap a list method so it reports the modification afterwards."""
+    @wraps(method)
+    def mutator(self: _TrackedList, *args: Any, **kwargs: Any) -> Any:
+        result = method(self, *args, **kwargs)
+        self._on_change()
+        return result
+
+    return mutator
+
+
+for _name in (
+    "append", "extend", "insert", "remove", "pop", "clear", "sort", "reverse",
+    "__setitem__", "__delitem__", "__iadd__", "__imul__"
+):
+    setattr(_TrackedList, _name, _notify_after(getattr(list, _name)))
+del _name
+
+
+@dataclass(**_SLOTS)
 class Word:
     """
     Individual word with spatial and font information.
@@ -79,11 +219,45 @@ class Word:
 
     def __post_init__(self):
         """Validate word data."""
+        if _SKIP_WORD_VALIDATION.get():
+            return
         if not self.text.strip():
             raise ValueError("Word text cannot be empty or whitespace only")
         if not (0.0 <= self.confidence <= 1.0):
             raise ValueError("Confidence must be between 0.0 and 1.0")
 
+    @classmethod
+    @contextmanager
+    def bulk_mode(cls) -> Iterator[None]:
+        """
+        Skip per-word validation while creating many words.
+
+        For parsers that construct words from already-cleaned input; pass
+        the results to validate_many() to check the whole batch at once.
+        The switch is per thread (and per asyncio task), so words created
+        concurrently elsewhere are still validated.
+        """
+        token = _SKIP_WORD_VALIDATION.set(True)
+        try:
+            yield
+        finally:
+            _SKIP_WORD_VALIDATION.reset(token)
+
+    @staticmethod
+    def validate_many(words: Sequence["Word"]) -> None:
+        """
+        Apply the per-word validation to a batch of words.
+
+        Raises:
+            ValueError: If any word has blank text or an out-of-range confidence
+        """
+        if not all(word.text.strip() for word in words):
+            raise ValueError("Word text cannot be empty or whitespace only")
+
+        confidences = np.fromiter((word.confidence for word in words), dtype=np.float64, count=len(words))
+        if not ((confidences >= 0.0) & (confidences <= 1.0)).all():
+            raise ValueError("Confidence must be between 0.0 and 1.0")
+
     @property
     def is_whitespace(self) -> bool:
         """Check if word contains only whitespace."""
@@ -97,11 +271,7 @@ class Word:
     @property
     def is_number(self) -> bool:
         """Check if word is a number."""
-        try:
-            float(self.text.strip().replace(',', '').replace('$', '').replace('%', ''))
-            return True
-        except ValueError:
-            return False
+        return _NUMBER_RE.fullmatch(self.text.translate(_NUMBER_DECORATIONS)) is not None
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -110,17 +280,53 @@ class Word:
             "bbox": self.bbox.to_dict(),
             "font": self.font.to_dict(),
             "confidence": self.confidence,
-            "element_type": self.element_type.value
+            "element_type": _ELEMENT_TYPE_VALUES[self.element_type]
         }
 
 
-@dataclass
+class _FontStats(NamedTuple):
+    """Font statistics of a Block, computed together in one pass."""
+    dominant: Optional[FontInfo]
+    unique: Tuple[FontInfo, ...]
+    avg_size: float
+    has_bold: bool
+    has_italic: bool
+
+
+def _reset_block_cache(cache: Dict[str, Any]) -> None:
+    """Drop a Block's memoized analysis after its words changed."""
+    cache.clear()
+    _bump_revision()
+
+
+def _cached_block_property(func: Callable[["Block"], Any]) -> property:
+    """Property computed once from a Block's words and kept in its _cache."""
+    name = func.__name__
+
+    @wraps(func)
+    def getter(self: "Block") -> Any:
+        cache = self._cache
+        try:
+            return cache[name]
+        except KeyError:
+            value = cache[name] = func(self)
+            return value
+
+    return property(getter)
+
+
+@dataclass(**_SLOTS)
 class Block:
     """
     Block of related words forming a coherent text unit.
 
     Could be a paragraph, heading, table cell, caption, etc.
+
+    Word-derived properties are memoized. words is kept in a list that
+    resets the memoized values on any change, including reassignment.
     """
+    # Declared first so it exists by the time __init__ assigns words
+    _cache: Dict[str, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
     words: List[Word] = field(default_factory=list)
     element_type: ElementType = ElementType.PARAGRAPH
     confidence: float = 1.0
@@ -131,84 +337,97 @@ class Block:
         if not (0.0 <= self.confidence <= 1.0):
             raise ValueError("Confidence must be between 0.0 and 1.0")
 
-    @property
+    def __setattr__(self, name: str, value: Any) -> None:
+        # "words += [...]" reassigns the same, already tracked list
+        if name == "words" and value is not getattr(self, "words", None):
+            value = _TrackedList(value, partial(_reset_block_cache, self._cache))
+            _reset_block_cache(self._cache)
+        object.__setattr__(self, name, value)
+
+    @_cached_block_property
     def text(self) -> str:
         """Get full text content of the block."""
-        return " ".join(word.text for word in self.words if not word.is_whitespace)
+        # Words are validated to be non-blank, so there is nothing to filter
+        return " ".join([word.text for word in self.words])
 
-    @property
+    @_cached_block_property
     def bbox(self) -> Optional[BBox]:
         """Get bounding box encompassing all words."""
         if not self.words:
             return None
 
-        word_bboxes = [word.bbox for word in self.words]
-        if len(word_bboxes) == 1:
-            return word_bboxes[0]
+        if len(self.words) == 1:
+            return self.words[0].bbox
 
-        result = word_bboxes[0]
-        for bbox in word_bboxes[1:]:
-            result = result.union(bbox)
-        return result
+        # One min/max reduction (vectorized for long blocks) instead of
+        # allocating an intermediate BBox per union step
+        return merge_bboxes([word.bbox for word in self.words])
 
     @property
     def font_info(self) -> List[FontInfo]:
         """Get unique font information from all words."""
-        fonts = {}
-        for word in self.words:
-            key = (word.font.name, word.font.size, word.font.style)
-            fonts[key] = word.font
-        return list(fonts.values())
+        return list(self._font_stats.unique)
 
     @property
     def dominant_font(self) -> Optional[FontInfo]:
         """Get the most common font in the block."""
-        if not self.words:
-            return None
-
-        font_counts = {}
-        for word in self.words:
-            key = (word.font.name, word.font.size, word.font.style)
-            font_counts[key] = font_counts.get(key, 0) + 1
-
-        if not font_counts:
-            return None
-
-        dominant_key = max(font_counts.keys(), key=lambda k: font_counts[k])
-        # Find first word with this font to get the FontInfo object
-        for word in self.words:
-            if (word.font.name, word.font.size, word.font.style) == dominant_key:
-                return word.font
-
-        return None
+        return self._font_stats.dominant
 
     @property
     def avg_font_size(self) -> float:
         """Get average font size in the block."""
-        if not self.words:
-            return 0.0
-        return sum(word.font.size for word in self.words) / len(self.words)
+        return self._font_stats.avg_size
 
     @property
     def has_bold(self) -> bool:
         """Check if block contains any bold text."""
-        return any(word.font.is_bold() for word in self.words)
+        return self._font_stats.has_bold
 
     @property
     def has_italic(self) -> bool:
         """Check if block contains any italic text."""
-        return any(word.font.is_italic() for word in self.words)
+        return self._font_stats.has_italic
 
-    @property
+    @_cached_block_property
+    def _font_stats(self) -> _FontStats:
+        """Gather every font statistic of the block in one pass over its words."""
+        if not self.words:
+            return _FontStats(None, (), 0.0, False, False)
+
+        # Fonts are keyed by name, size and style. The dominant font is the
+        # first FontInfo seen for the most common key, while the unique
+        # list keeps the last FontInfo per key.
+        fonts = [word.font for word in self.words]
+        keys = [(font.name, font.size, font.style) for font in fonts]
+
+        # Counter counts in C and keeps first-seen order, so most_common
+        # breaks ties towards the earliest key
+        (dominant_key, _), = Counter(keys).most_common(1)
+        unique = dict(zip(keys, fonts))
+
+        return _FontStats(
+            dominant=fonts[keys.index(dominant_key)],
+            unique=tuple(unique.values()),
+            avg_size=sum(font.size for font in fonts) / len(fonts),
+            has_bold=any(font.is_bold() for font in unique.values()),
+            has_italic=any(font.is_italic() for font in unique.values())
+        )
+
+    @_cached_block_property
     def is_all_caps(self) -> bool:
         """Check if all text is uppercase."""
-        text = self.text
-        return text and text.isupper() and any(c.isalpha() for c in text)
+        # isupper() is False unless the text has at least one cased character
+        return self.text.isupper()
+
+    @_cached_block_property
+    def _text_lower(self) -> str:
+        """Lowercased block text for case-insensitive checks."""
+        return self.text.lower()
 
     @property
     def word_count(self) -> int:
-        """Get number of words (excluding whitespace)."""
-        return len([w for w in self.words if not w.is_whitespace])
+        """Get number of words (whitespace-only words are rejected on creation)."""
+        return len(self.words)
 
     def add_word(self, word: Word) -> None:
         """Add a word to the block."""
@@ -275,11 +494,7 @@ class Block:
         is_small = dominant.size <= 10
         is_italic = dominant.is_italic()
 
-        text_lower = self.text.lower()
-        starts_with_label = any(
-            text_lower.startswith(label)
-            for label in ["figure", "table", "image", "chart", "graph", "diagram"]
-        )
+        starts_with_label = self._text_lower.startswith(_CAPTION_PREFIXES)
 
         return (is_small and is_italic) or starts_with_label
 
@@ -289,7 +504,7 @@ class Block:
             "text": self.text,
             "bbox": self.bbox.to_dict() if self.bbox else None,
             "words": [word.to_dict() for word in self.words],
-            "element_type": self.element_type.value,
+            "element_type": _ELEMENT_TYPE_VALUES[self.element_type],
             "confidence": self.confidence,
             "metadata": self.metadata,
             "dominant_font": self.dominant_font.to_dict() if self.dominant_font else None,
@@ -305,6 +520,35 @@ class Block:
         }
 
 
+class WordArrays:
+    """
+    Structure-of-arrays view of every word on a page.
+
+    Holds word coordinates and font sizes as NumPy columns so page-wide
+    spatial scans can run vectorized; the Word objects remain the source
+    of truth for text and font details.
+
+    Attributes:
+        bboxes: Word bounding boxes in page order
+        font_sizes: Font size of each word
+        block_offsets: Block i owns words block_offsets[i]:block_offsets[i + 1]
+    """
+
+    __slots__ = ("bboxes", "font_sizes", "block_offsets")
+
+    def __init__(self, bboxes: BBoxArray, font_sizes: np.ndarray, block_offsets: np.ndarray) -> None:
+        self.bboxes = bboxes
+        self.font_sizes = font_sizes
+        self.block_offsets = block_offsets
+
+    def __len__(self) -> int:
+        return len(self.bboxes)
+
+    def block_slice(self, index: int) -> slice:
+        """Get the slice of word rows belonging to the block at index."""
+        return slice(int(self.block_offsets[index]), int(self.block_offsets[index + 1]))
+
+
 @dataclass
 class Page:
     """
@@ -322,6 +566,12 @@ class Page:
         if self.number < 0:
             raise ValueError("Page number must be non-negative")
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "blocks" and value is not getattr(self, "blocks", None):
+            value = _TrackedList(value)
+            _bump_revision()
+        object.__setattr__(self, name, value)
+
     @property
     def text(self) -> str:
         """Get full text content of the page."""
@@ -340,20 +590,41 @@ class Page:
     @property
     def all_words(self) -> List[Word]:
         """Get all words from all blocks."""
-        words = []
-        for block in self.blocks:
-            words.extend(block.words)
-        return words
+        return list(self.iter_words())
+
+    def iter_words(self) -> Iterator[Word]:
+        """Iterate over all words from all blocks without building a list."""
+        return chain.from_iterable(block.words for block in self.blocks)
 
     @property
     def unique_fonts(self) -> List[FontInfo]:
         """Get unique font information from all words."""
+        # Merge the blocks' memoized font sets instead of re-walking every
+        # word; each block lists keys in first-seen order with the last
+        # FontInfo per key, so the merged result is the same as a word scan
         fonts = {}
-        for word in self.all_words:
-            key = (word.font.name, word.font.size, word.font.style)
-            fonts[key] = word.font
+        for block in self.blocks:
+            for font in block._font_stats.unique:
+                fonts[(font.name, font.size, font.style)] = font
         return list(fonts.values())
 
+    def word_arrays(self, dtype: np.dtype = np.float64) -> WordArrays:
+        """
+        Pack all words on the page into a WordArrays structure.
+
+        Built on demand from the current blocks, so callers that run several
+        vectorized queries should keep the result rather than call again.
+        """
+        words = self.all_words
+        coords = np.array(
+            [(w.bbox.x0, w.bbox.y0, w.bbox.x1, w.bbox.y1) for w in words],
+            dtype=dtype
+        ).reshape(-1, 4)
+        font_sizes = np.fromiter((w.font.size for w in words), dtype=dtype, count=len(words))
+        block_offsets = np.zeros(len(self.blocks) + 1, dtype=np.intp)
+        np.cumsum([len(block.words) for block in self.blocks], out=block_offsets[1:])
+        return WordArrays(BBoxArray(*coords.T, dtype=dtype), font_sizes, block_offsets)
+
     def add_block(self, block: Block) -> None:
         """Add a block to the page."""
         self.blocks.append(block)
@@ -364,11 +635,23 @@ class Page:
 
     def get_blocks_in_bbox(self, bbox: BBox, overlap_threshold: float = 0.5) -> List[Block]:
         """Get blocks that significantly overlap with the given bbox."""
-        matching_blocks = []
-        for block in self.blocks:
-            if block.bbox and block.bbox.intersection_ratio(bbox) >= overlap_threshold:
-                matching_blocks.append(block)
-        return matching_blocks
+        blocks = [block for block in self.blocks if block.bbox]
+        if len(blocks) < _ARRAY_THRESHOLD:
+            return [
+                block for block in blocks
+                if block.bbox.intersection_ratio(bbox) >= overlap_threshold
+            ]
+
+        # Vectorized BBox.intersection_ratio against every block at once
+        boxes = BBoxArray.from_bboxes([block.bbox for block in blocks])
+        areas = batch_intersection_area(boxes, BBoxArray.from_bboxes([bbox]))[:, 0]
+        smaller_areas = np.minimum(boxes.areas, bbox.area)
+        ratios = np.divide(
+            areas, smaller_areas,
+            out=np.zeros_like(areas),
+            where=(areas != 0) & (smaller_areas > 0)
+        )
+        return [blocks[i] for i in np.flatnonzero(ratios >= overlap_threshold)]
 
     def sort_blocks_reading_order(self) -> None:
         """Sort blocks in reading order (top-to-bottom, left-to-right)."""
@@ -380,7 +663,14 @@ class Page:
             # Secondary sort: left to right
             return (-block.bbox.center_y, block.bbox.center_x)
 
-        self.blocks.sort(key=reading_order_key)
+        if len(self.blocks) < _ARRAY_THRESHOLD:
+            self.blocks.sort(key=reading_order_key)
+            return
+
+        keys = np.array([reading_order_key(b) for b in self.blocks], dtype=np.float64)
+        # lexsort is stable and treats its last key as the primary one
+        order = np.lexsort((keys[:, 1], keys[:, 0]))
+        self.blocks[:] = [self.blocks[i] for i in order]
 
     def detect_columns(self, tolerance: float = 10.0) -> List[List[Block]]:
         """
@@ -400,28 +690,21 @@ class Page:
         if not blocks_with_bbox:
             return []
 
-        # Sort by X position
-        blocks_with_bbox.sort(key=lambda b: b.bbox.center_x)
+        bboxes = [b.bbox for b in blocks_with_bbox]
+        cx = np.fromiter((bbox.center_x for bbox in bboxes), dtype=np.float64, count=len(bboxes))
+        cy = np.fromiter((bbox.center_y for bbox in bboxes), dtype=np.float64, count=len(bboxes))
 
-        columns = []
-        current_column = [blocks_with_bbox[0]]
-
-        for block in blocks_with_bbox[1:]:
-            # Check if block belongs to current column
-            if any(
-                abs(block.bbox.center_x - existing.bbox.center_x) <= tolerance
-                for existing in current_column
-            ):
-                current_column.append(block)
-            else:
-                columns.append(current_column)
-                current_column = [block]
-
-        columns.append(current_column)
+        # Sorted by X, a block joins the current column iff it is within
+        # tolerance of its left neighbour (the column's rightmost block),
+        # so columns break wherever consecutive centers are further apart.
+        order = np.argsort(cx, kind="stable")
+        breaks = _cluster_breaks(cx[order], float(tolerance))
 
-        # Sort blocks within each column by Y position (top to bottom)
-        for column in columns:
-            column.sort(key=lambda b: -b.bbox.center_y)
+        columns = []
+        for group in np.split(order, breaks):
+            # Sort blocks within each column by Y position (top to bottom)
+            group = group[np.argsort(-cy[group], kind="stable")]
+            columns.append([blocks_with_bbox[i] for i in group])
 
         return columns
 
@@ -441,28 +724,59 @@ class Page:
         }
 
 
+def _cached_document_property(func: Callable[["Document"], Any]) -> property:
+    """Property kept in a Document's _cache until the document tree changes."""
+    name = func.__name__
+
+    @wraps(func)
+    def getter(self: "Document") -> Any:
+        cache = self._cache
+        if self._cache_revision != _revision:
+            cache.clear()
+            self._cache_revision = _revision
+        try:
+            return cache[name]
+        except KeyError:
+            value = cache[name] = func(self)
+            return value
+
+    return property(getter)
+
+
 @dataclass
 class Document:
     """
     Complete document containing all pages and document-level metadata.
 
     Provides high-level operations across the entire document.
+
+    Document-wide aggregates are cached until any page, block or word
+    list beneath the document changes; call clear_cache() after editing
+    individual words in place.
     """
     pages: List[Page] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
     source_path: Optional[str] = None
+    _cache: Dict[str, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _cache_revision: int = field(default=-1, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == "pages" and value is not getattr(self, "pages", None):
+            value = _TrackedList(value)
+            _bump_revision()
+        object.__setattr__(self, name, value)
 
     @property
     def page_count(self) -> int:
         """Get number of pages in the document."""
         return len(self.pages)
 
-    @property
+    @_cached_document_property
     def total_word_count(self) -> int:
         """Get total word count across all pages."""
         return sum(page.word_count for page in self.pages)
 
-    @property
+    @_cached_document_property
     def total_block_count(self) -> int:
         """Get total block count across all pages."""
         return sum(page.block_count for page in self.pages)
@@ -470,12 +784,21 @@ class Document:
     @property
     def all_unique_fonts(self) -> List[FontInfo]:
         """Get unique font information from entire document."""
+        return list(self._unique_fonts)
+
+    @_cached_document_property
+    def _unique_fonts(self) -> Tuple[FontInfo, ...]:
+        """Unique fonts across all pages, keyed by name, size and style."""
         fonts = {}
         for page in self.pages:
             for font in page.unique_fonts:
                 key = (font.name, font.size, font.style)
                 fonts[key] = font
-        return list(fonts.values())
+        return tuple(fonts.values())
+
+    def clear_cache(self) -> None:
+        """Drop cached document-wide aggregates."""
+        self._cache.clear()
 
     def add_page(self, page: Page) -> None:
         """Add a page to the document."""
@@ -497,23 +820,23 @@ class Document:
         if not fonts:
             return {"error": "No fonts found"}
 
-        # Group fonts by size
-        size_groups = {}
-        for font in fonts:
-            size = font.size
-            if size not in size_groups:
-                size_groups[size] = []
-            size_groups[size].append(font)
+        # Group fonts by size: unique sizes come back ascending, and a stable
+        # sort of the inverse indices keeps each group in font order
+        sizes = np.fromiter((font.size for font in fonts), dtype=np.float64, count=len(fonts))
+        _, first, inverse, counts = np.unique(
+            sizes, return_index=True, return_inverse=True, return_counts=True
+        )
+        groups = np.split(np.argsort(inverse, kind="stable"), np.cumsum(counts)[:-1])
 
-        # Sort sizes in descending order
-        sorted_sizes = sorted(size_groups.keys(), reverse=True)
+        # Report each size as given by its first font, largest first
+        sorted_sizes = [fonts[i].size for i in first[::-1]]
 
         hierarchy = {}
-        for i, size in enumerate(sorted_sizes):
+        for i, (size, group) in enumerate(zip(sorted_sizes, groups[::-1])):
             level = f"level_{i + 1}"
             hierarchy[level] = {
                 "size": size,
-                "fonts": [f.to_dict() for f in size_groups[size]],
+                "fonts": [fonts[j].to_dict() for j in group],
                 "likely_role": _infer_typography_role(size, sorted_sizes, i)
             }
 
@@ -521,8 +844,8 @@ class Document:
             "hierarchy": hierarchy,
             "total_font_variations": len(fonts),
             "size_range": {
-                "min": min(sorted_sizes) if sorted_sizes else 0,
-                "max": max(sorted_sizes) if sorted_sizes else 0
+                "min": sorted_sizes[-1],
+                "max": sorted_sizes[0]
             }
         }
 
@@ -530,6 +853,12 @@ class Document:
         """Convert to dictionary."""
         return {
             "pages": [page.to_dict() for page in self.pages],
+            **self._summary_dict()
+        }
+
+    def _summary_dict(self) -> Dict[str, Any]:
+        """Document-level entries of to_dict(), everything except pages."""
+        return {
             "metadata": self.metadata,
             "source_path": self.source_path,
             "analysis": {
@@ -541,9 +870,57 @@ class Document:
             }
         }
 
-    def to_json(self, indent: int = 2) -> str:
+    def to_json(self, indent: Optional[int] = 2) -> str:
         """Convert to JSON string."""
-        return json.dumps(self.to_dict(), indent=indent)
+        buffer = io.StringIO()
+        self.dump_json(buffer, indent=indent)
+        return buffer.getvalue()
+
+    def to_json_bytes(self, indent: Optional[int] = 2) -> bytes:
+        """Convert to UTF-8 encoded JSON, ready to write to a binary file."""
+        if orjson is not None and indent == 2:
+            return orjson.dumps(self.to_dict(), option=_ORJSON_OPTIONS)
+        return self.to_json(indent=indent).encode("utf-8")
+
+    def dump_json(self, fp: TextIO, indent: Optional[int] = 2) -> None:
+        """
+        Write the document as JSON to a text file object, page by page.
+
+        Produces the text of json.dumps(self.to_dict(), indent=indent), but
+        only one page's dictionary exists at a time, so peak memory follows
+        the largest page instead of the whole document. With orjson
+        installed the default indent is encoded by orjson, which writes
+        non-ASCII characters as-is instead of escaping them.
+
+        Args:
+            fp: Writable text file object
+            indent: JSON indentation, or None for a single line
+        """
+        if indent is None:
+            separator = ", "
+
+            def newline(depth: int) -> str:
+                return ""
+        else:
+            separator = ","
+            unit = " " * indent if isinstance(indent, int) else indent
+
+            def newline(depth: int) -> str:
+                return "\n" + unit * depth
+
+        def encode(value: Any, depth: int) -> str:
+            # JSON strings never contain raw newlines, so every newline in
+            # the output is indentation that can be shifted to this depth
+            return _json_dumps(value, indent).replace("\n", newline(depth))
+
+        fp.write("{" + newline(1) + '"pages": [')
+        for i, page in enumerate(self.pages):
+            fp.write((separator if i else "") + newline(2) + encode(page.to_dict(), 2))
+        fp.write((newline(1) if self.pages else "") + "]")
+
+        for key, value in self._summary_dict().items():
+            fp.write(separator + newline(1) + json.dumps(key) + ": " + encode(value, 1))
+        fp.write(newline(0) + "}")
 
     def __iter__(self) -> Iterator[Page]:
         """Iterate over pages."""
@@ -558,6 +935,13 @@ class Document:
         return self.pages[index]
 
 
+def _json_dumps(value: Any, indent: Optional[int]) -> str:
+    """Encode value as JSON, using orjson for the default indent when available."""
+    if orjson is not None and indent == 2:
+        return orjson.dumps(value, option=_ORJSON_OPTIONS).decode("utf-8")
+    return json.dumps(value, indent=indent)
+
+
 def _infer_typography_role(size: float, all_sizes: List[float], position: int) -> str:
     """Infer the likely role of a font size in the document hierarchy."""
     if position == 0 and size >= 18:
@@ -5,26 +5,34 @@ These exceptions provide specific error types for different failure modes
 in the PDF to Markdown conversion process.
 """
 
+from typing import Sequence
+
 
 class PDF2MDError(Exception):
     """Base exception for all PDF2MD library errors."""
     pass
 
 
+def _with_details(message: str, **details) -> str:
+    """Append the given non-None context values to an exception message."""
+    parts = [f"{name}={value}" for name, value in details.items() if value is not None]
+    return f"{message} ({', '.join(parts)})" if parts else message
+
+
 class QualityError(PDF2MDError):
     """Raised when PDF quality assessment fails or quality is too poor to process."""
 
-    def __init__(self, message: str, quality_score: float = None, issues: list = None):
+    def __init__(self, message: str, quality_score: float = None, issues: Sequence[str] = None):
         super().__init__(message)
         self.quality_score = quality_score
-        self.issues = issues or []
+        self.issues = tuple(issues or ())
 
 
 class SpatialAnalysisError(PDF2MDError):
     """Raised when spatial analysis or layout detection fails."""
 
     def __init__(self, message: str, page_number: int = None, bbox_count: int = None):
-        super().__init__(message)
+        super().__init__(_with_details(message, page_number=page_number, bbox_count=bbox_count))
         self.page_number = page_number
         self.bbox_count = bbox_count
 
@@ -33,7 +41,7 @@ class PDFLoadError(PDF2MDError):
     """Raised when PDF cannot be loaded or is corrupted."""
 
     def __init__(self, message: str, pdf_path: str = None, error_details: str = None):
-        super().__init__(message)
+        super().__init__(_with_details(message, pdf_path=pdf_path))
         self.pdf_path = pdf_path
         self.error_details = error_details
 
@@ -50,7 +58,7 @@ class MarkdownGenerationError(PDF2MDError):
     """Raised when markdown generation fails."""
 
     def __init__(self, message: str, page_number: int = None, element_count: int = None):
-        super().__init__(message)
+        super().__init__(_with_details(message, page_number=page_number, element_count=element_count))
         self.page_number = page_number
         self.element_count = element_count
 
@@ -59,7 +67,7 @@ class TypographyAnalysisError(PDF2MDError):
     """Raised when typography analysis fails to detect document structure."""
 
     def __init__(self, message: str, font_count: int = None, size_variations: int = None):
-        super().__init__(message)
+        super().__init__(_with_details(message, font_count=font_count, size_variations=size_variations))
         self.font_count = font_count
         self.size_variations = size_variations
 
@@ -68,7 +76,7 @@ class TableDetectionError(PDF2MDError):
     """Raised when table detection or reconstruction fails."""
 
     def __init__(self, message: str, drawing_count: int = None, text_blocks: int = None):
-        super().__init__(message)
+        super().__init__(_with_details(message, drawing_count=drawing_count, text_blocks=text_blocks))
         self.drawing_count = drawing_count
         self.text_blocks = text_blocks
 
@@ -76,7 +84,7 @@ class TableDetectionError(PDF2MDError):
 class ColumnDetectionError(SpatialAnalysisError):
     """Raised when column detection fails."""
 
-    def __init__(self, message: str, detected_columns: int = None, x_positions: list = None):
-        super().__init__(message)
+    def __init__(self, message: str, detected_columns: int = None, x_positions: Sequence[float] = None):
+        super().__init__(_with_details(message, detected_columns=detected_columns))
         self.detected_columns = detected_columns
-        self.x_positions = x_positions or []
\ No newline at end of file
+        self.x_positions = tuple(x_positions or ())
\ No newline at end of file
@@ -5,12 +5,61 @@ Converts our Document model to clean markdown while preserving
 spatial relationships and document structure.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, Sequence, TextIO, Tuple
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import chain
+from operator import attrgetter
 import re
-from io import StringIO
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to plain Python
+    njit = None
 
 from ..core.document import Document, Page, Block, Word, ElementType
-from ..core.bbox import BBox
+from ..core.bbox import BBox, BBoxArray, _ARRAY_THRESHOLD
+
+# Written between consecutive pages
+_PAGE_SEPARATOR = "\n\n---\n\n"
+
+# Coordinates of a BBox in BBoxArray column order
+_BBOX_COORDS = attrgetter("x0", "y0", "x1", "y1")
+
+# Document metadata written to the YAML frontmatter, in output order
+_RELEVANT_META_KEYS = (
+    "title", "author", "subject", "creator", "producer",
+    "creation_date", "modification_date", "page_count"
+)
+
+# ATX heading markers, indexed by heading level
+_ATX_PREFIXES = ("", "# ", "## ", "### ", "#### ", "##### ", "###### ")
+
+# Emphasis markers wrapped around a paragraph, indexed by 2 * bold + italic
+_EMPHASIS_MARKERS = ("", "*", "**", "***")
+
+
+@lru_cache(maxsize=64)
+def _underline(char: str, length: int) -> str:
+    """Setext underline of the given length; headings repeat similar lengths."""
+    return char * length
+
+
+def _reading_order(bboxes: Sequence[Optional[BBox]]) -> List[int]:
+    """
+    Indices of bboxes sorted top to bottom, then left to right.
+
+    Missing bboxes sort as if centered on the origin; ties keep their order.
+    """
+    keys = [(-bbox.center_y, bbox.center_x) if bbox else (0, 0) for bbox in bboxes]
+    if len(keys) < _ARRAY_THRESHOLD:
+        return sorted(range(len(keys)), key=keys.__getitem__)
+
+    keys = np.array(keys, dtype=np.float64)
+    # lexsort is stable and treats its last key as the primary one
+    return np.lexsort((keys[:, 1], keys[:, 0])).tolist()
 
 
 class MarkdownExporter:
@@ -45,123 +94,128 @@ class MarkdownExporter:
         self.max_line_length = max_line_length
         self.heading_style = heading_style
 
+        # Formatter for each element type; anything else is a paragraph
+        self._formatters = {
+            ElementType.HEADER: self._format_header,
+            ElementType.TITLE: self._format_title,
+            ElementType.CAPTION: self._format_caption,
+            ElementType.CODE: self._format_code,
+            ElementType.LIST_ITEM: self._format_list_item,
+        }
+
     def export(self, document: Document) -> str:
         """Export document to markdown string."""
-        output = StringIO()
+        return "".join(self._iter_markdown(document))
+
+    def export_to(self, document: Document, out: TextIO) -> None:
+        """
+        Export document to markdown, writing it to a text stream.
 
+        Pages are written as they are exported, so the whole document is
+        never held in memory as one string.
+
+        Args:
+            document: Document to export
+            out: Writable text stream, e.g. a file opened in text mode
+        """
+        for part in self._iter_markdown(document):
+            out.write(part)
+
+    def _iter_markdown(self, document: Document) -> Iterator[str]:
+        """Yield the markdown for a document piece by piece, in output order."""
         # Add metadata frontmatter if requested
         if self.include_metadata and document.metadata:
-            self._write_frontmatter(output, document.metadata)
+            yield self._format_frontmatter(document.metadata)
 
         # Process each page
         for page_index, page in enumerate(document.pages):
             if page_index > 0:
-                output.write("\n\n---\n\n")  # Page separator
-
-            page_markdown = self._export_page(page)
-            output.write(page_markdown)
+                yield _PAGE_SEPARATOR
 
-        return output.getvalue()
+            yield self._export_page(page)
 
-    def _write_frontmatter(self, output: StringIO, metadata: Dict[str, Any]) -> None:
-        """Write YAML frontmatter with document metadata."""
-        output.write("---\n")
+    def _format_frontmatter(self, metadata: Dict[str, Any]) -> str:
+        """Format YAML frontmatter with document metadata."""
+        lines = ["---\n"]
 
         # Include relevant metadata
-        relevant_keys = [
-            "title", "author", "subject", "creator", "producer",
-            "creation_date", "modification_date", "page_count"
-        ]
-
-        for key in relevant_keys:
+        for key in _RELEVANT_META_KEYS:
             if key in metadata and metadata[key]:
                 value = metadata[key]
                 if isinstance(value, str):
                     # Escape quotes in YAML
-                    value = value.replace('"', '\\"')
-                    output.write(f'{key}: "{value}"\n')
+                    if '"' in value:
+                        value = value.replace('"', '\\"')
+                    lines.append(f'{key}: "{value}"\n')
                 else:
-                    output.write(f'{key}: {value}\n')
+                    lines.append(f'{key}: {value}\n')
 
-        output.write("---\n\n")
+        lines.append("---\n\n")
+        return "".join(lines)
 
     def _export_page(self, page: Page) -> str:
         """Export a single page to markdown."""
         if not page.blocks:
             return ""
 
-        # Sort blocks in reading order if not already done
-        sorted_blocks = self._sort_blocks_for_export(page)
-
-        # Group blocks by columns if preserving column structure
+        # Group blocks by columns if preserving column structure; each
+        # column comes back sorted top to bottom
+        sorted_blocks = None
         if self.preserve_columns:
             columns = page.detect_columns()
             if len(columns) > 1:
                 return self._export_multi_column_page(columns)
+            # A single column holding every block is already in reading
+            # order (ties left to right), so it needn't be sorted again
+            if columns and len(columns[0]) == len(page.blocks):
+                sorted_blocks = columns[0]
+
+        # Sort blocks in reading order if not already done
+        if sorted_blocks is None:
+            sorted_blocks = self._sort_blocks_for_export(page)
 
         # Regular single-column export
-        output = StringIO()
+        parts = []
         for block in sorted_blocks:
             block_markdown = self._export_block(block)
             if block_markdown.strip():
-                output.write(block_markdown)
-                output.write("\n\n")
+                parts.append(block_markdown)
+                parts.append("\n\n")
 
-        return output.getvalue()
+        return "".join(parts)
 
     def _sort_blocks_for_export(self, page: Page) -> List[Block]:
         """Sort blocks in optimal reading order."""
-        blocks = page.blocks.copy()
-
-        # Sort by reading order (top to bottom, left to right)
-        def reading_order_key(block: Block) -> tuple:
-            if not block.bbox:
-                return (0, 0)
-            # Primary: Y coordinate (top to bottom, higher Y first in PDF)
-            # Secondary: X coordinate (left to right)
-            return (-block.bbox.center_y, block.bbox.center_x)
-
-        blocks.sort(key=reading_order_key)
-        return blocks
+        # Top to bottom (higher Y first in PDF coordinates), then left to right
+        blocks = page.blocks
+        return [blocks[i] for i in _reading_order([block.bbox for block in blocks])]
 
     def _export_multi_column_page(self, columns: List[List[Block]]) -> str:
         """Export page with multiple columns."""
-        output = StringIO()
+        parts = []
 
         # Export each column separately
         for column_index, column_blocks in enumerate(columns):
             if column_index > 0:
-                output.write("\n\n<!-- Column Break -->\n\n")
+                parts.append("\n\n<!-- Column Break -->\n\n")
 
             for block in column_blocks:
                 block_markdown = self._export_block(block)
                 if block_markdown.strip():
-                    output.write(block_markdown)
-                    output.write("\n\n")
+                    parts.append(block_markdown)
+                    parts.append("\n\n")
 
-        return output.getvalue()
+        return "".join(parts)
 
     def _export_block(self, block: Block) -> str:
         """Export a single block to markdown."""
-        if not block.text.strip():
-            return ""
-
         text = block.text.strip()
+        if not text:
+            return ""
 
         # Handle different element types
-        if block.element_type == ElementType.HEADER:
-            return self._format_header(text, block)
-        elif block.element_type == ElementType.TITLE:
-            return self._format_title(text, block)
-        elif block.element_type == ElementType.CAPTION:
-            return self._format_caption(text, block)
-        elif block.element_type == ElementType.CODE:
-            return self._format_code(text, block)
-        elif block.element_type == ElementType.LIST_ITEM:
-            return self._format_list_item(text, block)
-        else:
-            # Regular paragraph
-            return self._format_paragraph(text, block)
+        formatter = self._formatters.get(block.element_type, self._format_paragraph)
+        return formatter(text, block)
 
     def _format_header(self, text: str, block: Block) -> str:
         """Format text as markdown header."""
@@ -169,22 +223,22 @@ class MarkdownExporter:
         level = self._determine_header_level(block)
 
         if self.heading_style == "atx":
-            return f"{'#' * level} {text}"
+            return _ATX_PREFIXES[level] + text
         else:  # setext
             if level == 1:
-                return f"{text}\n{'=' * len(text)}"
+                return text + "\n" + _underline("=", len(text))
             elif level == 2:
-                return f"{text}\n{'-' * len(text)}"
+                return text + "\n" + _underline("-", len(text))
             else:
                 # Fall back to atx for level 3+
-                return f"{'#' * level} {text}"
+                return _ATX_PREFIXES[level] + text
 
     def _format_title(self, text: str, block: Block) -> str:
         """Format text as main title."""
         if self.heading_style == "setext":
-            return f"{text}\n{'=' * len(text)}"
+            return text + "\n" + _underline("=", len(text))
         else:
-            return f"# {text}"
+            return _ATX_PREFIXES[1] + text
 
     def _format_caption(self, text: str, block: Block) -> str:
         """Format text as caption."""
@@ -209,12 +263,9 @@ class MarkdownExporter:
             text = self._wrap_text(text, self.max_line_length)
 
         # Handle emphasis from font styles
-        if block.has_bold and not block.has_italic:
-            text = f"**{text}**"
-        elif block.has_italic and not block.has_bold:
-            text = f"*{text}*"
-        elif block.has_bold and block.has_italic:
-            text = f"***{text}***"
+        marker = _EMPHASIS_MARKERS[2 * block.has_bold + block.has_italic]
+        if marker:
+            text = marker + text + marker
 
         return text
 
@@ -240,6 +291,10 @@ class MarkdownExporter:
         if not words:
             return text
 
+        # Collapsing whitespace never lengthens the text, so it fits on one line
+        if len(text) <= max_length:
+            return " ".join(words)
+
         lines = []
         current_line = []
         current_length = 0
@@ -268,6 +323,68 @@ class MarkdownExporter:
         return "\n".join(lines)
 
 
+class _BlockArrays:
+    """
+    Structure-of-arrays view of the blocks on a page that have a bbox.
+
+    Built once per page by TableDetector so its heuristics read coordinates
+    from NumPy columns instead of walking block.bbox for every comparison;
+    row groupings are lists of indices into blocks.
+
+    Attributes:
+        blocks: Blocks with a bbox, in page order
+        bboxes: Their bounding boxes
+        center_x: X coordinate of each bbox center
+        center_y: Y coordinate of each bbox center
+    """
+
+    __slots__ = ("blocks", "bboxes", "center_x", "center_y", "_y0_order", "_sorted_y0", "_max_height")
+
+    def __init__(self, blocks: Sequence[Block]) -> None:
+        self.blocks = [block for block in blocks if block.bbox]
+        coords = np.fromiter(
+            chain.from_iterable(_BBOX_COORDS(block.bbox) for block in self.blocks),
+            dtype=np.float64,
+            count=4 * len(self.blocks)
+        ).reshape(-1, 4)
+        self.bboxes = BBoxArray(*coords.T)
+        # Same arithmetic as BBox.center_x / center_y, so values match exactly
+        self.center_x = (self.bboxes.x0 + self.bboxes.x1) / 2
+        self.center_y = (self.bboxes.y0 + self.bboxes.y1) / 2
+        self._y0_order = None
+
+    def __len__(self) -> int:
+        return len(self.blocks)
+
+    def overlapping(self, bbox: BBox) -> np.ndarray:
+        """
+        Find the blocks whose bbox overlaps the given one (BBox.overlaps).
+
+        Blocks are indexed by y0 on first use; a block can only overlap if
+        its y0 lies within [bbox.y0 - tallest block height, bbox.y1], so
+        each query binary-searches that window and tests just those.
+
+        Returns:
+            Indices into blocks, in page order
+        """
+        bboxes = self.bboxes
+        if self._y0_order is None:
+            self._y0_order = np.argsort(bboxes.y0, kind="stable")
+            self._sorted_y0 = bboxes.y0[self._y0_order]
+            # Padded so float rounding can't drop a block from the window;
+            # the y1 test below is exact
+            self._max_height = float((bboxes.y1 - bboxes.y0).max()) + 1.0 if len(self.blocks) else 0.0
+
+        start = np.searchsorted(self._sorted_y0, bbox.y0 - self._max_height, side="left")
+        stop = np.searchsorted(self._sorted_y0, bbox.y1, side="right")
+        candidates = self._y0_order[start:stop]
+        mask = (
+            (bboxes.x0[candidates] <= bbox.x1) & (bboxes.x1[candidates] >= bbox.x0) &
+            (bboxes.y1[candidates] >= bbox.y0)
+        )
+        return np.sort(candidates[mask])
+
+
 class TableDetector:
     """
     Detect and format tables from spatial layout and background elements.
@@ -305,14 +422,15 @@ class TableDetector:
             List of table dictionaries with structure and content
         """
         tables = []
+        blocks = _BlockArrays(page.blocks)
 
         # Method 1: Grid-based detection using drawing elements
         if "drawings" in page.metadata:
-            grid_tables = self._detect_tables_from_drawings(page)
+            grid_tables = self._detect_tables_from_drawings(page, blocks)
             tables.extend(grid_tables)
 
         # Method 2: Alignment-based detection
-        alignment_tables = self._detect_tables_from_alignment(page)
+        alignment_tables = self._detect_tables_from_alignment(blocks)
         tables.extend(alignment_tables)
 
         # Remove duplicates and filter by quality
@@ -320,93 +438,131 @@ class TableDetector:
 
         return tables
 
-    def _detect_tables_from_drawings(self, page: Page) -> List[Dict[str, Any]]:
+    def _detect_tables_from_drawings(self, page: Page, blocks: _BlockArrays) -> List[Dict[str, Any]]:
         """Detect tables using drawing elements (lines and rectangles)."""
         drawings = page.metadata.get("drawings", [])
         if not drawings:
             return []
 
-        # Separate lines and rectangles
-        lines = [d for d in drawings if d["type"] == "line"]
-        rectangles = [d for d in drawings if d["type"] == "rectangle"]
+        # Separate horizontal lines, vertical lines and rectangles in one pass
+        horizontal_lines = []
+        vertical_lines = []
+        rect_bboxes = []
+
+        for drawing in drawings:
+            drawing_type = drawing["type"]
+            if drawing_type == "line":
+                bbox = BBox.from_dict(drawing["bbox"])
+                if bbox.is_horizontal_line():
+                    horizontal_lines.append(bbox)
+                elif bbox.is_vertical_line():
+                    vertical_lines.append(bbox)
+            elif drawing_type == "rectangle":
+                rect_bboxes.append(BBox.from_dict(drawing["bbox"]))
 
         tables = []
 
         # Look for grid patterns in lines
-        if lines:
-            grid_tables = self._analyze_line_grid(lines, page.blocks)
-            tables.extend(grid_tables)
+        grid_tables = self._analyze_line_grid(horizontal_lines, vertical_lines, blocks)
+        tables.extend(grid_tables)
 
         # Look for table cells in rectangles
-        if rectangles:
-            rect_tables = self._analyze_rectangle_cells(rectangles, page.blocks)
+        if rect_bboxes:
+            rect_tables = self._analyze_rectangle_cells(rect_bboxes, blocks)
             tables.extend(rect_tables)
 
         return tables
 
-    def _detect_tables_from_alignment(self, page: Page) -> List[Dict[str, Any]]:
+    def _detect_tables_from_alignment(self, blocks: _BlockArrays) -> List[Dict[str, Any]]:
         """Detect tables based on text alignment patterns."""
         # Group blocks by approximate Y position (rows)
-        y_groups = self._group_blocks_by_y(page.blocks)
+        y_groups = self._group_blocks_by_y(blocks)
 
         potential_tables = []
+        center_x = blocks.center_x.tolist()
 
         for y_group in y_groups:
             if len(y_group) < self.min_columns:
                 continue
 
             # Check if blocks are aligned in columns
-            if self._is_tabular_alignment(y_group):
+            if self._is_tabular_alignment([center_x[i] for i in y_group]):
                 # Found potential table row
                 potential_tables.append(y_group)
 
         # Group consecutive table rows
         if len(potential_tables) >= self.min_rows:
-            return [self._build_table_from_rows(potential_tables)]
+            return [self._build_table_from_rows(potential_tables, blocks)]
 
         return []
 
-    def _group_blocks_by_y(self, blocks: List[Block]) -> List[List[Block]]:
-        """Group blocks by Y coordinate (horizontal alignment)."""
-        if not blocks:
-            return []
-
-        # Sort blocks by Y coordinate
-        sorted_blocks = sorted(
-            [b for b in blocks if b.bbox],
-            key=lambda b: -b.bbox.center_y
-        )
+    def _group_blocks_by_y(self, blocks: _BlockArrays) -> List[List[int]]:
+        """
+        Group blocks by Y coordinate (horizontal alignment).
 
-        groups = []
-        current_group = [sorted_blocks[0]]
+        Returns:
+            Rows top to bottom, each a list of indices into blocks.blocks
+            ordered left to right
+        """
+        if not len(blocks):
+            return []
 
-        for block in sorted_blocks[1:]:
-            # Check if block is on same horizontal line
-            if current_group[0].bbox.horizontally_aligned(
-                block.bbox,
-                tolerance=self.alignment_tolerance
+        # Sort blocks by Y coordinate, top to bottom
+        order = np.argsort(-blocks.center_y, kind="stable")
+        y0 = blocks.bboxes.y0[order].tolist()
+        y1 = blocks.bboxes.y1[order].tolist()
+        neg_cy = (-blocks.center_y[order]).tolist()
+        tolerance = self.alignment_tolerance
+        count = len(neg_cy)
+
+        # A row runs while blocks stay horizontally aligned with its first
+        # block (BBox.horizontally_aligned, on plain floats)
+        starts = [0]
+        start = 0
+        while True:
+            # Centers descend, so the blocks centered within tolerance of
+            # the row's first one come right after it: binary-search the end
+            # of that run, then settle its edge with the exact test
+            end = bisect_right(neg_cy, neg_cy[start] + tolerance, start + 1)
+            while end < count and neg_cy[end] - neg_cy[start] <= tolerance:
+                end += 1
+            while end > start + 1 and neg_cy[end - 1] - neg_cy[start] > tolerance:
+                end -= 1
+
+            # Past it, blocks still join while their top or bottom edge lines up
+            while end < count and (
+                abs(y0[start] - y0[end]) <= tolerance or
+                abs(y1[start] - y1[end]) <= tolerance
             ):
-                current_group.append(block)
-            else:
-                groups.append(current_group)
-                current_group = [block]
-
-        groups.append(current_group)
-
-        # Sort blocks within each group by X coordinate
-        for group in groups:
-            group.sort(key=lambda b: b.bbox.center_x)
-
-        return groups
-
-    def _is_tabular_alignment(self, blocks: List[Block]) -> bool:
-        """Check if blocks show tabular alignment patterns."""
-        if len(blocks) < self.min_columns:
+                end += 1
+
+            if end >= count:
+                break
+            start = end
+            starts.append(end)
+
+        # Sort blocks within each row by X coordinate
+        ends = starts[1:] + [count]
+        if count < _ARRAY_THRESHOLD:
+            order = order.tolist()
+            center_x = blocks.center_x.tolist()
+            return [
+                sorted(order[start:end], key=center_x.__getitem__)
+                for start, end in zip(starts, ends)
+            ]
+
+        # All rows in one pass: lexsort by row, then X (stable, like sorted)
+        row_ids = np.repeat(np.arange(len(starts)), np.subtract(ends, starts))
+        order = order[np.lexsort((blocks.center_x[order], row_ids))].tolist()
+        return [order[start:end] for start, end in zip(starts, ends)]
+
+    def _is_tabular_alignment(self, x_positions: Sequence[float]) -> bool:
+        """Check if blocks centered at the given X positions, left to right, look tabular."""
+        if len(x_positions) < self.min_columns:
             return False
 
         # Check for consistent spacing
-        x_positions = [b.bbox.center_x for b in blocks]
-        spacings = [x_positions[i + 1] - x_positions[i] for i in range(len(x_positions) - 1)]
+        spacings = [right - left for left, right in zip(x_positions, x_positions[1:])]
 
         # Look for relatively consistent column widths
         if spacings:
@@ -419,52 +575,40 @@ class TableDetector:
 
         return False
 
-    def _analyze_line_grid(self, lines: List[Dict], blocks: List[Block]) -> List[Dict[str, Any]]:
+    def _analyze_line_grid(
+        self,
+        horizontal_lines: List[BBox],
+        vertical_lines: List[BBox],
+        blocks: _BlockArrays
+    ) -> List[Dict[str, Any]]:
         """Analyze line patterns to detect table grids."""
-        # Extract horizontal and vertical lines
-        horizontal_lines = []
-        vertical_lines = []
-
-        for line in lines:
-            bbox_dict = line["bbox"]
-            bbox = BBox.from_dict(bbox_dict)
-
-            if bbox.is_horizontal_line():
-                horizontal_lines.append(bbox)
-            elif bbox.is_vertical_line():
-                vertical_lines.append(bbox)
-
         # Find intersecting grid pattern
         if len(horizontal_lines) >= 2 and len(vertical_lines) >= 2:
             return [self._build_table_from_grid(horizontal_lines, vertical_lines, blocks)]
 
         return []
 
-    def _analyze_rectangle_cells(self, rectangles: List[Dict], blocks: List[Block]) -> List[Dict[str, Any]]:
+    def _analyze_rectangle_cells(self, rect_bboxes: List[BBox], blocks: _BlockArrays) -> List[Dict[str, Any]]:
         """Analyze rectangle patterns to detect table cells."""
-        # Convert rectangles to bboxes
-        rect_bboxes = [BBox.from_dict(r["bbox"]) for r in rectangles]
-
-        # Look for rectangular grid pattern
-        # Group rectangles by rows and columns
-        y_groups = {}
-        x_groups = {}
-
-        for rect in rect_bboxes:
-            # Group by Y position (rows)
-            y_key = round(rect.center_y / self.alignment_tolerance) * self.alignment_tolerance
-            if y_key not in y_groups:
-                y_groups[y_key] = []
-            y_groups[y_key].append(rect)
-
-            # Group by X position (columns)
-            x_key = round(rect.center_x / self.alignment_tolerance) * self.alignment_tolerance
-            if x_key not in x_groups:
-                x_groups[x_key] = []
-            x_groups[x_key].append(rect)
+        # Look for rectangular grid pattern: count the distinct row and
+        # column positions, snapped to alignment_tolerance
+        tolerance = self.alignment_tolerance
+        if len(rect_bboxes) < _ARRAY_THRESHOLD:
+            rows = {round(rect.center_y / tolerance) for rect in rect_bboxes}
+            if len(rows) < self.min_rows:
+                return []
+            columns = {round(rect.center_x / tolerance) for rect in rect_bboxes}
+            n_rows, n_columns = len(rows), len(columns)
+        else:
+            rects = BBoxArray.from_bboxes(rect_bboxes)
+            # np.round rounds half to even, like round()
+            n_rows = np.unique(np.round((rects.y0 + rects.y1) / 2 / tolerance)).size
+            if n_rows < self.min_rows:
+                return []
+            n_columns = np.unique(np.round((rects.x0 + rects.x1) / 2 / tolerance)).size
 
         # Check if we have enough rows and columns
-        if len(y_groups) >= self.min_rows and len(x_groups) >= self.min_columns:
+        if n_rows >= self.min_rows and n_columns >= self.min_columns:
             return [self._build_table_from_rectangles(rect_bboxes, blocks)]
 
         return []
@@ -473,31 +617,40 @@ class TableDetector:
         self,
         h_lines: List[BBox],
         v_lines: List[BBox],
-        blocks: List[Block]
+        blocks: _BlockArrays
     ) -> Dict[str, Any]:
         """Build table structure from grid lines."""
-        # Sort lines
-        h_lines.sort(key=lambda l: l.center_y, reverse=True)  # Top to bottom
-        v_lines.sort(key=lambda l: l.center_x)  # Left to right
+        # Cell boundaries: line centers, ascending
+        y_edges = np.sort(np.array([line.center_y for line in h_lines]))
+        x_edges = np.sort(np.array([line.center_x for line in v_lines]))
+        n_rows = len(y_edges) - 1
+        n_columns = len(x_edges) - 1
+
+        # Span of cells each block overlaps (BBox.overlaps, edges touching
+        # included), counting rows from the bottom: cell k lies between
+        # edges k and k + 1
+        bboxes = blocks.bboxes
+        first_rows = np.maximum(np.searchsorted(y_edges, bboxes.y0, side="left") - 1, 0)
+        last_rows = np.minimum(np.searchsorted(y_edges, bboxes.y1, side="right") - 1, n_rows - 1)
+        first_columns = np.maximum(np.searchsorted(x_edges, bboxes.x0, side="left") - 1, 0)
+        last_columns = np.minimum(np.searchsorted(x_edges, bboxes.x1, side="right") - 1, n_columns - 1)
+
+        # Drop each block's text into every cell it overlaps, in page order
+        cells = [[[] for _ in range(n_columns)] for _ in range(n_rows)]
+        in_grid = np.flatnonzero((first_rows <= last_rows) & (first_columns <= last_columns))
+        spans = zip(
+            in_grid.tolist(),
+            first_rows[in_grid].tolist(), last_rows[in_grid].tolist(),
+            first_columns[in_grid].tolist(), last_columns[in_grid].tolist()
+        )
+        for index, first_row, last_row, first_column, last_column in spans:
+            text = blocks.blocks[index].text
+            for row in cells[first_row:last_row + 1]:
+                for parts in row[first_column:last_column + 1]:
+                    parts.append(text)
 
-        # Create grid cells
-        rows = []
-        for i in range(len(h_lines) - 1):
-            row = []
-            for j in range(len(v_lines) - 1):
-                # Define cell boundaries
-                cell_bbox = BBox(
-                    v_lines[j].center_x,
-                    h_lines[i + 1].center_y,
-                    v_lines[j + 1].center_x,
-                    h_lines[i].center_y
-                )
-
-                # Find text blocks in this cell
-                cell_text = self._extract_text_from_bbox(cell_bbox, blocks)
-                row.append(cell_text)
-
-            rows.append(row)
+        # Rows top to bottom
+        rows = [[" ".join(parts).strip() for parts in row] for row in reversed(cells)]
 
         return {
             "type": "table",
@@ -509,11 +662,11 @@ class TableDetector:
     def _build_table_from_rectangles(
         self,
         rectangles: List[BBox],
-        blocks: List[Block]
+        blocks: _BlockArrays
     ) -> Dict[str, Any]:
         """Build table structure from rectangle cells."""
         # Sort rectangles into grid
-        rectangles.sort(key=lambda r: (-r.center_y, r.center_x))
+        rectangles[:] = [rectangles[i] for i in _reading_order(rectangles)]
 
         # Group into rows
         rows = []
@@ -553,30 +706,28 @@ class TableDetector:
             "confidence": 0.8
         }
 
-    def _build_table_from_rows(self, row_groups: List[List[Block]]) -> Dict[str, Any]:
-        """Build table from aligned text rows."""
-        # Determine column positions from all rows
-        all_x_positions = []
-        for row in row_groups:
-            for block in row:
-                all_x_positions.append(block.bbox.center_x)
+    def _build_table_from_rows(self, row_groups: List[List[int]], blocks: _BlockArrays) -> Dict[str, Any]:
+        """Build table from aligned text rows (indices into blocks.blocks)."""
+        center_x = blocks.center_x.tolist()
 
-        # Cluster X positions to find column boundaries
-        column_positions = self._cluster_positions(all_x_positions)
+        # Cluster the X positions of all rows to find column boundaries
+        column_positions, column_starts = self._cluster_positions(
+            [center_x[i] for row in row_groups for i in row]
+        )
 
         # Build table rows
         table_rows = []
-        for row_blocks in row_groups:
+        for row in row_groups:
             table_row = [""] * len(column_positions)
 
-            for block in row_blocks:
-                # Find which column this block belongs to
-                col_index = self._find_column_index(block.bbox.center_x, column_positions)
-                if 0 <= col_index < len(table_row):
-                    if table_row[col_index]:
-                        table_row[col_index] += " " + block.text
-                    else:
-                        table_row[col_index] = block.text
+            for index in row:
+                # Find which column this block was clustered into
+                col_index = self._find_column_index(center_x[index], column_starts)
+                text = blocks.blocks[index].text
+                if table_row[col_index]:
+                    table_row[col_index] += " " + text
+                else:
+                    table_row[col_index] = text
 
             table_rows.append(table_row)
 
@@ -587,70 +738,128 @@ class TableDetector:
             "confidence": 0.7
         }
 
-    def _extract_text_from_bbox(self, bbox: BBox, blocks: List[Block]) -> str:
+    def _extract_text_from_bbox(self, bbox: BBox, blocks: _BlockArrays) -> str:
         """Extract text from blocks that overlap with given bbox."""
-        text_parts = []
+        text_parts = [blocks.blocks[i].text for i in blocks.overlapping(bbox).tolist()]
 
-        for block in blocks:
-            if not block.bbox:
-                continue
+        return " ".join(text_parts).strip()
 
-            # Check if block overlaps with cell
-            if block.bbox.overlaps(bbox):
-                text_parts.append(block.text)
+    def _cluster_positions(self, positions: List[float]) -> Tuple[List[float], List[float]]:
+        """
+        Cluster similar positions to find column boundaries.
 
-        return " ".join(text_parts).strip()
+        Distinct positions are taken left to right; a gap wider than
+        alignment_tolerance starts a new cluster. Chained gaps can make a
+        cluster wider than the tolerance, so members are assigned by
+        cluster boundaries (see _find_column_index), not by distance to
+        the mean.
 
-    def _cluster_positions(self, positions: List[float]) -> List[float]:
-        """Cluster similar positions to find column boundaries."""
+        Returns:
+            Mean position of each cluster and the first position of every
+            cluster after the first, both left to right
+        """
         if not positions:
-            return []
+            return [], []
+
+        if njit is not None and len(positions) >= _ARRAY_THRESHOLD:
+            sorted_positions = np.unique(np.asarray(positions, dtype=np.float64))
+            clusters, starts = _cluster_sorted_kernel(sorted_positions, self.alignment_tolerance)
+            return clusters.tolist(), starts.tolist()
 
         sorted_positions = sorted(set(positions))
-        clusters = [sorted_positions[0]]
+        clusters = []
+        starts = []
+        total = previous = sorted_positions[0]
+        count = 1
 
         for pos in sorted_positions[1:]:
-            # If position is close to last cluster center, merge
-            if abs(pos - clusters[-1]) <= self.alignment_tolerance:
-                clusters[-1] = (clusters[-1] + pos) / 2  # Average
+            # A gap wider than the tolerance closes the current cluster
+            if pos - previous > self.alignment_tolerance:
+                clusters.append(total / count)
+                starts.append(pos)
+                total = pos
+                count = 1
             else:
-                clusters.append(pos)
+                total += pos
+                count += 1
+            previous = pos
+
+        clusters.append(total / count)
+        return clusters, starts
 
-        return clusters
+    def _find_column_index(self, x_position: float, column_starts: List[float]) -> int:
+        """
+        Find which column a position was clustered into.
+
+        Args:
+            x_position: One of the positions given to _cluster_positions
+            column_starts: Cluster boundaries returned by _cluster_positions
 
-    def _find_column_index(self, x_position: float, column_positions: List[float]) -> int:
-        """Find which column a position belongs to."""
-        for i, col_pos in enumerate(column_positions):
-            if abs(x_position - col_pos) <= self.alignment_tolerance:
-                return i
-        return -1  # Not found
+        Returns:
+            Index of the column whose positions include x_position
+        """
+        # Columns before this one are those starting at or left of it
+        return bisect_right(column_starts, x_position)
 
     def _filter_and_merge_tables(self, tables: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Filter out low-quality tables and merge overlapping ones."""
         if not tables:
             return []
 
-        # Sort by confidence
-        tables.sort(key=lambda t: t.get("confidence", 0), reverse=True)
-
-        # Filter by minimum quality
+        # Filter by minimum quality, then sort the survivors by confidence
         filtered_tables = [t for t in tables if t.get("confidence", 0) >= 0.5]
+        filtered_tables.sort(key=lambda t: t.get("confidence", 0), reverse=True)
 
         # TODO: Implement table merging for overlapping detections
 
         return filtered_tables
 
 
-def export_to_markdown(document: Document, **kwargs) -> str:
+if njit is not None:
+    @njit
+    def _cluster_sorted_kernel(sorted_positions, tolerance):
+        """
+        Cluster ascending positions, as TableDetector._cluster_positions.
+
+        Sums in the same order as the Python loop, so the cluster means
+        match it exactly. Returns the means and the start of every cluster
+        after the first, left to right.
+        """
+        clusters = np.empty_like(sorted_positions)
+        starts = np.empty_like(sorted_positions)
+        n_clusters = 0
+        total = previous = sorted_positions[0]
+        count = 1
+        for i in range(1, len(sorted_positions)):
+            pos = sorted_positions[i]
+            if pos - previous > tolerance:
+                clusters[n_clusters] = total / count
+                n_clusters += 1
+                starts[n_clusters - 1] = pos
+                total = pos
+                count = 1
+            else:
+                total += pos
+                count += 1
+            previous = pos
+        clusters[n_clusters] = total / count
+        return clusters[:n_clusters + 1], starts[:n_clusters]
+
+
+def export_to_markdown(document: Document, out: Optional[TextIO] = None, **kwargs) -> Optional[str]:
     """
     Convenience function to export document to markdown.
 
     Args:
         document: Document to export
+        out: Text stream to write the markdown to instead of returning it
         **kwargs: Additional arguments passed to MarkdownExporter
 
     Returns:
-        Markdown string
+        Markdown string, or None when written to out
     """
     exporter = MarkdownExporter(**kwargs)
+    if out is not None:
+        exporter.export_to(document, out)
+        return None
     return exporter.export(document)
\ No newline at end of file
@@ -226,7 +226,8 @@ class PDFLoader:
         """Convert PyMuPDF page to our Page structure."""
         # Get page dimensions
         page_rect = fitz_page.rect
-        page_bbox = BBox(page_rect.x0, page_rect.y0, page_rect.x1, page_rect.y1)
+        # Pages usually share a size, so share their bbox too
+        page_bbox = BBox.intern(page_rect.x0, page_rect.y0, page_rect.x1, page_rect.y1)
 
         # Extract text with detailed formatting
         text_dict = fitz_page.get_text("dict")
@@ -262,26 +263,31 @@ class PDFLoader:
         """Convert PyMuPDF text blocks to our Block structure."""
         blocks = []
 
-        for block_dict in fitz_blocks:
-            # Skip non-text blocks (images, etc.)
-            if block_dict.get("type") != 0:  # 0 = text block
-                continue
+        # Spans are stripped and split before words are created, so check
+        # them once per page instead of in every Word constructor
+        with Word.bulk_mode():
+            for block_dict in fitz_blocks:
+                # Skip non-text blocks (images, etc.)
+                if block_dict.get("type") != 0:  # 0 = text block
+                    continue
 
-            # Extract lines from block
-            lines = block_dict.get("lines", [])
-            if not lines:
-                continue
+                # Extract lines from block
+                lines = block_dict.get("lines", [])
+                if not lines:
+                    continue
+
+                # Convert lines to words
+                words = []
+                for line in lines:
+                    line_words = self._convert_line_to_words(line)
+                    words.extend(line_words)
 
-            # Convert lines to words
-            words = []
-            for line in lines:
-                line_words = self._convert_line_to_words(line)
-                words.extend(line_words)
+                if words:
+                    # Create block from words
+                    block = Block(words=words, element_type=ElementType.TEXT)
+                    blocks.append(block)
 
-            if words:
-                # Create block from words
-                block = Block(words=words, element_type=ElementType.TEXT)
-                blocks.append(block)
+        Word.validate_many([word for block in blocks for word in block.words])
 
         # Apply post-processing
         blocks = self._merge_fragmented_blocks(blocks)
@@ -359,7 +365,7 @@ class PDFLoader:
             # Convert color to hex format
             color_hex = f"#{color:06x}"
 
-        return FontInfo(
+        return FontInfo.intern(
             name=font_name,
             size=font_size,
             style=style,
@@ -7,7 +7,22 @@ that form the foundation of spatial-aware PDF parsing.
 
 import pytest
 import math
-from src.pdf2md.core.bbox import BBox, merge_bboxes, cluster_bboxes_by_position
+import sys
+import numpy as np
+from src.pdf2md.core.bbox import (
+    BBox,
+    BBoxArray,
+    BBoxIndex,
+    SpatialGrid,
+    batch_contains_point,
+    batch_intersection_area,
+    batch_iou,
+    batch_overlaps,
+    make_overlaps,
+    merge_bbox_array,
+    merge_bboxes,
+    cluster_bboxes_by_position,
+)
 
 
 class TestBBoxCreation:
@@ -42,6 +57,17 @@ class TestBBoxCreation:
         assert bbox.x1 == 25
         assert bbox.y1 == 40
 
+    def test_intern(self):
+        """Test interned bboxes are shared while referenced."""
+        page = BBox.intern(0, 0, 612, 792)
+
+        assert BBox.intern(0, 0, 612, 792) is page
+        assert BBox.intern(0, 0, 595, 842) is not page
+        assert page == BBox(0, 0, 612, 792)
+
+        with pytest.raises(ValueError):
+            BBox.intern(10, 0, 0, 10)
+
     def test_invalid_coordinates(self):
         """Test validation of invalid coordinates."""
         with pytest.raises(ValueError, match="x0.*must be.*x1"):
@@ -64,11 +90,36 @@ class TestBBoxProperties:
         assert self.bbox.height == 30
         assert self.bbox.area == 600
 
+    def test_derived_values_follow_replace(self):
+        """Test derived values are recomputed for copies and ignored by equality."""
+        moved = self.bbox.replace(x1=50)
+        assert moved.width == 40
+        assert moved.area == 1200
+        assert moved.center_x == 30
+        assert moved.replace(x1=30) == self.bbox
+        assert hash(moved.replace(x1=30)) == hash(self.bbox)
+
+    def test_immutable(self):
+        """Test bbox coordinates cannot be reassigned."""
+        with pytest.raises(AttributeError):
+            self.bbox.x0 = 0
+        with pytest.raises(AttributeError):
+            del self.bbox.y1
+
+    def test_pickle_roundtrip(self):
+        """Test bboxes survive pickling (e.g. to worker processes)."""
+        import pickle
+
+        restored = pickle.loads(pickle.dumps(self.bbox))
+        assert restored == self.bbox
+        assert restored.area == 600
+
     def test_center(self):
         """Test center point calculation."""
         assert self.bbox.center_x == 20
         assert self.bbox.center_y == 35
         assert self.bbox.center == (20, 35)
+        assert self.bbox.center is self.bbox.center  # Cached after first access
 
     def test_corners(self):
         """Test corner coordinates."""
@@ -112,6 +163,17 @@ class TestSpatialRelationships:
         assert not bbox1.overlaps(bbox2)
         assert bbox1.overlaps(bbox2, tolerance=3)
 
+    def test_make_overlaps(self):
+        """Test specialized overlap functions agree with BBox.overlaps."""
+        bbox1 = BBox(0, 0, 10, 10)
+        others = [BBox(5, 5, 15, 15), BBox(10, 10, 20, 20), BBox(12, 12, 20, 20), BBox(20, 20, 30, 30)]
+
+        for tolerance in (0.0, 3, -1.0):
+            overlaps = make_overlaps(tolerance)
+            assert [overlaps(bbox1, o) for o in others] == [bbox1.overlaps(o, tolerance) for o in others]
+
+        assert make_overlaps(2.0) is make_overlaps(2.0)
+
     def test_contains_point(self):
         """Test point containment."""
         bbox = BBox(10, 20, 30, 40)
@@ -162,6 +224,17 @@ class TestSpatialRelationships:
         assert ratio == 0.25  # 25/100
 
 
+    def test_iou(self):
+        """Test intersection over union."""
+        bbox1 = BBox(0, 0, 10, 10)  # Area = 100
+        bbox2 = BBox(5, 5, 15, 15)  # Area = 100, intersection = 25
+
+        assert bbox1.iou(bbox2) == 25 / 175
+        assert bbox1.iou(bbox1) == 1.0
+        assert bbox1.iou(BBox(20, 20, 30, 30)) == 0.0
+        assert bbox1.iou(BBox(5, 5, 5, 5)) == 0.0  # Zero-area box
+
+
 class TestDistanceCalculations:
     """Test distance calculation methods."""
 
@@ -189,6 +262,40 @@ class TestDistanceCalculations:
         assert bbox1.distance_to_bbox(bbox2) == 10.0
         assert bbox1.distance_to_bbox(bbox3) == 0.0  # Overlapping
 
+    def test_squared_distances(self):
+        """Test squared distances agree with the plain distances."""
+        bbox = BBox(0, 0, 10, 10)
+
+        assert bbox.squared_distance_to_point(5, 5) == 0.0
+        assert bbox.squared_distance_to_point(15, 15) == 50.0
+        assert bbox.squared_distance_to_bbox(BBox(13, 14, 20, 20)) == 25.0
+        assert bbox.squared_distance_to_bbox(BBox(5, 5, 15, 15)) == 0.0
+
+        other = BBox(13, 14, 20, 20)
+        assert bbox.distance_to_bbox(other) ** 2 == pytest.approx(
+            bbox.squared_distance_to_bbox(other)
+        )
+
+    def test_gaps_match_max_formula(self):
+        """Test gap computations equal the max(0, max(a, b)) formulation, including infinities."""
+        inf = float('inf')
+        edges = [-inf, -5.0, 0.0, 2.5, 10.0, inf]
+        bboxes = [BBox(x0, y0, x1, y1) for x0 in edges for x1 in edges if x0 <= x1
+                  for y0, y1 in ((0.0, 10.0), (-inf, 3.0), (12.0, inf))]
+
+        for a in bboxes[::3]:
+            for b in bboxes:
+                gap_x = max(0, max(a.x0 - b.x1, b.x0 - a.x1))
+                gap_y = max(0, max(a.y0 - b.y1, b.y0 - a.y1))
+                assert a.horizontal_distance(b) == gap_x
+                assert a.vertical_distance(b) == gap_y
+                assert a.squared_distance_to_bbox(b) == gap_x * gap_x + gap_y * gap_y
+
+            for x in edges:
+                gap_x = max(0, max(a.x0 - x, x - a.x1))
+                gap_y = max(0, max(a.y0 - 5.0, 5.0 - a.y1))
+                assert a.squared_distance_to_point(x, 5.0) == gap_x * gap_x + gap_y * gap_y
+
     def test_horizontal_vertical_distance(self):
         """Test horizontal and vertical distance calculations."""
         bbox1 = BBox(0, 0, 10, 10)
@@ -270,6 +377,14 @@ class TestTransformations:
 
         assert expanded == BBox(5, 15, 35, 45)
 
+    def test_expand_negative_margin_validates(self):
+        """Test shrinking past zero size is still rejected."""
+        bbox = BBox(10, 20, 30, 40)
+
+        assert bbox.expand(-5) == BBox(15, 25, 25, 35)
+        with pytest.raises(ValueError):
+            bbox.expand(-15)
+
     def test_expand_to_grid(self):
         """Test grid expansion."""
         bbox = BBox(12.3, 17.8, 28.6, 33.2)
@@ -343,6 +458,19 @@ class TestBBoxUtilities:
         result = merge_bboxes([bbox1, bbox2, bbox3])
         assert result == BBox(0, 0, 40, 50)
 
+    def test_merge_bboxes_large_input(self):
+        """Test merging enough bboxes to take the array path."""
+        bboxes = [BBox(i, 100 - i, i + 5, 200 + i) for i in range(100)]
+
+        assert merge_bboxes(bboxes) == BBox(0, 1, 104, 299)
+
+    def test_merge_bbox_array(self):
+        """Test merging a BBoxArray directly."""
+        array = BBoxArray.from_bboxes([BBox(0, 0, 10, 10), BBox(20, 30, 40, 50)])
+
+        assert merge_bbox_array(array) == BBox(0, 0, 40, 50)
+        assert merge_bbox_array(BBoxArray.from_bboxes([])) is None
+
     def test_cluster_bboxes_horizontal(self):
         """Test horizontal clustering (by Y position)."""
         # Create bboxes at different Y levels
@@ -376,6 +504,47 @@ class TestBBoxUtilities:
 
         assert len(clusters) == 3  # Three distinct X levels
 
+    def test_cluster_bboxes_large_input(self):
+        """Test the array-based path used for large inputs keeps order and ties."""
+        # 10 rows of 10 bboxes with up to 1pt of vertical jitter, shuffled
+        bboxes = [
+            BBox(col * 20, row * 30 + (col % 3) * 0.5, col * 20 + 10, row * 30 + 10 + (col % 3) * 0.5)
+            for col in range(10)
+            for row in range(10)
+        ]
+
+        clusters = cluster_bboxes_by_position(bboxes, "horizontal", tolerance=2)
+        assert len(clusters) == 10
+        assert all(len(cluster) == 10 for cluster in clusters)
+        # Top row first, and within a row the sort is by center_y, stable on ties
+        assert clusters[0][0].y0 == 271
+        expected_row = sorted(
+            [b for b in bboxes if 270 <= b.y0 <= 272], key=lambda b: b.center_y, reverse=True
+        )
+        assert clusters[0] == expected_row
+
+        columns = cluster_bboxes_by_position(bboxes, "vertical", tolerance=2)
+        assert len(columns) == 10
+        assert columns[0] == [b for b in bboxes if b.x0 == 0]
+
+    def test_cluster_bboxes_array_matches_loop(self, monkeypatch):
+        """Test the array-based path clusters exactly like the plain loop."""
+        from src.pdf2md.core import bbox as bbox_module
+
+        bboxes = [
+            BBox((i * 37) % 400, (i * 53) % 700, (i * 37) % 400 + 12, (i * 53) % 700 + 9)
+            for i in range(150)
+        ]
+        results = {
+            (direction, tolerance): cluster_bboxes_by_position(bboxes, direction, tolerance)
+            for direction in ("horizontal", "vertical")
+            for tolerance in (0.0, 3.0, 25.0)
+        }
+
+        monkeypatch.setattr(bbox_module, "_ARRAY_THRESHOLD", len(bboxes) + 1)
+        for (direction, tolerance), clusters in results.items():
+            assert cluster_bboxes_by_position(bboxes, direction, tolerance) == clusters
+
     def test_cluster_bboxes_empty(self):
         """Test clustering empty list."""
         clusters = cluster_bboxes_by_position([], "horizontal")
@@ -406,4 +575,230 @@ class TestBBoxConversions:
 
         # Dict roundtrip
         dict_roundtrip = BBox.from_dict(original.to_dict())
-        assert dict_roundtrip == original
\ No newline at end of file
+        assert dict_roundtrip == original
+
+
+class TestBBoxArray:
+    """Test the structure-of-arrays bbox container and batch operations."""
+
+    def setup_method(self):
+        """Set up two small sets of bboxes."""
+        self.left = [BBox(0, 0, 10, 10), BBox(5, 5, 15, 15), BBox(40, 40, 50, 60)]
+        self.right = [BBox(8, 8, 20, 20), BBox(12, 0, 14, 2), BBox(0, 0, 10, 10), BBox(0, 0, 0, 0)]
+
+    def test_roundtrip(self):
+        """Test packing and unpacking preserves coordinates."""
+        array = BBoxArray.from_bboxes(self.left)
+
+        assert len(array) == 3
+        assert array[1] == self.left[1]
+        assert array.to_bboxes() == self.left
+        assert list(array.areas) == [100, 100, 200]
+
+    def test_columns_aligned(self):
+        """Test coordinate columns start on 64-byte boundaries."""
+        for dtype in (np.float64, np.float32):
+            array = BBoxArray.from_bboxes(self.left * 7, dtype=dtype)
+            for column in (array.x0, array.y0, array.x1, array.y1):
+                assert column.ctypes.data % 64 == 0
+                assert column.flags.c_contiguous
+                assert column.dtype == dtype
+
+        # Already-aligned columns are used as-is
+        assert BBoxArray(array.x0, array.y0, array.x1, array.y1, dtype=np.float32).x0 is array.x0
+
+    def test_centers(self):
+        """Test batch centers match BBox.center."""
+        array = BBoxArray.from_bboxes(self.left)
+
+        assert array.centers().shape == (3, 2)
+        assert [tuple(row) for row in array.centers().tolist()] == [b.center for b in self.left]
+
+    def test_empty(self):
+        """Test an empty array produces empty result matrices."""
+        empty = BBoxArray.from_bboxes([])
+        array = BBoxArray.from_bboxes(self.left)
+
+        assert len(empty) == 0
+        assert batch_overlaps(empty, array).shape == (0, 3)
+        assert batch_iou(array, empty).shape == (3, 0)
+
+    def test_float32_columns(self):
+        """Test opting into float32 columns keeps results in float32."""
+        a = BBoxArray.from_bboxes(self.left, dtype=np.float32)
+        b = BBoxArray.from_bboxes(self.right, dtype=np.float32)
+
+        assert a.dtype == np.float32
+        assert batch_intersection_area(a, b).dtype == np.float32
+        assert batch_iou(a, b).dtype == np.float32
+        assert batch_overlaps(a, b).tolist() == batch_overlaps(
+            BBoxArray.from_bboxes(self.left), BBoxArray.from_bboxes(self.right)
+        ).tolist()
+
+    def test_mismatched_columns(self):
+        """Test columns of different lengths are rejected."""
+        with pytest.raises(ValueError, match="same shape"):
+            BBoxArray([0, 1], [0, 1], [1, 2], [1])
+
+    def test_expand_to_grid_matches_scalar(self):
+        """Test grid snapping agrees with BBox.expand_to_grid."""
+        bboxes = [BBox(12.3, 17.8, 28.6, 33.2), BBox(15, 0, 15, 30), BBox(0.1, 0.2, 0.3, 0.7)]
+
+        for grid_size in (5.0, 0.1, 3):
+            snapped = BBoxArray.from_bboxes(bboxes).expand_to_grid(grid_size)
+            assert snapped.to_bboxes() == [b.expand_to_grid(grid_size) for b in bboxes]
+
+    def test_batch_overlaps_matches_scalar(self):
+        """Test batch overlap matrix agrees with BBox.overlaps."""
+        a = BBoxArray.from_bboxes(self.left)
+        b = BBoxArray.from_bboxes(self.right)
+
+        for tolerance in (0.0, 3.0):
+            matrix = batch_overlaps(a, b, tolerance)
+            expected = [[l.overlaps(r, tolerance) for r in self.right] for l in self.left]
+            assert matrix.tolist() == expected
+
+    def test_batch_intersection_area_matches_scalar(self):
+        """Test batch intersection areas agree with BBox.intersection_area."""
+        a = BBoxArray.from_bboxes(self.left)
+        b = BBoxArray.from_bboxes(self.right)
+
+        matrix = batch_intersection_area(a, b)
+        expected = [[l.intersection_area(r) for r in self.right] for l in self.left]
+        assert matrix.tolist() == expected
+
+    def test_batch_intersection_area_large(self):
+        """Test large matrices (JIT kernel when numba is installed) match the scalar method."""
+        bboxes = [BBox(i % 17 * 7.5, i // 17 * 6.25, i % 17 * 7.5 + 12, i // 17 * 6.25 + 9) for i in range(100)]
+        array = BBoxArray.from_bboxes(bboxes)
+
+        matrix = batch_intersection_area(array, array)
+        assert matrix.shape == (100, 100)
+        expected = [[l.intersection_area(r) for r in bboxes] for l in bboxes]
+        assert matrix.tolist() == expected
+
+        single = batch_intersection_area(
+            BBoxArray.from_bboxes(bboxes, dtype=np.float32), BBoxArray.from_bboxes(bboxes, dtype=np.float32)
+        )
+        assert single.dtype == np.float32
+        assert np.allclose(single, matrix)
+
+    def test_batch_intersection_area_large_without_numba(self, monkeypatch):
+        """Test large matrices fall back to NumPy broadcasting when numba is missing."""
+        from src.pdf2md.core import bbox as bbox_module
+
+        bboxes = [BBox(i % 17 * 7.5, i // 17 * 6.25, i % 17 * 7.5 + 12, i // 17 * 6.25 + 9) for i in range(100)]
+        array = BBoxArray.from_bboxes(bboxes)
+        accelerated = batch_intersection_area(array, array)
+
+        monkeypatch.setattr(bbox_module, "njit", None)
+        fallback = batch_intersection_area(array, array)
+        assert fallback.tolist() == accelerated.tolist()
+        assert fallback.tolist() == [[l.intersection_area(r) for r in bboxes] for l in bboxes]
+
+    def test_batch_iou(self):
+        """Test IoU values, including zero-area unions."""
+        a = BBoxArray.from_bboxes(self.left)
+        b = BBoxArray.from_bboxes(self.right)
+
+        matrix = batch_iou(a, b)
+        assert matrix.tolist() == [[l.iou(r) for r in self.right] for l in self.left]
+        assert matrix[0, 2] == 1.0  # Identical boxes
+        assert matrix[0, 0] == pytest.approx(4 / (100 + 144 - 4))
+        assert matrix[2, 0] == 0.0  # Disjoint
+        assert matrix[0, 3] == 0.0  # Degenerate box has no area
+
+    def test_batch_contains_point(self):
+        """Test batch point containment agrees with BBox.contains_point."""
+        a = BBoxArray.from_bboxes(self.left)
+        xs = np.array([5, 10, 45, 100])
+        ys = np.array([5, 10, 50, 100])
+
+        matrix = batch_contains_point(a, xs, ys)
+        expected = [[bbox.contains_point(x, y) for x, y in zip(xs, ys)] for bbox in self.left]
+        assert matrix.tolist() == expected
+
+
+class TestSpatialGrid:
+    """Test the grid index against brute-force pairwise scans."""
+
+    def setup_method(self):
+        """Set up a page of words plus a few large and degenerate bboxes."""
+        self.bboxes = [
+            BBox(x * 37.5, y * 14.0 + (x % 3), x * 37.5 + 30, y * 14.0 + (x % 3) + 10)
+            for x in range(15)
+            for y in range(20)
+        ]
+        self.bboxes += [
+            BBox(0, 0, 600, 300),     # Spans many cells
+            BBox(100, 50, 250, 50),   # Zero height
+            BBox(-20, -20, -10, -10)  # Negative coordinates
+        ]
+        self.grid = SpatialGrid(self.bboxes, cell_size=40)
+
+    def test_invalid_cell_size(self):
+        """Test that the cell size must be positive."""
+        with pytest.raises(ValueError, match="cell_size"):
+            SpatialGrid(self.bboxes, cell_size=0)
+
+    def test_query_overlaps_matches_brute_force(self):
+        """Test overlap queries find exactly what a full scan finds."""
+        queries = [BBox(50, 50, 60, 60), BBox(-15, -15, -14, -14), BBox(700, 700, 800, 800), self.bboxes[17]]
+
+        for query in queries:
+            for tolerance in (0.0, 2.5):
+                expected = [i for i, b in enumerate(self.bboxes) if b.overlaps(query, tolerance)]
+                assert self.grid.query_overlaps(query, tolerance) == expected
+
+    def test_all_pairs_same_line_matches_brute_force(self):
+        """Test same-line pairs match comparing every pair."""
+        expected = [
+            (i, j)
+            for i in range(len(self.bboxes))
+            for j in range(i + 1, len(self.bboxes))
+            if self.bboxes[i].same_line(self.bboxes[j], 2.0)
+        ]
+
+        assert self.grid.all_pairs_same_line(2.0) == expected
+
+
+class TestBBoxIndex:
+    """Test KD-tree nearest-bbox queries against a full scan."""
+
+    def setup_method(self):
+        """Set up words of varying size plus one very wide bbox."""
+        pytest.importorskip("scipy")
+        self.bboxes = [
+            BBox(x * 41.0 + (y % 4), y * 13.5, x * 41.0 + (y % 4) + 8 + (x * y) % 30, y * 13.5 + 9)
+            for x in range(12)
+            for y in range(25)
+        ]
+        self.bboxes.append(BBox(-400, 600, 1200, 610))  # Far center, near edge
+        self.index = BBoxIndex(self.bboxes)
+
+    def brute_force(self, query, k):
+        """Reference: rank every bbox by exact distance, ties by index."""
+        ranked = sorted((b.distance_to_bbox(query), i) for i, b in enumerate(self.bboxes))
+        return [i for _, i in ranked[:k]]
+
+    def test_nearest_matches_brute_force(self):
+        """Test nearest neighbours agree with a full scan."""
+        queries = [BBox(100, 100, 105, 104), BBox(-50, -50, -40, -40), BBox(200, 612, 210, 620), self.bboxes[57]]
+
+        for query in queries:
+            for k in (1, 5, 40):
+                assert self.index.nearest(query, k) == self.brute_force(query, k)
+
+    def test_nearest_edge_cases(self):
+        """Test k larger than the index and an empty index."""
+        query = BBox(0, 0, 1, 1)
+
+        assert len(self.index.nearest(query, k=10_000)) == len(self.bboxes)
+        assert BBoxIndex([]).nearest(query) == []
+
+    def test_missing_scipy(self, monkeypatch):
+        """Test a clear error names the extra to install when scipy is missing."""
+        monkeypatch.setitem(sys.modules, "scipy.spatial", None)
+
+        with pytest.raises(ImportError, match=r"pdf2md\[spatial\]"):
+            BBoxIndex(self.bboxes)
@@ -5,7 +5,11 @@ Tests the hierarchical document model: Word -> Block -> Page -> Document
 """
 
 import pytest
+import io
 import json
+import sys
+import threading
+import numpy as np
 from src.pdf2md.core.document import (
     Word, Block, Page, Document, FontInfo, FontStyle, ElementType
 )
@@ -53,6 +57,19 @@ class TestFontInfo:
         }
         assert font.to_dict() == expected
 
+    def test_intern(self):
+        """Test interned fonts are shared per attribute combination."""
+        font = FontInfo.intern("Arial", 12.0, FontStyle.BOLD, "#000000")
+
+        assert FontInfo.intern("Arial", 12.0, FontStyle.BOLD, "#000000") is font
+        assert FontInfo.intern("Arial", 12.0, FontStyle.BOLD) is not font
+        assert font == FontInfo("Arial", 12.0, FontStyle.BOLD, "#000000")
+
+    @pytest.mark.skipif(sys.version_info < (3, 11), reason="weakref_slot needs 3.11+")
+    def test_slots(self):
+        """Test fonts carry no per-instance __dict__."""
+        assert not hasattr(FontInfo("Arial", 12.0), "__dict__")
+
 
 class TestWord:
     """Test Word class."""
@@ -78,6 +95,44 @@ class TestWord:
         with pytest.raises(ValueError, match="Confidence must be between"):
             Word("Hello", self.bbox, self.font, confidence=1.5)
 
+    def test_bulk_mode(self):
+        """Test deferred validation of words created in bulk mode."""
+        with Word.bulk_mode():
+            blank = Word("   ", self.bbox, self.font)
+            with Word.bulk_mode():
+                Word("Hello", self.bbox, self.font, confidence=1.5)
+            # Leaving a nested bulk_mode keeps the outer one active
+            Word("   ", self.bbox, self.font)
+
+        with pytest.raises(ValueError, match="text cannot be empty"):
+            Word("   ", self.bbox, self.font)
+
+        Word.validate_many([self.word])
+        with pytest.raises(ValueError, match="text cannot be empty"):
+            Word.validate_many([self.word, blank])
+
+        with Word.bulk_mode():
+            unsure = Word("Hello", self.bbox, self.font, confidence=-0.1)
+        with pytest.raises(ValueError, match="Confidence must be between"):
+            Word.validate_many([unsure])
+
+    def test_bulk_mode_is_thread_local(self):
+        """Test bulk mode in one thread does not skip validation in another."""
+        errors = []
+
+        def create_blank_word():
+            try:
+                Word("   ", self.bbox, self.font)
+            except ValueError as exc:
+                errors.append(exc)
+
+        with Word.bulk_mode():
+            worker = threading.Thread(target=create_blank_word)
+            worker.start()
+            worker.join()
+
+        assert len(errors) == 1
+
     def test_content_classification(self):
         """Test content type classification."""
         # Note: Whitespace-only words are not allowed by design validation
@@ -97,6 +152,14 @@ class TestWord:
         assert not self.word.is_punctuation
         assert not self.word.is_number
 
+    def test_number_formats(self):
+        """Test numeric forms recognized by is_number."""
+        for text in ["42", "-3.5", "1e-3", "12%", "+$1,000", ".5", "1_000"]:
+            assert Word(text, self.bbox, self.font).is_number, text
+
+        for text in ["1.2.3", "12a", "$", "%", "e5", "1__0", "--1"]:
+            assert not Word(text, self.bbox, self.font).is_number, text
+
     def test_to_dict(self):
         """Test conversion to dictionary."""
         result = self.word.to_dict()
@@ -106,6 +169,11 @@ class TestWord:
         assert result["confidence"] == 1.0
         assert result["element_type"] == "text"
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="slotted dataclasses need 3.10+")
+    def test_slots(self):
+        """Test words carry no per-instance __dict__."""
+        assert not hasattr(self.word, "__dict__")
+
 
 class TestBlock:
     """Test Block class."""
@@ -135,6 +203,14 @@ class TestBlock:
         bbox = self.block.bbox
         assert bbox == BBox(10, 20, 65, 32)
 
+    def test_bbox_property_long_block(self):
+        """Test bbox of a block long enough for the vectorized reduction."""
+        words = [
+            Word(f"w{i}", BBox(10 + i, 20 - i % 3, 15 + i, 32 + i % 5), self.font)
+            for i in range(100)
+        ]
+        assert Block(words).bbox == BBox(10, 18, 114, 36)
+
     def test_empty_block_bbox(self):
         """Test bbox for empty block."""
         empty_block = Block([])
@@ -173,6 +249,19 @@ class TestBlock:
         assert mixed_block.has_bold
         assert not mixed_block.has_italic
 
+    def test_dominant_font_ties(self):
+        """Test dominant font picks the earliest font on equal counts."""
+        italic_font = FontInfo("Times", 10.0, FontStyle.ITALIC)
+        block = Block([
+            Word("a", BBox(0, 0, 10, 12), italic_font),
+            Word("b", BBox(15, 0, 25, 12), self.font),
+        ])
+
+        assert block.dominant_font is italic_font
+        assert block.avg_font_size == 11.0
+        assert block.has_italic
+        assert not block.has_bold
+
     def test_style_detection(self):
         """Test style detection methods."""
         assert not self.block.has_bold
@@ -184,6 +273,17 @@ class TestBlock:
         caps_block = Block(caps_words)
         assert caps_block.is_all_caps
 
+    def test_all_caps_edge_cases(self):
+        """Test all-caps detection needs a cased letter and no lowercase."""
+        def block_of(*texts):
+            return Block([Word(text, BBox(0, 0, 20, 12), self.font) for text in texts])
+
+        assert block_of("NOTE:", "2024").is_all_caps
+        assert block_of("ÉTÉ").is_all_caps
+        assert not block_of("2024", "-").is_all_caps
+        assert not block_of("TITLe").is_all_caps
+        assert Block().is_all_caps is False
+
     def test_word_count(self):
         """Test word counting."""
         assert self.block.word_count == 3
@@ -196,6 +296,52 @@ class TestBlock:
         assert len(self.block.words) == 4
         assert self.block.text == "Hello world ! test"
 
+    def test_add_word_resets_cached_properties(self):
+        """Test memoized properties reflect words added after first access."""
+        assert self.block.word_count == 3
+        assert self.block.bbox == BBox(10, 20, 65, 32)
+        assert self.block.bbox is self.block.bbox
+
+        bold = FontInfo("Arial", 12.0, FontStyle.BOLD)
+        self.block.add_word(Word("test", BBox(70, 20, 90, 32), bold))
+
+        assert self.block.word_count == 4
+        assert self.block.bbox == BBox(10, 20, 90, 32)
+        assert self.block.has_bold
+        assert len(self.block.font_info) == 2
+
+    def test_direct_word_list_changes_reset_cached_properties(self):
+        """Test memoized properties follow appends, reassignment and sorting of words."""
+        assert self.block.text == "Hello world !"
+
+        self.block.words.append(Word("test", BBox(70, 20, 90, 32), self.font))
+        assert self.block.text == "Hello world ! test"
+        assert self.block.bbox == BBox(10, 20, 90, 32)
+
+        self.block.words.sort(key=lambda word: word.text)
+        assert self.block.text == "! Hello test world"
+
+        bold = FontInfo("Arial", 12.0, FontStyle.BOLD)
+        self.block.words = [Word("Bold", BBox(0, 0, 20, 12), bold)]
+        assert self.block.text == "Bold"
+        assert self.block.bbox == BBox(0, 0, 20, 12)
+        assert self.block.dominant_font == bold
+        assert self.block.has_bold
+
+        self.block.words += [Word("more", BBox(25, 0, 45, 12), self.font)]
+        assert self.block.text == "Bold more"
+        assert len(self.block.font_info) == 2
+
+    def test_words_are_copied_on_assignment(self):
+        """Test a block does not share its word list with the caller."""
+        words = [Word("Hello", BBox(0, 0, 20, 12), self.font)]
+        block = Block(words)
+        assert block.text == "Hello"
+
+        words.append(Word("world", BBox(25, 0, 45, 12), self.font))
+        assert block.text == "Hello"
+        assert block.words == words[:1]
+
     def test_merge_blocks(self):
         """Test merging blocks."""
         other_words = [Word("merged", BBox(100, 20, 140, 32), self.font)]
@@ -317,6 +463,22 @@ class TestPage:
         assert len(overlapping) == 1
         assert overlapping[0] == self.block1
 
+    def test_get_blocks_in_bbox_large_page(self):
+        """Test vectorized spatial block filtering on a page with many blocks."""
+        font = FontInfo("Arial", 12.0, FontStyle.NORMAL)
+        blocks = [
+            Block([Word(f"b{i}", BBox(i * 10, 0, i * 10 + 10, 12), font)])
+            for i in range(100)
+        ]
+        page = Page(0, blocks + [Block([])])
+
+        # Half of b10, all of b11..b13, half of b14
+        found = page.get_blocks_in_bbox(BBox(105, 0, 145, 12), overlap_threshold=0.5)
+        assert [block.text for block in found] == ["b10", "b11", "b12", "b13", "b14"]
+
+        found = page.get_blocks_in_bbox(BBox(105, 0, 145, 12), overlap_threshold=0.6)
+        assert [block.text for block in found] == ["b11", "b12", "b13"]
+
     def test_sort_reading_order(self):
         """Test reading order sorting."""
         # Create blocks in mixed order
@@ -339,6 +501,20 @@ class TestPage:
         assert page.blocks[1] == top_right_block
         assert page.blocks[2] == bottom_block
 
+    def test_sort_reading_order_large_page(self):
+        """Test array-based reading order on a page with many blocks."""
+        font = FontInfo("Arial", 12.0, FontStyle.NORMAL)
+        blocks = [
+            Block([Word(f"r{row}c{col}", BBox(col * 50, row * 20, col * 50 + 40, row * 20 + 12), font)])
+            for col in range(4)
+            for row in range(25)
+        ]
+        page = Page(0, blocks)
+        page.sort_blocks_reading_order()
+
+        expected = [f"r{row}c{col}" for row in reversed(range(25)) for col in range(4)]
+        assert [block.text for block in page.blocks] == expected
+
     def test_detect_columns(self):
         """Test column detection."""
         font = FontInfo("Arial", 12.0, FontStyle.NORMAL)
@@ -364,12 +540,54 @@ class TestPage:
         assert len(columns[0]) == 2
         assert len(columns[1]) == 2
 
+    def test_detect_columns_chains_within_tolerance(self):
+        """Test blocks chain into one column through close neighbours."""
+        font = FontInfo("Arial", 12.0, FontStyle.NORMAL)
+
+        # Centers at 20, 35, 50: each within 15 of the previous one
+        blocks = [
+            Block([Word("Low", BBox(45, 10, 55, 22), font)]),
+            Block([Word("Mid", BBox(30, 30, 40, 42), font)]),
+            Block([Word("High", BBox(15, 50, 25, 62), font)]),
+            Block([Word("Far", BBox(200, 50, 210, 62), font)])
+        ]
+        page = Page(0, blocks)
+
+        columns = page.detect_columns(tolerance=15)
+
+        assert [[b.text for b in column] for column in columns] == [
+            ["High", "Mid", "Low"],
+            ["Far"]
+        ]
+
+    def test_iter_words(self):
+        """Test lazy iteration over page words."""
+        words = self.page.iter_words()
+
+        assert not isinstance(words, list)
+        assert list(words) == self.page.all_words
+        assert [w.text for w in self.page.all_words] == ["First", "block", "Second", "block"]
+
     def test_unique_fonts(self):
         """Test unique font detection."""
         # Both blocks use same font
         fonts = self.page.unique_fonts
         assert len(fonts) == 1
 
+    def test_unique_fonts_across_blocks(self):
+        """Test page fonts keep first-seen order and the last FontInfo per key."""
+        first_red = FontInfo("Arial", 12.0, FontStyle.NORMAL, "#ff0000")
+        bold = FontInfo("Arial", 12.0, FontStyle.BOLD)
+        last_blue = FontInfo("Arial", 12.0, FontStyle.NORMAL, "#0000ff")
+        page = Page(0, [
+            Block([Word("a", BBox(0, 0, 10, 12), first_red), Word("b", BBox(0, 0, 10, 12), bold)]),
+            Block([Word("c", BBox(0, 0, 10, 12), last_blue)])
+        ])
+
+        fonts = page.unique_fonts
+        assert [font.style for font in fonts] == [FontStyle.NORMAL, FontStyle.BOLD]
+        assert fonts[0] is last_blue
+
     def test_to_dict(self):
         """Test conversion to dictionary."""
         result = self.page.to_dict()
@@ -380,6 +598,23 @@ class TestPage:
         assert result["analysis"]["word_count"] == 4
         assert result["analysis"]["block_count"] == 2
 
+    def test_word_arrays(self):
+        """Test structure-of-arrays view of page words."""
+        arrays = self.page.word_arrays()
+
+        assert len(arrays) == 4
+        assert arrays.bboxes.to_bboxes() == [w.bbox for w in self.page.all_words]
+        np.testing.assert_array_equal(arrays.font_sizes, [12.0] * 4)
+
+        second = arrays.block_slice(1)
+        np.testing.assert_array_equal(arrays.bboxes.x0[second], [10, 45])
+
+    def test_word_arrays_empty(self):
+        """Test word arrays for a page without blocks."""
+        arrays = Page(0).word_arrays()
+        assert len(arrays) == 0
+        assert list(arrays.block_offsets) == [0]
+
 
 class TestDocument:
     """Test Document class."""
@@ -416,6 +651,44 @@ class TestDocument:
         self.document.add_page(new_page)
         assert self.document.page_count == 3
 
+    def test_cached_aggregates(self):
+        """Test document aggregates are reset by add_page, add_word and clear_cache."""
+        bold = FontInfo("Arial", 14.0, FontStyle.BOLD)
+        assert self.document.total_word_count == 2
+        assert len(self.document.all_unique_fonts) == 1
+
+        self.document.add_page(Page(2, [Block([Word("Bold", BBox(0, 0, 30, 14), bold)])]))
+        assert self.document.total_word_count == 3
+        assert self.document.total_block_count == 3
+        assert len(self.document.all_unique_fonts) == 2
+
+        self.page1.blocks[0].add_word(Word("more", BBox(35, 0, 60, 12), bold))
+        assert self.document.total_word_count == 4
+
+        self.document.clear_cache()
+        assert self.document.total_word_count == 4
+        assert len(self.document.all_unique_fonts) == 2
+
+    def test_cached_aggregates_follow_page_changes(self):
+        """Test aggregates follow blocks and pages added after the document."""
+        font = FontInfo("Arial", 12.0)
+        bold = FontInfo("Arial", 14.0, FontStyle.BOLD)
+        assert self.document.total_word_count == 2
+        assert self.document.total_block_count == 2
+
+        self.page2.add_block(Block([Word("Bold", BBox(0, 40, 30, 54), bold)]))
+        assert self.document.total_word_count == 3
+        assert self.document.total_block_count == 3
+        assert len(self.document.all_unique_fonts) == 2
+
+        self.page1.blocks = []
+        assert self.document.total_word_count == 2
+        assert self.document.total_block_count == 2
+
+        self.document.pages.append(Page(2, [Block([Word("Extra", BBox(0, 0, 30, 12), font)])]))
+        assert self.document.total_word_count == 3
+        assert self.document.total_block_count == 3
+
     def test_get_page(self):
         """Test page retrieval."""
         assert self.document.get_page(0) == self.page1
@@ -489,6 +762,54 @@ class TestDocument:
         parsed = json.loads(json_str)
         assert len(parsed["pages"]) == 2
 
+    def test_dump_json_matches_json_dumps(self):
+        """Test streamed JSON is identical to encoding the full dict."""
+        self.document.metadata["title"] = "Line one\nline two"
+
+        for indent in (2, 0, None):
+            expected = json.dumps(self.document.to_dict(), indent=indent)
+            buffer = io.StringIO()
+            self.document.dump_json(buffer, indent=indent)
+
+            assert buffer.getvalue() == expected
+            assert self.document.to_json(indent=indent) == expected
+
+        assert Document().to_json() == json.dumps(Document().to_dict(), indent=2)
+
+    def test_to_json_bytes(self):
+        """Test UTF-8 JSON output matches the text output."""
+        self.document.metadata["title"] = "Résumé"
+
+        for indent in (2, None):
+            data = self.document.to_json_bytes(indent=indent)
+
+            assert isinstance(data, bytes)
+            assert json.loads(data) == json.loads(self.document.to_json(indent=indent))
+            assert json.loads(data)["metadata"]["title"] == "Résumé"
+
+    def test_json_without_orjson(self, monkeypatch):
+        """Test JSON export falls back to the json module when orjson is missing."""
+        from src.pdf2md.core import document as document_module
+
+        monkeypatch.setattr(document_module, "orjson", None)
+        self.document.metadata["title"] = "Résumé"
+
+        expected = json.dumps(self.document.to_dict(), indent=2)
+        assert self.document.to_json() == expected
+        assert self.document.to_json_bytes() == expected.encode("utf-8")
+        assert "R\\u00e9sum\\u00e9" in expected
+
+    def test_json_with_orjson(self):
+        """Test orjson output decodes to the same document as the json module."""
+        pytest.importorskip("orjson")
+        self.document.metadata["title"] = "Résumé"
+        expected = json.loads(json.dumps(self.document.to_dict()))
+
+        text = self.document.to_json()
+        assert json.loads(text) == expected
+        assert '"title": "Résumé"' in text
+        assert json.loads(self.document.to_json_bytes()) == expected
+
 
 class TestElementTypeEnum:
     """Test ElementType enumeration."""
@@ -505,4 +826,13 @@ class TestElementTypeEnum:
         word = Word("Test", BBox(0, 0, 20, 12), font, element_type=ElementType.HEADER)
 
         assert word.element_type == ElementType.HEADER
-        assert word.to_dict()["element_type"] == "header"
\ No newline at end of file
+        assert word.to_dict()["element_type"] == "header"
+
+    def test_enum_hashing(self):
+        """Test enum members work as dict keys and survive pickling."""
+        import pickle
+
+        lookup = {member: member.value for member in ElementType}
+        assert lookup[ElementType.CAPTION] == "caption"
+        assert pickle.loads(pickle.dumps(FontStyle.BOLD)) is FontStyle.BOLD
+        assert {FontStyle.BOLD, FontStyle("bold")} == {FontStyle.BOLD}
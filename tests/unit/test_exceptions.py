@@ -0,0 +1,65 @@
+"""
+Unit tests for the PDF2MD exception types.
+
+Tests that context passed to each exception is kept as attributes and
+reported in its message.
+"""
+
+import pytest
+from src.pdf2md.core.exceptions import (
+    PDF2MDError,
+    QualityError,
+    SpatialAnalysisError,
+    PDFLoadError,
+    MarkdownGenerationError,
+    TableDetectionError,
+    ColumnDetectionError,
+)
+
+
+class TestExceptionMessages:
+    """Test exception messages include the given context."""
+
+    def test_context_appended_to_message(self):
+        """Test context values are appended in argument order."""
+        exc = SpatialAnalysisError("Layout failed", page_number=3, bbox_count=0)
+        assert str(exc) == "Layout failed (page_number=3, bbox_count=0)"
+        assert exc.page_number == 3
+        assert exc.bbox_count == 0
+
+        assert str(PDFLoadError("PDF file not found", pdf_path="missing.pdf")) == (
+            "PDF file not found (pdf_path=missing.pdf)"
+        )
+        assert str(MarkdownGenerationError("Render failed", element_count=7)) == (
+            "Render failed (element_count=7)"
+        )
+
+    def test_missing_context_leaves_message_unchanged(self):
+        """Test values left as None are not reported."""
+        assert str(SpatialAnalysisError("Layout failed")) == "Layout failed"
+        assert str(TableDetectionError("No grid", drawing_count=None)) == "No grid"
+
+    def test_error_details_not_in_message(self):
+        """Test PDFLoadError keeps error_details out of the message."""
+        exc = PDFLoadError("Cannot open", pdf_path="a.pdf", error_details="bad xref")
+        assert str(exc) == "Cannot open (pdf_path=a.pdf)"
+        assert exc.error_details == "bad xref"
+
+    def test_column_detection_error(self):
+        """Test ColumnDetectionError reports its column count once."""
+        exc = ColumnDetectionError("Ambiguous columns", detected_columns=2, x_positions=[10.0, 300.0])
+        assert str(exc) == "Ambiguous columns (detected_columns=2)"
+        assert isinstance(exc, SpatialAnalysisError)
+        assert exc.x_positions == (10.0, 300.0)
+
+    def test_sequences_stored_as_tuples(self):
+        """Test issues and x_positions are always tuples, empty by default."""
+        assert QualityError("Too noisy").issues == ()
+        assert QualityError("Too noisy", issues=[]).issues == ()
+        assert QualityError("Too noisy", issues=["low contrast"]).issues == ("low contrast",)
+        assert ColumnDetectionError("Ambiguous columns").x_positions == ()
+
+    def test_base_class(self):
+        """Test every library error derives from PDF2MDError."""
+        with pytest.raises(PDF2MDError, match=r"pdf_path=x\.pdf"):
+            raise PDFLoadError("PDF file not found", pdf_path="x.pdf")
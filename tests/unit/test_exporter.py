@@ -0,0 +1,192 @@
+"""
+Unit tests for table detection in the markdown exporter.
+
+Tests TableDetector on small hand-built pages: alignment rows and
+columns, grid cells, and the per-page arrays of block coordinates.
+"""
+
+import random
+
+from src.pdf2md.io import exporter as exporter_module
+from src.pdf2md.io.exporter import TableDetector, _BlockArrays
+from src.pdf2md.core.document import Word, Block, Page, FontInfo, FontStyle
+from src.pdf2md.core.bbox import BBox
+
+
+FONT = FontInfo("Arial", 10.0, FontStyle.NORMAL)
+
+
+def make_block(text, x0, y0, x1, y1):
+    """Block holding a single word with the given bbox."""
+    return Block([Word(text, BBox(x0, y0, x1, y1), FONT)])
+
+
+def line(x0, y0, x1, y1):
+    """Drawing entry for a line, as stored in page metadata."""
+    return {"type": "line", "bbox": {"x0": x0, "y0": y0, "x1": x1, "y1": y1}}
+
+
+class TestBlockArrays:
+    """Test the structure-of-arrays view of a page's blocks."""
+
+    def test_skips_blocks_without_bbox(self):
+        """Test blocks without words are left out and centers are computed."""
+        blocks = [make_block("a", 0, 0, 10, 20), Block([]), make_block("b", 30, 40, 50, 60)]
+        arrays = _BlockArrays(blocks)
+
+        assert len(arrays) == 2
+        assert [block.text for block in arrays.blocks] == ["a", "b"]
+        assert arrays.center_x.tolist() == [5.0, 40.0]
+        assert arrays.center_y.tolist() == [10.0, 50.0]
+
+    def test_overlapping_matches_bbox_overlaps(self):
+        """Test overlap queries include touching edges and keep page order."""
+        rng = random.Random(7)
+        blocks = []
+        for i in range(80):
+            x0, y0 = rng.randint(0, 100), rng.randint(0, 100)
+            blocks.append(make_block(f"w{i}", x0, y0, x0 + rng.randint(0, 30), y0 + rng.randint(0, 30)))
+        arrays = _BlockArrays(blocks)
+
+        for _ in range(50):
+            x0, y0 = rng.randint(0, 100), rng.randint(0, 100)
+            cell = BBox(x0, y0, x0 + rng.randint(0, 40), y0 + rng.randint(0, 40))
+            expected = [i for i, block in enumerate(blocks) if block.bbox.overlaps(cell)]
+            assert arrays.overlapping(cell).tolist() == expected
+
+    def test_overlapping_empty_page(self):
+        """Test queries on a page without blocks find nothing."""
+        assert _BlockArrays([]).overlapping(BBox(0, 0, 10, 10)).tolist() == []
+
+
+class TestAlignmentTables:
+    """Test tables detected from aligned text rows."""
+
+    def test_rows_grouped_top_to_bottom(self):
+        """Test rows run top to bottom and left to right, keeping top-aligned cells."""
+        blocks = [
+            make_block("b2", 200, 680, 210, 690),
+            make_block("a1", 100, 700, 110, 710),
+            # Two lines tall, aligned with its row at the top only
+            make_block("c1", 300, 680, 310, 710),
+            make_block("b1", 200, 700, 210, 710),
+            make_block("a2", 100, 680, 110, 690),
+        ]
+        rows = TableDetector()._group_blocks_by_y(_BlockArrays(blocks))
+
+        assert [[blocks[i].text for i in row] for row in rows] == [["a1", "b1", "c1"], ["a2", "b2"]]
+
+    def test_separate_columns(self):
+        """Test well separated X positions become one column each."""
+        blocks = [
+            make_block(f"{column}{row}", x, y, x + 10, y + 10)
+            for row, y in enumerate((700, 680, 660))
+            for column, x in zip("abc", (100, 200, 300))
+        ]
+        tables = TableDetector().detect_tables_in_page(Page(0, blocks))
+
+        assert len(tables) == 1
+        assert tables[0]["source"] == "alignment"
+        assert tables[0]["rows"] == [["a0", "b0", "c0"], ["a1", "b1", "c1"], ["a2", "b2", "c2"]]
+
+    def test_chained_positions_keep_every_cell(self):
+        """Test a cluster wider than the tolerance keeps all of its blocks."""
+        blocks = [
+            make_block(f"{column}{row}", x - 2, y, x + 2, y + 10)
+            for row, y in enumerate((700, 680))
+            for column, x in zip("abcd", (100, 105, 110, 115))
+        ]
+        tables = TableDetector(alignment_tolerance=5.0).detect_tables_in_page(Page(0, blocks))
+
+        assert tables[0]["rows"] == [["a0 b0 c0 d0"], ["a1 b1 c1 d1"]]
+
+    def test_cluster_positions_chained(self):
+        """Test gaps within tolerance chain into one cluster with a true mean."""
+        detector = TableDetector(alignment_tolerance=5.0)
+
+        assert detector._cluster_positions([]) == ([], [])
+        assert detector._cluster_positions([115, 100, 110, 105, 105]) == ([107.5], [])
+        assert detector._cluster_positions([100, 104, 120, 200]) == ([102.0, 120.0, 200.0], [120, 200])
+
+    def test_find_column_index_uses_cluster_boundaries(self):
+        """Test every clustered position maps to its own cluster, however far from the mean."""
+        detector = TableDetector(alignment_tolerance=5.0)
+        positions = [100, 105, 110, 115, 130, 200]
+        column_positions, column_starts = detector._cluster_positions(positions)
+
+        assert column_positions == [107.5, 130.0, 200.0]
+        assert [detector._find_column_index(x, column_starts) for x in positions] == [0, 0, 0, 0, 1, 2]
+
+    def test_cluster_positions_without_numba(self, monkeypatch):
+        """Test large inputs cluster the same with and without the JIT kernel."""
+        rng = random.Random(3)
+        positions = [rng.choice((50, 120.5, 300)) + rng.uniform(-8, 8) for _ in range(200)]
+        detector = TableDetector(alignment_tolerance=2.0)
+        accelerated = detector._cluster_positions(positions)
+
+        monkeypatch.setattr(exporter_module, "njit", None)
+        assert detector._cluster_positions(positions) == accelerated
+
+
+class TestGridTables:
+    """Test tables detected from ruled grid lines."""
+
+    def grid_page(self, blocks):
+        """Page with a 2x2 grid whose inner lines are drawn twice."""
+        drawings = [
+            line(0, 159, 100, 161), line(0, 129, 100, 131), line(0, 129, 100, 131), line(0, 99, 100, 101),
+            line(-1, 100, 1, 160), line(49, 100, 51, 160), line(49, 100, 51, 160), line(99, 100, 101, 160),
+        ]
+        return Page(0, blocks, metadata={"drawings": drawings})
+
+    def grid_rows(self, page):
+        """Rows of the table built from grid lines."""
+        tables = TableDetector().detect_tables_in_page(page)
+        return next(table["rows"] for table in tables if table["source"] == "grid_lines")
+
+    def test_blocks_fill_their_cells(self):
+        """Test cells come out top to bottom, left to right, with empty zero-size cells."""
+        blocks = [
+            make_block("tl", 10, 140, 20, 150),
+            make_block("tr", 60, 140, 70, 150),
+            make_block("bl", 10, 110, 20, 120),
+        ]
+        rows = self.grid_rows(self.grid_page(blocks))
+
+        # Duplicate lines add a zero-height row and a zero-width column
+        assert rows == [
+            ["tl", "", "tr"],
+            ["", "", ""],
+            ["bl", "", ""],
+        ]
+
+    def test_touching_blocks_join_every_cell(self):
+        """Test a block on a grid line lands in the cells on both sides of it."""
+        blocks = [make_block("edge", 10, 125, 20, 130), make_block("wide", 40, 105, 60, 115)]
+        rows = self.grid_rows(self.grid_page(blocks))
+
+        assert rows == [
+            ["edge", "", ""],
+            ["edge", "", ""],
+            ["edge wide", "wide", "wide"],
+        ]
+
+    def test_matches_cell_overlap(self):
+        """Test cell text matches testing each cell against every block."""
+        rng = random.Random(11)
+        blocks = []
+        for i in range(40):
+            x0, y0 = rng.randint(-10, 100), rng.randint(90, 160)
+            blocks.append(make_block(f"w{i}", x0, y0, x0 + rng.randint(0, 40), y0 + rng.randint(0, 20)))
+
+        y_edges = [160, 130, 130, 100]
+        x_edges = [0, 50, 50, 100]
+        expected = []
+        for top, bottom in zip(y_edges, y_edges[1:]):
+            row = []
+            for left, right in zip(x_edges, x_edges[1:]):
+                cell = BBox(left, bottom, right, top)
+                row.append(" ".join(block.text for block in blocks if block.bbox.overlaps(cell)))
+            expected.append(row)
+
+        assert self.grid_rows(self.grid_page(blocks)) == expected